@@ -0,0 +1,17 @@
+"""Benchmarks for the SBDF writer (not included in the PyPI package).
+
+Run ``python -m sbdf_benchmarks --help`` (with ``src`` on ``sys.path``) for
+options. Results are a single JSON document so runs against different
+package versions can be diffed or plotted.
+"""
+
+from .datasets import DATASETS, DatasetSpec, generate
+from .runner import BENCHMARKS, run_suite
+
+__all__ = [
+    "BENCHMARKS",
+    "DATASETS",
+    "DatasetSpec",
+    "generate",
+    "run_suite",
+]
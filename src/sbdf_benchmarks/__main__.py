@@ -0,0 +1,61 @@
+"""Command-line entry point: ``python -m sbdf_benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from sbdf_benchmarks.datasets import DATASETS
+from sbdf_benchmarks.runner import BENCHMARKS, run_suite
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m sbdf_benchmarks",
+        description="Benchmark SBDF encoding and write the results as JSON.",
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Run only this benchmark (repeatable).",
+    )
+    parser.add_argument(
+        "--dataset",
+        action="append",
+        choices=[spec.name for spec in DATASETS],
+        help="Run only this dataset (repeatable).",
+    )
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run every case in this process (peak RSS is then cumulative).",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Write JSON here instead of to standard output."
+    )
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        args.rows,
+        args.repeat,
+        benchmarks=args.benchmark,
+        datasets=args.dataset,
+        seed=args.seed,
+        isolate=not args.no_isolate,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
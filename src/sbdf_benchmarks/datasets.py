@@ -0,0 +1,203 @@
+"""Deterministic synthetic tables for the SBDF benchmarks.
+
+A table has one column per requested value type: every type in
+:data:`COLUMN_TYPES` by default, or the :data:`INFERRED_TYPES` for the
+benchmarks that start from text. A dataset is fully described by its
+:class:`DatasetSpec` and a seed, so two runs (or two package versions) always
+encode exactly the same rows, and a column's values do not depend on which
+other columns are generated.
+"""
+
+from __future__ import annotations
+
+import base64
+import csv
+import io
+import random
+import struct
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from spotfire_community.sbdf import ValueType
+
+COLUMN_TYPES = list(ValueType)
+
+# The types that type inference recovers from the text form of the values:
+# Float and Decimal text reads back as Double, and Base64 Binary as String.
+INFERRED_TYPES = [
+    ValueType.BOOL,
+    ValueType.INT,
+    ValueType.LONG,
+    ValueType.DOUBLE,
+    ValueType.DATETIME,
+    ValueType.DATE,
+    ValueType.TIME,
+    ValueType.TIMESPAN,
+    ValueType.STRING,
+]
+
+_BASE_DATETIME = datetime(2000, 1, 1)
+_BASE_DATE = date(2000, 1, 1)
+_CATEGORIES = [f"category-{i:02d}" for i in range(16)]
+_FLOAT32 = struct.Struct("<f")
+_MS_PER_DAY = 86_400_000
+
+
+class DatasetSpec(NamedTuple):
+    """Shape of a synthetic table.
+
+    Attributes:
+        name: Identifier used in the results.
+        null_ratio: Probability that any cell is null.
+        strings: String-length distribution: ``"short"`` (1-8 chars),
+            ``"uniform"`` (0-64), ``"longtail"`` (mostly short, rarely up to
+            4 KiB) or ``"runs"`` (16 categories repeated in runs of 1-64,
+            which favours run-length encoding).
+    """
+
+    name: str
+    null_ratio: float
+    strings: str
+
+
+DATASETS = [
+    DatasetSpec("mixed-dense", 0.0, "short"),
+    DatasetSpec("mixed-sparse", 0.1, "uniform"),
+    DatasetSpec("mixed-nulls", 0.5, "uniform"),
+    DatasetSpec("strings-longtail", 0.05, "longtail"),
+    DatasetSpec("runs", 0.0, "runs"),
+]
+
+
+class Table(NamedTuple):
+    """A generated table in both shapes the writer accepts."""
+
+    headers: list[str]
+    types: list[ValueType]
+    columns: list[list[Any]]
+    """Column-major native values (``None`` for nulls)."""
+    rows: list[list[str]]
+    """Row-major stringified values (``""`` for nulls)."""
+
+
+def _string_generator(kind: str, rng: random.Random) -> Callable[[], str]:
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "
+
+    def text(n: int) -> str:
+        return "".join(rng.choices(alphabet, k=n))
+
+    if kind == "short":
+        return lambda: text(rng.randint(1, 8))
+    if kind == "uniform":
+        return lambda: text(rng.randint(0, 64))
+    if kind == "longtail":
+        return lambda: text(min(int(rng.paretovariate(1.2) * 4), 4096))
+    if kind == "runs":
+        value, left = "", 0
+
+        def run() -> str:
+            nonlocal value, left
+            if left == 0:
+                value, left = rng.choice(_CATEGORIES), rng.randint(1, 64)
+            left -= 1
+            return value
+
+        return run
+    raise ValueError(f"Unknown string distribution {kind!r}")
+
+
+def _value_generator(
+    vtype: ValueType, spec: DatasetSpec, rng: random.Random
+) -> Callable[[], Any]:
+    if vtype == ValueType.BOOL:
+        return lambda: rng.random() < 0.5
+    if vtype == ValueType.INT:
+        return lambda: rng.randint(-(2**31), 2**31 - 1)
+    if vtype == ValueType.LONG:
+        return lambda: rng.randint(-(2**62), 2**62)
+    if vtype == ValueType.FLOAT:
+        return lambda: _FLOAT32.unpack(_FLOAT32.pack(rng.uniform(-1e6, 1e6)))[0]
+    if vtype == ValueType.DOUBLE:
+        return lambda: rng.uniform(-1e6, 1e6)
+    if vtype == ValueType.DATETIME:
+        span_ms = 20 * 365 * 86_400_000
+        return lambda: _BASE_DATETIME + timedelta(milliseconds=rng.randrange(span_ms))
+    if vtype == ValueType.DATE:
+        return lambda: _BASE_DATE + timedelta(days=rng.randrange(20 * 365))
+    if vtype == ValueType.TIME:
+        return lambda: (
+            datetime.min + timedelta(milliseconds=rng.randrange(_MS_PER_DAY))
+        ).time()
+    if vtype == ValueType.TIMESPAN:
+        return lambda: timedelta(
+            milliseconds=rng.randrange(-30 * _MS_PER_DAY, 30 * _MS_PER_DAY)
+        )
+    if vtype == ValueType.DECIMAL:
+        return lambda: Decimal(rng.randrange(-(10**16), 10**16)).scaleb(-4)
+    if vtype == ValueType.BINARY:
+        # Never empty: an empty cell is null in the text form.
+        return lambda: rng.randbytes(rng.randint(1, 64))
+    return _string_generator(spec.strings, rng)
+
+
+def _stringify(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="milliseconds")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    return str(value)
+
+
+def generate(
+    spec: DatasetSpec,
+    num_rows: int,
+    seed: int = 0,
+    types: Sequence[ValueType] = COLUMN_TYPES,
+) -> Table:
+    """Generate *num_rows* rows of *spec* with one column per type in *types*.
+
+    Identical arguments give identical tables.
+    """
+    columns: list[list[Any]] = []
+    for vtype in types:
+        # One RNG per column keeps columns independent of each other's shape.
+        rng = random.Random(f"{seed}:{spec.name}:{vtype.name}")
+        value = _value_generator(vtype, spec, rng)
+        columns.append(
+            [
+                None if rng.random() < spec.null_ratio else value()
+                for _ in range(num_rows)
+            ]
+        )
+    rows = [[_stringify(v) for v in row] for row in zip(*columns)]
+    return Table([t.name.lower() for t in types], list(types), columns, rows)
+
+
+def to_csv(table: Table) -> bytes:
+    """Render *table* as UTF-8 CSV with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(table.headers)
+    writer.writerows(table.rows)
+    return buffer.getvalue().encode()
+
+
+__all__ = [
+    "COLUMN_TYPES",
+    "DATASETS",
+    "INFERRED_TYPES",
+    "DatasetSpec",
+    "Table",
+    "generate",
+    "to_csv",
+]
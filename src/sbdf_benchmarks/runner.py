@@ -0,0 +1,246 @@
+"""Measure SBDF inference, encoding and CSV→SBDF throughput.
+
+Each (benchmark, dataset) case runs in a fresh ``spawn``-ed worker process
+so that its peak RSS is not inflated by earlier cases. The reported time is
+the best of ``repeat`` runs; throughput figures are derived from it.
+
+The encoding benchmarks run on a column of every value type. Type inference
+and CSV→SBDF start from text, so they run on the types inference can recover
+(see :data:`BENCHMARK_TYPES`).
+"""
+
+from __future__ import annotations
+
+import io
+import platform
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from importlib import metadata
+from multiprocessing import get_context
+from typing import Any, NamedTuple
+
+from sbdf_benchmarks.datasets import (
+    COLUMN_TYPES,
+    DATASETS,
+    INFERRED_TYPES,
+    DatasetSpec,
+    Table,
+    generate,
+    to_csv,
+)
+from spotfire_community.sbdf import (
+    SbdfStreamingWriter,
+    TypeInferrer,
+    ValueType,
+    write_sbdf,
+)
+from spotfire_community.sbdf._writer import vectorized_available
+
+BATCH_ROWS = 10_000
+
+
+class Measurement(NamedTuple):
+    """Outcome of one timed run: bytes read from the input, bytes produced."""
+
+    input_bytes: int
+    output_bytes: int
+
+
+class _CountingSink(io.BytesIO):
+    """Discards written bytes, keeping only their count."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def write(self, b: Any, /) -> int:
+        n = memoryview(b).nbytes
+        self.count += n
+        return n
+
+
+def _batches(rows: list[Any], size: int) -> list[list[Any]]:
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
+def _csv_bytes(table: Table) -> int:
+    return sum(len(",".join(row)) + 1 for row in table.rows)
+
+
+def bench_infer(table: Table) -> Measurement:
+    inferrer = TypeInferrer(len(table.headers))
+    inferrer.observe_rows(table.rows)
+    return Measurement(_csv_bytes(table), 0)
+
+
+def bench_encode_rows(table: Table) -> Measurement:
+    writer = SbdfStreamingWriter(table.headers, table.types)
+    out = sum(len(c) for c in writer.chunks(_batches(table.rows, BATCH_ROWS)))
+    return Measurement(_csv_bytes(table), out)
+
+
+def bench_encode_columns(table: Table) -> Measurement:
+    writer = SbdfStreamingWriter(table.headers, table.types)
+    out = len(writer.start())
+    for start in range(0, len(table.rows), BATCH_ROWS):
+        out += len(
+            writer.write_columns(
+                [col[start : start + BATCH_ROWS] for col in table.columns]
+            )
+        )
+    out += len(writer.finish())
+    return Measurement(_csv_bytes(table), out)
+
+
+def bench_csv_to_sbdf(table: Table) -> Measurement:
+    data = to_csv(table)
+    sink = _CountingSink()
+    write_sbdf(io.BytesIO(data), sink, BATCH_ROWS)
+    return Measurement(len(data), sink.count)
+
+
+BENCHMARKS: dict[str, Callable[[Table], Measurement]] = {
+    "infer": bench_infer,
+    "encode_rows": bench_encode_rows,
+    "encode_columns": bench_encode_columns,
+    "csv_to_sbdf": bench_csv_to_sbdf,
+}
+
+# The column types of the table each benchmark runs on.
+BENCHMARK_TYPES: dict[str, list[ValueType]] = {
+    "infer": INFERRED_TYPES,
+    "encode_rows": COLUMN_TYPES,
+    "encode_columns": COLUMN_TYPES,
+    "csv_to_sbdf": INFERRED_TYPES,
+}
+
+
+def _peak_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(
+    benchmark: str, spec: DatasetSpec, num_rows: int, repeat: int, seed: int
+) -> dict[str, Any]:
+    """Time *benchmark* on *spec* and return one JSON-ready result record."""
+    table = generate(spec, num_rows, seed, BENCHMARK_TYPES[benchmark])
+    func = BENCHMARKS[benchmark]
+    rss_before = _peak_rss_bytes()
+    best = float("inf")
+    measurement = Measurement(0, 0)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        measurement = func(table)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "benchmark": benchmark,
+        "dataset": spec.name,
+        "null_ratio": spec.null_ratio,
+        "strings": spec.strings,
+        "rows": num_rows,
+        "column_types": [t.name for t in table.types],
+        "seconds": best,
+        "rows_per_sec": num_rows / best,
+        "input_bytes": measurement.input_bytes,
+        "output_bytes": measurement.output_bytes,
+        "input_mb_per_sec": measurement.input_bytes / best / 1e6,
+        "output_mb_per_sec": measurement.output_bytes / best / 1e6,
+        "rss_before_benchmark_bytes": rss_before,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def environment() -> dict[str, Any]:
+    """Describe the interpreter and package versions the results came from."""
+
+    def version(name: str) -> str | None:
+        try:
+            return metadata.version(name)
+        except metadata.PackageNotFoundError:
+            return None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "spotfire_community": version("spotfire-community"),
+        "numpy": version("numpy"),
+        "vectorized": vectorized_available(),
+    }
+
+
+def run_suite(
+    num_rows: int = 100_000,
+    repeat: int = 3,
+    *,
+    benchmarks: Sequence[str] | None = None,
+    datasets: Sequence[str] | None = None,
+    seed: int = 0,
+    isolate: bool = True,
+) -> dict[str, Any]:
+    """Run every selected (benchmark, dataset) case.
+
+    Args:
+        num_rows: Rows per generated table.
+        repeat: Timed runs per case; the fastest is reported.
+        benchmarks: Names from :data:`BENCHMARKS` to run (default: all).
+        datasets: Names from :data:`~sbdf_benchmarks.datasets.DATASETS` to
+            run (default: all).
+        seed: Seed for the synthetic data.
+        isolate: Run each case in a fresh process so peak RSS is per case.
+
+    Returns:
+        ``{"environment": {...}, "parameters": {...}, "results": [...]}``.
+
+    Raises:
+        ValueError: If an unknown benchmark or dataset name is given.
+    """
+    names = list(benchmarks or BENCHMARKS)
+    specs = [s for s in DATASETS if datasets is None or s.name in datasets]
+    unknown = set(names) - set(BENCHMARKS) | set(datasets or ()) - {
+        s.name for s in DATASETS
+    }
+    if unknown:
+        raise ValueError(f"Unknown benchmark or dataset: {sorted(unknown)}")
+
+    results: list[dict[str, Any]] = []
+    for name in names:
+        for spec in specs:
+            args = (name, spec, num_rows, repeat, seed)
+            if isolate:
+                with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                    results.append(pool.submit(run_case, *args).result())
+            else:
+                results.append(run_case(*args))
+    return {
+        "environment": environment(),
+        "parameters": {
+            "rows": num_rows,
+            "repeat": repeat,
+            "seed": seed,
+            "batch_rows": BATCH_ROWS,
+            "isolated": isolate,
+        },
+        "results": results,
+    }
+
+
+__all__ = [
+    "BENCHMARKS",
+    "BENCHMARK_TYPES",
+    "Measurement",
+    "environment",
+    "run_case",
+    "run_suite",
+]
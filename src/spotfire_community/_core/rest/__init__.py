@@ -1,12 +1,18 @@
-"""Public exports for REST utilities (auth, session, scopes)."""
+"""Public exports for REST utilities (auth, session, scopes, requests)."""
 
 from .models import Scope
-from .auth import authenticate
+from .auth import authenticate, bearer_headers, token_request
+from .request import RestRequest, RestResponse, send
 from .spotfire_requests import SpotfireRequestsSession
 
 
 __all__ = [
     "Scope",
     "authenticate",
+    "bearer_headers",
+    "token_request",
+    "RestRequest",
+    "RestResponse",
+    "send",
     "SpotfireRequestsSession",
 ]
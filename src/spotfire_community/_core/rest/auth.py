@@ -4,6 +4,44 @@ from requests.exceptions import RequestException
 
 from .spotfire_requests import SpotfireRequestsSession
 from .models import Scope
+from .request import RestRequest, RestResponse, send
+
+
+def token_request(
+    url: str,
+    scopes: list[Scope],
+    client_id: str,
+    client_secret: str,
+) -> RestRequest:
+    """The OAuth2 client credentials request for an access token to *scopes*."""
+    return RestRequest(
+        "POST",
+        f"{url}/oauth2/token",
+        params={
+            "grant_type": "client_credentials",
+            "scope": " ".join([scope.value for scope in scopes]),
+        },
+        auth=(client_id, client_secret),
+    )
+
+
+def bearer_headers(token_response: RestResponse) -> dict[str, str]:
+    """The headers authenticating later requests with the token of *token_response*.
+
+    Raises Exception on non-200 responses or a missing token.
+    """
+    if token_response.status_code != 200:
+        raise Exception(
+            f"Failed to authenticate with Spotfire server: {token_response.status_code} - {token_response.text}"
+        )
+
+    if (token := token_response.json().get("access_token")) is None:
+        raise Exception("No access token found in response.")
+
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json",
+    }
 
 
 def authenticate(
@@ -19,34 +57,18 @@ def authenticate(
     """
     # Try to get the token to check if the credentials are valid
     try:
-        token_response = requests_session.post(
-            f"{url}/oauth2/token",
-            auth=(client_id, client_secret),
-            params={
-                "grant_type": "client_credentials",
-                "scope": " ".join([scope.value for scope in scopes]),
-            },
+        token_response = send(
+            requests_session, token_request(url, scopes, client_id, client_secret)
         )
         token_response.raise_for_status()
     except RequestException as e:
         raise Exception(f"Failed to connect to Spotfire server: {e}")
 
-    if token_response.status_code != 200:
-        raise Exception(
-            f"Failed to authenticate with Spotfire server: {token_response.status_code} - {token_response.text}"
-        )
-
-    if (token := token_response.json().get("access_token")) is None:
-        raise Exception("No access token found in response.")
-
-    requests_session.headers.update(
-        {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-        }
-    )
+    requests_session.headers.update(bearer_headers(token_response))
 
 
 __all__ = [
     "authenticate",
+    "bearer_headers",
+    "token_request",
 ]
@@ -0,0 +1,87 @@
+"""Transport-independent REST requests and responses.
+
+Requests are built as :class:`RestRequest` values and responses read through
+:class:`RestResponse`, so that the ``requests``-based clients and the
+``httpx``-based async clients share both and only differ in how they send.
+"""
+
+from collections.abc import Mapping
+from typing import Any, NamedTuple, Protocol
+
+from requests import Response, Session
+
+
+class RestRequest(NamedTuple):
+    """
+    A REST request, ready to be sent by any HTTP client.
+
+    Attributes:
+        method (str): The HTTP method: "GET", "POST" or "DELETE".
+        url (str): The absolute URL.
+        params (Mapping[str, Any] | None): Query parameters.
+        json (Any): A body to send as JSON.
+        content (bytes | None): A raw body.
+        headers (Mapping[str, str] | None): Additional headers.
+        auth (tuple[str, str] | None): Basic authentication credentials.
+    """
+
+    method: str
+    url: str
+    params: Mapping[str, Any] | None = None
+    json: Any = None
+    content: bytes | None = None
+    headers: Mapping[str, str] | None = None
+    auth: tuple[str, str] | None = None
+
+
+class RestResponse(Protocol):
+    """The parts of a ``requests`` or ``httpx`` response that are read."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self) -> Any: ...
+
+
+def send(session: Session, request: RestRequest) -> Response:
+    """
+    Sends *request* through a ``requests`` session.
+
+    The session's ``get``, ``post`` or ``delete`` method is called, so that
+    sessions overriding those are honoured.
+
+    Args:
+        session (Session): The session to send through.
+        request (RestRequest): The request.
+
+    Returns:
+        Response: The response.
+    """
+    kwargs: dict[str, Any] = {}
+    if request.params is not None:
+        kwargs["params"] = request.params
+    if request.json is not None:
+        kwargs["json"] = request.json
+    if request.content is not None:
+        kwargs["data"] = request.content
+    if request.headers is not None:
+        kwargs["headers"] = request.headers
+    if request.auth is not None:
+        kwargs["auth"] = request.auth
+    if request.method == "GET":
+        return session.get(request.url, **kwargs)
+    if request.method == "POST":
+        return session.post(request.url, **kwargs)
+    if request.method == "DELETE":
+        return session.delete(request.url, **kwargs)
+    raise ValueError(f"Unsupported method: {request.method}")
+
+
+__all__ = [
+    "RestRequest",
+    "RestResponse",
+    "send",
+]
@@ -1,11 +1,16 @@
 from requests import Session, Response
+from requests.adapters import HTTPAdapter
 from typing import Any
 
 
 class SpotfireRequestsSession(Session):
-    def __init__(self, timeout: float | None = None):
+    def __init__(self, timeout: float | None = None, pool_maxsize: int | None = None):
         super().__init__()
         self.timeout = timeout
+        if pool_maxsize is not None:
+            # Keep up to pool_maxsize connections per host for threaded callers.
+            for prefix in ("http://", "https://"):
+                self.mount(prefix, HTTPAdapter(pool_maxsize=pool_maxsize))
 
     def request(
         self, method: str | bytes, url: str, *args: Any, **kwargs: Any
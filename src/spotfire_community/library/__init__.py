@@ -2,6 +2,8 @@ from .client import LibraryClient
 from .models import (
     ItemType,
     ConflictResolution,
+    UploadItem,
+    UploadResult,
 )
 
 
@@ -9,4 +11,6 @@ __all__ = [
     "LibraryClient",
     "ItemType",
     "ConflictResolution",
+    "UploadItem",
+    "UploadResult",
 ]
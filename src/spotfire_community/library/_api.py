@@ -0,0 +1,231 @@
+"""Requests and responses of the Library REST API (v2).
+
+Internal module, shared by :class:`~spotfire_community.library.LibraryClient`
+and :class:`~spotfire_community.library.async_client.AsyncLibraryClient`. Each
+operation has a function building its request and one checking and reading
+its response, so that the clients only differ in how they send requests.
+"""
+
+from typing import Any
+
+from .._core.rest import RestRequest, RestResponse
+from .errors import ItemNotFoundError
+from .models import ItemType, LibraryItem
+
+
+def split_item_path(path: str) -> tuple[str, str]:
+    """
+    Splits a library item path into its parent folder path and its title.
+    """
+    path_parts = path.strip("/").split("/")
+    parent_parts = path_parts[:-1]
+    parent_folder_path = f"/{'/'.join(parent_parts)}" if parent_parts else "/"
+    return parent_folder_path, path_parts[-1]
+
+
+def folder_request(url: str, path: str) -> RestRequest:
+    """The request looking up the folder at *path*."""
+    return RestRequest(
+        "GET",
+        f"{url}/api/rest/library/v2/items",
+        params={
+            "path": path,
+            "type": ItemType.FOLDER,
+            "maxResults": "1",
+        },
+    )
+
+
+def parse_folder(response: RestResponse, path: str) -> str:
+    """
+    The folder ID from the response to :func:`folder_request`.
+
+    Raises:
+        ItemNotFoundError: If the folder is not found.
+        Exception: For other errors returned by the API.
+    """
+    if response.status_code == 404:
+        raise ItemNotFoundError(f"Folder not found: {path}")
+    elif response.status_code != 200:
+        raise Exception(
+            f"Error fetching folder ID: {response.status_code} - {response.text}"
+        )
+
+    return response.json()["items"][0]["id"]
+
+
+def create_folder_request(
+    url: str, title: str, parent_id: str, description: str
+) -> RestRequest:
+    """The request creating folder *title* in the folder with ID *parent_id*."""
+    return RestRequest(
+        "POST",
+        f"{url}/api/rest/library/v2/items",
+        json={
+            "title": title,
+            "type": ItemType.FOLDER,
+            "parentId": parent_id,
+            "description": description,
+        },
+    )
+
+
+def parse_created_folder(response: RestResponse, title: str) -> str:
+    """
+    The folder ID from the response to :func:`create_folder_request`.
+
+    Raises:
+        Exception: If the folder could not be created.
+    """
+    if response.status_code != 201:
+        raise Exception(
+            f"Failed to create folder '{title}': {response.status_code} - {response.text}"
+        )
+
+    return response.json()["id"]
+
+
+def upload_job_request(
+    url: str,
+    title: str,
+    item_type: ItemType,
+    parent_id: str,
+    description: str,
+    overwrite: bool,
+) -> RestRequest:
+    """The request creating an upload job for item *title* in folder *parent_id*."""
+    return RestRequest(
+        "POST",
+        f"{url}/api/rest/library/v2/upload",
+        json={
+            "overwriteIfExists": overwrite,
+            "item": {
+                "title": title,
+                "type": item_type,
+                "parentId": parent_id,
+                "description": description,
+            },
+        },
+    )
+
+
+def parse_upload_job(response: RestResponse) -> str:
+    """
+    The job ID from the response to :func:`upload_job_request`.
+
+    Raises:
+        Exception: If the upload job could not be created.
+    """
+    if response.status_code != 201:
+        raise Exception(
+            f"Failed to create upload job: {response.status_code} - {response.text}"
+        )
+
+    return response.json()["jobId"]
+
+
+def upload_chunk_request(
+    url: str, data: bytes, job_id: str, chunk_index: int, finish: bool
+) -> RestRequest:
+    """The request sending chunk *chunk_index* (1-based) of upload job *job_id*."""
+    return RestRequest(
+        "POST",
+        f"{url}/api/rest/library/v2/upload/{job_id}",
+        params={
+            "chunk": chunk_index,
+            "finish": finish,
+        },
+        content=data,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+
+
+def parse_upload_chunk(
+    response: RestResponse, chunk_index: int, finish: bool
+) -> str | None:
+    """
+    The uploaded item ID from the response to the final :func:`upload_chunk_request`.
+
+    Returns:
+        The item ID when ``finish`` is True, otherwise None.
+
+    Raises:
+        Exception: If the chunk could not be uploaded.
+    """
+    if response.status_code != 200:
+        raise Exception(
+            f"Failed to upload chunk {chunk_index}: {response.status_code} - {response.text}"
+        )
+
+    if finish:
+        return response.json()["item"]["id"]
+    return None
+
+
+def delete_item_request(url: str, item_id: str) -> RestRequest:
+    """The request deleting the item with ID *item_id*."""
+    return RestRequest("DELETE", f"{url}/api/rest/library/v2/items/{item_id}")
+
+
+def parse_deleted_item(response: RestResponse, item_id: str) -> None:
+    """
+    Checks the response to :func:`delete_item_request`.
+
+    Raises:
+        ItemNotFoundError: If the item is not found (404).
+        Exception: If the item could not be deleted.
+    """
+    if response.status_code == 404:
+        raise ItemNotFoundError(f"Item not found: {item_id}")
+    if response.status_code != 204:
+        raise Exception(
+            f"Failed to delete item: {response.status_code} - {response.text}"
+        )
+
+
+def dashboards_request(url: str, folder_id: str) -> RestRequest:
+    """The request listing the dashboards in the folder with ID *folder_id*."""
+    return RestRequest(
+        "GET",
+        f"{url}/api/rest/library/v2/items",
+        params={
+            "searchExpression": "type:dxp",
+            "locationId": folder_id,
+            "maxResults": 1000,  # Arbitrary large number; api does not seem to have pagination
+            "attributes": "path",
+        },
+    )
+
+
+def parse_dashboards(response: RestResponse) -> list[LibraryItem]:
+    """
+    The dashboards from the response to :func:`dashboards_request`.
+
+    Raises:
+        Exception: If the request failed.
+    """
+    if response.status_code != 200:
+        raise Exception(
+            f"Error fetching dashboards: {response.status_code} - {response.text}"
+        )
+
+    data: dict[str, Any] = response.json()
+    items = data.get("items", [])
+    return [LibraryItem.model_validate(item) for item in items]
+
+
+__all__ = [
+    "create_folder_request",
+    "dashboards_request",
+    "delete_item_request",
+    "folder_request",
+    "parse_created_folder",
+    "parse_dashboards",
+    "parse_deleted_item",
+    "parse_folder",
+    "parse_upload_chunk",
+    "parse_upload_job",
+    "split_item_path",
+    "upload_chunk_request",
+    "upload_job_request",
+]
@@ -0,0 +1,134 @@
+"""Client-side cache of library folder paths to item IDs.
+
+Internal module. :class:`~spotfire_community.library.LibraryClient` owns one
+instance and configures it through its ``folder_cache_ttl`` and
+``folder_cache_size`` arguments.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+def normalize_path(path: str) -> str:
+    """The cache key for *path*: one leading slash and no trailing slash."""
+    return "/" + path.strip("/")
+
+
+class FolderIdCache:
+    """A bounded, expiring map from folder paths to folder IDs.
+
+    Entries expire *ttl* seconds after they were stored and the least recently
+    used entry is evicted once more than *max_size* are held. A *max_size* of
+    0 disables the cache. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = 300.0,
+        max_size: int = 1024,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl: Seconds an entry stays valid, or None to never expire.
+            max_size: Maximum number of entries held.
+            clock: Monotonic time source, in seconds.
+
+        Raises:
+            ValueError: If ttl is not positive or max_size is negative.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive or None, got {ttl}")
+        if max_size < 0:
+            raise ValueError(f"max_size must be >= 0, got {max_size}")
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        # path -> (folder ID, expiry time or None), least recently used first.
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        # folder ID -> path, for every entry: a folder has one path.
+        self._paths: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        folder_id, _ = self._entries.pop(key)
+        if self._paths.get(folder_id) == key:
+            del self._paths[folder_id]
+
+    def _live(self, key: str) -> str | None:
+        """The ID cached for *key*, dropping the entry if it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        folder_id, expires = entry
+        if expires is not None and self._clock() >= expires:
+            self._remove(key)
+            return None
+        return folder_id
+
+    def get(self, path: str) -> str | None:
+        """The cached ID of the folder at *path*, or None on a miss."""
+        key = normalize_path(path)
+        with self._lock:
+            folder_id = self._live(key)
+            if folder_id is not None:
+                self._entries.move_to_end(key)
+            return folder_id
+
+    def path_of(self, folder_id: str) -> str | None:
+        """The cached path of the folder with ID *folder_id*, if any."""
+        with self._lock:
+            path = self._paths.get(folder_id)
+            if path is None or self._live(path) is None:
+                return None
+            return path
+
+    def put(self, path: str, folder_id: str) -> None:
+        """Remember that the folder at *path* has ID *folder_id*."""
+        if self._max_size == 0:
+            return
+        key = normalize_path(path)
+        expires = None if self._ttl is None else self._clock() + self._ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # The folder was moved: its old path no longer leads to it.
+            if (old_path := self._paths.get(folder_id)) is not None:
+                self._remove(old_path)
+            self._entries[key] = (folder_id, expires)
+            self._paths[folder_id] = key
+            while len(self._entries) > self._max_size:
+                self._remove(next(iter(self._entries)))
+
+    def put_child(self, parent_id: str, title: str, folder_id: str) -> None:
+        """Remember folder *title* created in the folder with ID *parent_id*.
+
+        Nothing is stored unless the parent's path is cached.
+        """
+        if (parent_path := self.path_of(parent_id)) is not None:
+            self.put(f"{parent_path.rstrip('/')}/{title}", folder_id)
+
+    def invalidate(self, path: str) -> None:
+        """Forget the folder at *path* and every folder below it."""
+        key = normalize_path(path)
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            for cached in [
+                p for p in self._entries if p == key or p.startswith(prefix)
+            ]:
+                self._remove(cached)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+
+
+__all__ = ["FolderIdCache", "normalize_path"]
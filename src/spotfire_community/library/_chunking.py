@@ -0,0 +1,100 @@
+"""Re-blocking of a byte stream into upload chunks of a target size.
+
+Internal module. Used by ``upload_file_streaming(chunk_size=N)`` of the sync
+and async library clients, so that small stream pieces (such as the SBDF
+header and end-of-table sections) share one upload request and very large
+pieces are split.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+
+class Reblocker:
+    """Cuts the bytes fed to it into blocks of exactly *size* bytes.
+
+    Bytes left over from a chunk for the next block are copied into an
+    internal buffer, so no block or pending state refers to a chunk after
+    :meth:`feed` has finished, and callers may reuse one buffer for every
+    chunk. Whole blocks within a chunk are copied once, and a ``bytes``
+    chunk that is exactly one block is passed through without copying.
+    """
+
+    def __init__(self, size: int):
+        """
+        Args:
+            size: The block size in bytes.
+
+        Raises:
+            ValueError: If size is less than 1.
+        """
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self._size = size
+        self._pending = bytearray()
+
+    def feed(self, chunk: bytes) -> Iterator[bytes]:
+        """Add *chunk* and yield the blocks it completes.
+
+        The returned iterator must be exhausted before *chunk* is modified.
+        """
+        size = self._size
+        pending = self._pending
+        if not chunk:
+            return
+        if not pending and len(chunk) == size:
+            yield chunk if type(chunk) is bytes else bytes(chunk)
+            return
+        view = memoryview(chunk)
+        if pending:
+            take = min(size - len(pending), len(view))
+            pending += view[:take]
+            view = view[take:]
+            if len(pending) < size:
+                return
+            yield bytes(pending)
+            pending.clear()
+        while len(view) >= size:
+            yield view[:size].tobytes()
+            view = view[size:]
+        pending += view
+
+    def flush(self) -> bytes | None:
+        """The incomplete last block, if any bytes are pending."""
+        if not self._pending:
+            return None
+        block = bytes(self._pending)
+        self._pending.clear()
+        return block
+
+
+def rechunk(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Yield the bytes of *chunks* re-blocked into *size*-byte chunks.
+
+    Every chunk but the last is exactly *size* bytes; the last holds the
+    remainder. Empty input chunks are skipped.
+
+    Args:
+        chunks: The input chunks.
+        size: The target chunk size in bytes.
+
+    Raises:
+        ValueError: If size is less than 1.
+    """
+    reblocker = Reblocker(size)
+    for chunk in chunks:
+        yield from reblocker.feed(chunk)
+    if (rest := reblocker.flush()) is not None:
+        yield rest
+
+
+async def arechunk(chunks: AsyncIterable[bytes], size: int) -> AsyncIterator[bytes]:
+    """Asynchronous :func:`rechunk`, for an async iterable of chunks."""
+    reblocker = Reblocker(size)
+    async for chunk in chunks:
+        for block in reblocker.feed(chunk):
+            yield block
+    if (rest := reblocker.flush()) is not None:
+        yield rest
+
+
+__all__ = ["Reblocker", "arechunk", "rechunk"]
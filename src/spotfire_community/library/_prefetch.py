@@ -0,0 +1,113 @@
+"""Read-ahead of upload chunks on a background thread.
+
+Internal module. Used by ``LibraryClient.upload_file_streaming(prefetch=N)``
+so that producing the next chunks (SBDF encoding, database fetches) overlaps
+with sending the current one.
+"""
+
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+from typing import cast
+
+
+class _Failure:
+    """Carries an exception raised by the source to the consuming thread."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_DONE = object()
+_PUT_TIMEOUT = 0.1
+
+
+class ChunkPrefetcher:
+    """Iterate the non-empty chunks of *source*, read up to *depth* ahead.
+
+    A daemon thread pulls chunks from *source* into a bounded queue, so at
+    most *depth* chunks are buffered. An exception raised by *source* is
+    re-raised by :meth:`__next__` once the chunks before it are consumed.
+    Use as a context manager: leaving it stops the thread and waits for the
+    chunk it is producing, if any.
+    """
+
+    def __init__(self, source: Iterable[bytes], depth: int):
+        """
+        Args:
+            source: The chunks to read ahead.
+            depth: Maximum number of chunks buffered.
+
+        Raises:
+            ValueError: If depth is less than 1.
+        """
+        if depth < 1:
+            raise ValueError(f"depth must be >= 1, got {depth}")
+        self._source = source
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._produce, name="spotfire-upload-prefetch", daemon=True
+        )
+
+    def __enter__(self) -> "ChunkPrefetcher":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _DONE:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self._finished = True
+            raise item.error
+        return cast(bytes, item)
+
+    def close(self) -> None:
+        """Stop reading ahead and wait for the producer thread to exit."""
+        self._stopped.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _put(self, item: object) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for chunk in self._source:
+                if chunk and not self._put(chunk):
+                    return
+        except BaseException as e:  # handed to the consumer, not swallowed
+            self._put(_Failure(e))
+            return
+        self._put(_DONE)
+
+
+__all__ = ["ChunkPrefetcher"]
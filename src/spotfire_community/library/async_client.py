@@ -0,0 +1,639 @@
+"""Asynchronous client for Spotfire Library REST API (v2), built on httpx.
+
+Requires ``httpx`` (``pip install spotfire-community[async]``).
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable
+from types import TracebackType
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover - exercised without httpx only
+    raise ImportError(
+        "AsyncLibraryClient requires httpx; "
+        "install it with `pip install spotfire-community[async]`."
+    ) from e
+
+from .._core.rest import RestRequest, Scope, bearer_headers, token_request
+from ._api import (
+    create_folder_request,
+    dashboards_request,
+    delete_item_request,
+    folder_request,
+    parse_created_folder,
+    parse_dashboards,
+    parse_deleted_item,
+    parse_folder,
+    parse_upload_chunk,
+    parse_upload_job,
+    split_item_path,
+    upload_chunk_request,
+    upload_job_request,
+)
+from ._cache import FolderIdCache, normalize_path
+from ._chunking import arechunk
+from .errors import ItemNotFoundError
+from .models import ItemType, LibraryItem
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLibraryClient:
+    """
+    Asynchronous client for interacting with the Spotfire REST API.
+
+    Provides the operations of :class:`~spotfire_community.library.LibraryClient`
+    as coroutines over a pooled ``httpx.AsyncClient``, so that many library
+    operations can run concurrently on one event loop. Use it as an async
+    context manager, which authenticates on entry and closes the connection
+    pool on exit::
+
+        async with AsyncLibraryClient(url, client_id, client_secret) as client:
+            await asyncio.gather(*(client.upload_file(...) for ...))
+
+    Concurrent calls that need the same missing folder create it once. As
+    with :class:`~spotfire_community.library.LibraryClient`, an upload job
+    that cannot be created in a cached folder makes the client resolve the
+    folder again and retry once.
+    """
+
+    _url: str
+    _http: httpx.AsyncClient
+    _folder_cache: FolderIdCache
+    _folder_lock: asyncio.Lock
+
+    def __init__(
+        self,
+        spotfire_url: str,
+        client_id: str,
+        client_secret: str,
+        *,
+        timeout: float = 30.0,
+        folder_cache_ttl: float | None = 300.0,
+        folder_cache_size: int = 1024,
+        max_connections: int = 100,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initializes the client. No request is sent until :meth:`authenticate`.
+
+        Args:
+            spotfire_url (str): The base URL for the Spotfire server, e.g., https://dev.spotfire.com.
+            client_id (str): The client ID for authentication.
+            client_secret (str): The client secret for authentication.
+            timeout (float): Request timeout in seconds.
+            folder_cache_ttl (float | None): Seconds a cached folder ID stays valid, or None to never expire.
+            folder_cache_size (int): Maximum number of cached folder IDs; 0 disables the cache.
+            max_connections (int): Maximum number of open connections; further requests wait for one.
+            transport (httpx.AsyncBaseTransport | None): Transport to send requests through instead of the network.
+        """
+        self._url = f"{spotfire_url.rstrip('/')}/spotfire"
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+            transport=transport,
+        )
+        self._folder_cache = FolderIdCache(folder_cache_ttl, folder_cache_size)
+        # In-flight folder resolutions by path, shared by concurrent callers.
+        self._folder_tasks: dict[str, asyncio.Task[str]] = {}
+        self._folder_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncLibraryClient":
+        try:
+            await self.authenticate()
+        except BaseException:
+            await self.aclose()
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def authenticate(self) -> None:
+        """
+        Authenticates with the server and sets the Bearer token on the client.
+
+        Raises:
+            Exception: If authentication or connection fails.
+        """
+        scopes = [Scope.LIBRARY_READ, Scope.LIBRARY_WRITE]
+        try:
+            token_response = await self._send(
+                token_request(self._url, scopes, self._client_id, self._client_secret)
+            )
+        except httpx.HTTPError as e:
+            raise Exception(f"Failed to connect to Spotfire server: {e}")
+
+        self._http.headers.update(bearer_headers(token_response))
+
+    async def aclose(self) -> None:
+        """
+        Closes the connection pool.
+        """
+        await self._http.aclose()
+
+    async def _send(self, request: RestRequest) -> httpx.Response:
+        """
+        Sends a request built by one of the ``_api`` functions.
+        """
+        return await self._http.request(
+            request.method,
+            request.url,
+            params=request.params,
+            json=request.json,
+            content=request.content,
+            headers=request.headers,
+            auth=httpx.USE_CLIENT_DEFAULT if request.auth is None else request.auth,
+        )
+
+    async def _get_folder_id(self, path: str, *, refresh: bool = False) -> str:
+        """
+        Gets the folder ID for a given path, from the folder cache if possible.
+
+        Args:
+            path (str): The path of the folder.
+            refresh (bool): Whether to bypass the cache and ask the server.
+
+        Returns:
+            str: The ID of the folder.
+
+        Raises:
+            ItemNotFoundError: If the folder is not found.
+            Exception: For other errors returned by the API.
+        """
+        if not refresh and (folder_id := self._folder_cache.get(path)) is not None:
+            return folder_id
+
+        folder_id = parse_folder(
+            await self._send(folder_request(self._url, path)), path
+        )
+        self._folder_cache.put(path, folder_id)
+        return folder_id
+
+    async def _create_folder(
+        self,
+        title: str,
+        parent_id: str,
+        *,
+        description: str = "",
+    ) -> str:
+        """
+        Creates a folder in the Spotfire library.
+
+        The new folder is cached under its parent's path when the parent is
+        itself in the folder cache.
+
+        Args:
+            title (str): The title of the folder.
+            parent_id (str): The ID of the parent folder.
+            description (str): The description of the folder.
+
+        Returns:
+            str: The ID of the created folder.
+
+        Raises:
+            Exception: If the folder could not be created.
+        """
+        folder_id = parse_created_folder(
+            await self._send(
+                create_folder_request(self._url, title, parent_id, description)
+            ),
+            title,
+        )
+        self._folder_cache.put_child(parent_id, title, folder_id)
+        return folder_id
+
+    async def _get_or_create_segment(
+        self, path: str, title: str, parent_id: str | None, refresh: bool
+    ) -> str:
+        """
+        Gets the ID of the folder at *path*, creating it under *parent_id* if it doesn't exist.
+
+        Args:
+            path (str): The path of the folder.
+            title (str): The title of the folder, i.e. the last segment of path.
+            parent_id (str | None): The ID of the parent folder, or None for the root.
+            refresh (bool): Whether to bypass the folder cache and ask the server.
+
+        Returns:
+            str: The ID of the folder.
+        """
+        try:
+            folder_id = await self._get_folder_id(path, refresh=refresh)
+            logger.info("Folder '%s' already exists with ID: %s", path, folder_id)
+            return folder_id
+        except ItemNotFoundError:
+            logger.info("Folder '%s' not found. Creating it...", path)
+
+        if parent_id is None:
+            parent_id = await self._get_folder_id("/")
+        return await self._create_folder(
+            title=title,
+            parent_id=parent_id,
+            description=f"Created by the Spotfire client for path '{path}'.",
+        )
+
+    async def _get_or_create_folder(self, path: str, *, refresh: bool = False) -> str:
+        """
+        Gets the folder ID for the given path, creating the folder and any necessary parent folders if they don't exist.
+
+        Concurrent calls share the lookup or creation of each folder.
+
+        Args:
+            path (str): The path of the folder.
+            refresh (bool): Whether to bypass the folder cache and ask the server.
+
+        Returns:
+            str: The ID of the folder.
+        """
+        parts = path.strip("/").split("/")
+        current_path = ""
+        folder_id: str | None = None
+
+        for part in parts:
+            current_path = f"{current_path}/{part}"
+            if (
+                not refresh
+                and (cached := self._folder_cache.get(current_path)) is not None
+            ):
+                folder_id = cached
+                continue
+
+            key = normalize_path(current_path)
+            task = self._folder_tasks.get(key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._get_or_create_segment(current_path, part, folder_id, refresh)
+                )
+                self._folder_tasks[key] = task
+                task.add_done_callback(lambda _, key=key: self._folder_tasks.pop(key))
+            # Shielded so that a cancelled caller does not cancel the others.
+            folder_id = await asyncio.shield(task)
+
+        if folder_id is None:
+            raise ItemNotFoundError(f"Error occurred: {path}")
+
+        return folder_id
+
+    async def _create_upload_job(
+        self,
+        title: str,
+        item_type: ItemType,
+        parent_id: str,
+        description: str,
+        overwrite: bool,
+    ) -> str:
+        """
+        Creates an upload job for the given item.
+
+        Args:
+            title (str): The title of the item.
+            item_type (ItemType): The type of the item.
+            parent_id (str): The ID of the parent folder.
+            description (str): The description of the item.
+            overwrite (bool): Whether to overwrite existing items.
+
+        Returns:
+            str: The ID of the created upload job.
+
+        Raises:
+            Exception: If the upload job could not be created.
+        """
+        return parse_upload_job(
+            await self._send(
+                upload_job_request(
+                    self._url, title, item_type, parent_id, description, overwrite
+                )
+            )
+        )
+
+    async def _resolve_folder(self, path: str) -> tuple[str, bool]:
+        """
+        Gets or creates the folder at *path*, like ``_get_or_create_folder``.
+
+        Returns:
+            tuple[str, bool]: The ID of the folder, and whether it came from the folder cache.
+        """
+        cached = self._folder_cache.get(path) is not None
+        return await self._get_or_create_folder(path), cached
+
+    async def _create_upload_job_in(
+        self,
+        folder_path: str,
+        parent_id: str,
+        cached: bool,
+        *,
+        title: str,
+        item_type: ItemType,
+        description: str,
+        overwrite: bool,
+    ) -> str:
+        """
+        Creates an upload job in the folder at *folder_path*.
+
+        If *parent_id* came from the folder cache and the job cannot be
+        created, the folder may have been deleted or moved since it was
+        cached: it is resolved again, bypassing the cache, and the job
+        creation retried once.
+
+        Args:
+            folder_path (str): The path of the folder.
+            parent_id (str): The ID of the folder, as resolved by ``_resolve_folder``.
+            cached (bool): Whether parent_id came from the folder cache.
+            title (str): The title of the item.
+            item_type (ItemType): The type of the item.
+            description (str): The description of the item.
+            overwrite (bool): Whether to overwrite existing items.
+
+        Returns:
+            str: The ID of the created upload job.
+
+        Raises:
+            Exception: If the upload job could not be created.
+        """
+        try:
+            return await self._create_upload_job(
+                title=title,
+                item_type=item_type,
+                parent_id=parent_id,
+                description=description,
+                overwrite=overwrite,
+            )
+        except Exception as e:
+            if not cached:
+                raise
+            logger.info(
+                "Upload job creation in '%s' failed with cached folder ID %s (%s); "
+                "resolving the folder again",
+                folder_path,
+                parent_id,
+                e,
+            )
+        async with self._folder_lock:
+            # Another upload may already have resolved the folder again.
+            fresh_id = self._folder_cache.get(folder_path)
+            if fresh_id is None or fresh_id == parent_id:
+                self._folder_cache.invalidate(folder_path)
+                fresh_id = await self._get_or_create_folder(folder_path, refresh=True)
+        return await self._create_upload_job(
+            title=title,
+            item_type=item_type,
+            parent_id=fresh_id,
+            description=description,
+            overwrite=overwrite,
+        )
+
+    async def _send_upload_chunk(
+        self,
+        data: bytes,
+        job_id: str,
+        chunk_index: int,
+        *,
+        finish: bool = False,
+    ) -> str | None:
+        """
+        Send a single chunk to an upload job.
+
+        Args:
+            data: The chunk bytes to upload.
+            job_id: The ID of the upload job.
+            chunk_index: The 1-based chunk sequence number.
+            finish: Whether this is the final chunk.
+
+        Returns:
+            The uploaded item ID when ``finish`` is True, otherwise None.
+        """
+        return parse_upload_chunk(
+            await self._send(
+                upload_chunk_request(self._url, data, job_id, chunk_index, finish)
+            ),
+            chunk_index,
+            finish,
+        )
+
+    async def _delete_item_by_id(self, item_id: str) -> None:
+        """
+        Low-level delete by item ID.
+
+        Args:
+            item_id (str): The ID of the item to delete.
+
+        Raises:
+            ItemNotFoundError: If the item is not found (404).
+            Exception: If the item could not be deleted.
+        """
+        parse_deleted_item(
+            await self._send(delete_item_request(self._url, item_id)), item_id
+        )
+
+    async def upload_file(
+        self,
+        data: bytes,
+        path: str,
+        item_type: ItemType,
+        *,
+        description: str = "",
+        overwrite: bool = False,
+    ) -> str:
+        """
+        Uploads a file to the Spotfire library.
+
+        Args:
+            data (bytes): The file data to upload.
+            path (str): The path in the library where the file will be uploaded.
+            item_type (ItemType): The type of the item.
+            description (str, optional): The description of the item.
+            overwrite (bool, optional): Whether to overwrite existing items. Defaults to False.
+
+        Returns:
+            str: The ID of the uploaded file.
+
+        Raises:
+            Exception: If the upload fails.
+        """
+        parent_folder_path, title = split_item_path(path)
+        parent_id, cached = await self._resolve_folder(parent_folder_path)
+
+        job_id = await self._create_upload_job_in(
+            parent_folder_path,
+            parent_id,
+            cached,
+            title=title,
+            item_type=item_type,
+            description=description,
+            overwrite=overwrite,
+        )
+        logger.info("Upload job created with ID: %s", job_id)
+
+        file_id = await self._send_upload_chunk(data, job_id, 1, finish=True)
+        if file_id is None:
+            raise RuntimeError(
+                "Final upload chunk completed without returning an item ID"
+            )
+        logger.info("File uploaded to %s with ID: %s", path, file_id)
+        return file_id
+
+    async def upload_file_streaming(
+        self,
+        data_stream: AsyncIterable[bytes],
+        path: str,
+        item_type: ItemType,
+        *,
+        description: str = "",
+        overwrite: bool = False,
+        chunk_size: int | None = None,
+    ) -> str:
+        """
+        Upload a file to the Spotfire library by streaming chunks.
+
+        Sends data from an async iterator of bytes chunks using the multi-chunk
+        upload protocol. Each chunk is uploaded sequentially; the final chunk is
+        sent with ``finish=True`` to complete the upload. With ``chunk_size``
+        set, the stream is re-blocked so that every upload request carries
+        exactly ``chunk_size`` bytes (the last one the rest).
+
+        Args:
+            data_stream: Async iterator yielding bytes chunks.
+            path: The full library path including filename (e.g., "/folder/file.sbdf").
+            item_type: The type of the library item.
+            description: Optional description for the item.
+            overwrite: Whether to overwrite an existing item at the same path.
+            chunk_size: Target size in bytes of each upload request (e.g. 8-32 MiB);
+                None sends the chunks as ``data_stream`` yields them.
+
+        Returns:
+            str: The ID of the uploaded file.
+
+        Raises:
+            ValueError: If data_stream yields no chunks or chunk_size is not positive.
+            Exception: If any upload request fails.
+        """
+        if chunk_size is not None:
+            if chunk_size < 1:
+                raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+            data_stream = arechunk(data_stream, chunk_size)
+
+        parent_folder_path, title = split_item_path(path)
+        parent_id, cached = await self._resolve_folder(parent_folder_path)
+
+        # Peek at the stream before creating an upload job to avoid orphaning it
+        # on an empty or all-empty-chunk input.
+        data_iter = aiter(data_stream)
+        pending_chunk: bytes | None = None
+        async for chunk in data_iter:
+            if chunk:
+                pending_chunk = chunk
+                break
+        if pending_chunk is None:
+            raise ValueError("data_stream yielded no data")
+
+        job_id = await self._create_upload_job_in(
+            parent_folder_path,
+            parent_id,
+            cached,
+            title=title,
+            item_type=item_type,
+            description=description,
+            overwrite=overwrite,
+        )
+        logger.info("Streaming upload job created with ID: %s", job_id)
+
+        chunk_index = 1
+        async for chunk in data_iter:
+            if not chunk:
+                continue
+            await self._send_upload_chunk(
+                pending_chunk, job_id, chunk_index, finish=False
+            )
+            chunk_index += 1
+            pending_chunk = chunk
+
+        file_id = await self._send_upload_chunk(
+            pending_chunk, job_id, chunk_index, finish=True
+        )
+        if file_id is None:
+            raise RuntimeError(
+                "Final upload chunk completed without returning an item ID"
+            )
+
+        logger.info("Streaming upload to %s completed with ID: %s", path, file_id)
+        return file_id
+
+    async def delete_folder(
+        self,
+        path: str,
+        *,
+        ignore_missing: bool = True,
+    ) -> None:
+        """
+        Deletes a folder from the Spotfire library by path.
+
+        The folder is looked up on the server rather than in the folder cache,
+        and the cached IDs of the folder and everything under it are dropped.
+
+        Args:
+            path (str): The path of the folder to delete.
+            ignore_missing (bool): If True, do nothing when the folder doesn't exist.
+
+        Raises:
+            ItemNotFoundError: If the folder is not found and ignore_missing is False.
+            Exception: If the delete request fails for other reasons.
+        """
+        self._folder_cache.invalidate(path)
+        try:
+            folder_id = await self._get_folder_id(path, refresh=True)
+        except ItemNotFoundError:
+            if ignore_missing:
+                logger.info("Folder '%s' not found. No action taken.", path)
+                return
+            raise ItemNotFoundError(message="Folder not found")
+
+        try:
+            await self._delete_item_by_id(folder_id)
+        finally:
+            self._folder_cache.invalidate(path)
+        logger.info("Folder '%s' deleted successfully.", path)
+
+    def clear_folder_cache(self) -> None:
+        """
+        Forgets every cached folder ID, e.g. after folders were changed by another client.
+        """
+        self._folder_cache.clear()
+
+    async def get_all_dashboards_in_folder(
+        self,
+        folder_path: str,
+    ) -> list[LibraryItem]:
+        """
+        Retrieves all dashboards in a given folder.
+
+        Args:
+            folder_path (str): The path of the folder to list dashboards from.
+
+        Returns:
+            List[LibraryItem]: A list of LibraryItem objects representing the dashboards.
+
+        Raises:
+            ItemNotFoundError: If the folder is not found.
+            Exception: If the request fails for other reasons.
+        """
+        folder_id = await self._get_folder_id(folder_path)
+
+        return parse_dashboards(
+            await self._send(dashboards_request(self._url, folder_id))
+        )
+
+
+__all__ = [
+    "AsyncLibraryClient",
+]
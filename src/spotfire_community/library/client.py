@@ -1,7 +1,9 @@
 """Client for Spotfire Library REST API (v2)."""
 
 import logging
-from collections.abc import Iterator
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -10,9 +12,29 @@ from .._core import SpotfireRequestsSession
 from .models import (
     ItemType,
     LibraryItem,
+    UploadItem,
+    UploadResult,
 )
-from .._core.rest import authenticate, Scope
+from .._core.rest import RestRequest, Scope, authenticate, send
 from .errors import ItemNotFoundError
+from ._api import (
+    create_folder_request,
+    dashboards_request,
+    delete_item_request,
+    folder_request,
+    parse_created_folder,
+    parse_dashboards,
+    parse_deleted_item,
+    parse_folder,
+    parse_upload_chunk,
+    parse_upload_job,
+    split_item_path,
+    upload_chunk_request,
+    upload_job_request,
+)
+from ._cache import FolderIdCache
+from ._chunking import rechunk
+from ._prefetch import ChunkPrefetcher
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +49,8 @@ class LibraryClient:
 
     _url: str
     _requests_session: requests.Session
+    _folder_cache: FolderIdCache
+    _folder_lock: threading.Lock
 
     def __init__(
         self,
@@ -35,21 +59,38 @@ class LibraryClient:
         client_secret: str,
         *,
         timeout: float = 30.0,
+        folder_cache_ttl: float | None = 300.0,
+        folder_cache_size: int = 1024,
+        max_connections: int = 10,
     ):
         """
         Initializes the Spotfire client and authenticates with the server.
 
+        Folder IDs resolved or created by the client are cached by path, so
+        repeated uploads into the same folders skip the per-segment lookups.
+        When an upload job cannot be created in a cached folder, e.g. because
+        another client deleted or moved it, the folder is resolved again and
+        the job creation retried once.
+
         Args:
             spotfire_url (str): The base URL for the Spotfire server, e.g., https://dev.spotfire.com.
             client_id (str): The client ID for authentication.
             client_secret (str): The client secret for authentication.
+            timeout (float): Request timeout in seconds.
+            folder_cache_ttl (float | None): Seconds a cached folder ID stays valid, or None to never expire.
+            folder_cache_size (int): Maximum number of cached folder IDs; 0 disables the cache.
+            max_connections (int): Connections kept open per host; at least upload_many's max_workers.
 
         Raises:
             Exception: If authentication or connection fails.
         """
         self._url = f"{spotfire_url.rstrip('/')}/spotfire"
 
-        self._requests_session = SpotfireRequestsSession(timeout=timeout)
+        self._requests_session = SpotfireRequestsSession(
+            timeout=timeout, pool_maxsize=max_connections
+        )
+        self._folder_cache = FolderIdCache(folder_cache_ttl, folder_cache_size)
+        self._folder_lock = threading.Lock()
 
         try:
             authenticate(
@@ -62,12 +103,19 @@ class LibraryClient:
         except Exception as e:
             raise Exception(f"Failed to authenticate with Spotfire server: {e}")
 
-    def _get_folder_id(self, path: str) -> str:
+    def _send(self, request: RestRequest) -> requests.Response:
+        """
+        Sends a request built by one of the ``_api`` functions.
+        """
+        return send(self._requests_session, request)
+
+    def _get_folder_id(self, path: str, *, refresh: bool = False) -> str:
         """
-        Gets the folder ID for a given path.
+        Gets the folder ID for a given path, from the folder cache if possible.
 
         Args:
             path (str): The path of the folder.
+            refresh (bool): Whether to bypass the cache and ask the server.
 
         Returns:
             str: The ID of the folder.
@@ -76,25 +124,12 @@ class LibraryClient:
             ItemNotFoundError: If the folder is not found.
             Exception: For other errors returned by the API.
         """
-        response = self._requests_session.get(
-            f"{self._url}/api/rest/library/v2/items",
-            params={
-                "path": path,
-                "type": ItemType.FOLDER,
-                "maxResults": "1",
-            },
-        )
-
-        if response.status_code == 404:
-            raise ItemNotFoundError(f"Folder not found: {path}")
-        elif response.status_code != 200:
-            raise Exception(
-                f"Error fetching folder ID: {response.status_code} - {response.text}"
-            )
-
-        data = response.json()
+        if not refresh and (folder_id := self._folder_cache.get(path)) is not None:
+            return folder_id
 
-        return data["items"][0]["id"]
+        folder_id = parse_folder(self._send(folder_request(self._url, path)), path)
+        self._folder_cache.put(path, folder_id)
+        return folder_id
 
     def _create_folder(
         self,
@@ -106,6 +141,9 @@ class LibraryClient:
         """
         Creates a folder in the Spotfire library.
 
+        The new folder is cached under its parent's path when the parent is
+        itself in the folder cache.
+
         Args:
             title (str): The title of the folder.
             parent_id (str): The ID of the parent folder.
@@ -117,29 +155,28 @@ class LibraryClient:
         Raises:
             Exception: If the folder could not be created.
         """
-        create_response = self._requests_session.post(
-            f"{self._url}/api/rest/library/v2/items",
-            json={
-                "title": title,
-                "type": ItemType.FOLDER,
-                "parentId": parent_id,
-                "description": description,
-            },
+        folder_id = parse_created_folder(
+            self._send(create_folder_request(self._url, title, parent_id, description)),
+            title,
         )
+        self._folder_cache.put_child(parent_id, title, folder_id)
+        return folder_id
 
-        if create_response.status_code != 201:
-            raise Exception(
-                f"Failed to create folder '{title}': {create_response.status_code} - {create_response.text}"
-            )
-
-        return create_response.json()["id"]
-
-    def _get_or_create_folder(self, path: str) -> str:
+    def _get_or_create_folder(
+        self,
+        path: str,
+        resolved: dict[str, str] | None = None,
+        *,
+        refresh: bool = False,
+    ) -> str:
         """
         Gets the folder ID for the given path, creating the folder and any necessary parent folders if they don't exist.
 
         Args:
             path (str): The path of the folder.
+            resolved (dict[str, str] | None): Folder IDs already resolved by path, e.g. for earlier
+                items of a batch. Folders resolved or created here are added to it.
+            refresh (bool): Whether to bypass the folder cache and ask the server.
 
         Returns:
             str: The ID of the folder.
@@ -150,25 +187,34 @@ class LibraryClient:
         parts = path.strip("/").split("/")
         current_path = ""
         folder_id: str | None = None
+        known = {} if resolved is None else resolved
 
         for part in parts:
             current_path = f"{current_path}/{part}"
+            if current_path in known:
+                folder_id = known[current_path]
+                continue
 
             try:
-                folder_id = self._get_folder_id(current_path)
+                folder_id = self._get_folder_id(current_path, refresh=refresh)
                 logger.info(
                     "Folder '%s' already exists with ID: %s", current_path, folder_id
                 )
             except ItemNotFoundError:
                 logger.info("Folder '%s' not found. Creating it...", current_path)
                 # Create the folder if it doesn't exist
-                parent_id = folder_id if folder_id else self._get_folder_id("/")
+                if folder_id:
+                    parent_id = folder_id
+                else:
+                    parent_id = known.get("/") or self._get_folder_id("/")
+                    known["/"] = parent_id
 
                 folder_id = self._create_folder(
                     title=part,
                     parent_id=parent_id,
                     description=f"Created by the Spotfire client for path '{current_path}'.",
                 )
+            known[current_path] = folder_id
 
         if folder_id is None:
             # If the folder ID is still None, it means the root folder was not found
@@ -200,25 +246,91 @@ class LibraryClient:
         Raises:
             Exception: If the upload job could not be created.
         """
-        create_response = self._requests_session.post(
-            f"{self._url}/api/rest/library/v2/upload",
-            json={
-                "overwriteIfExists": overwrite,
-                "item": {
-                    "title": title,
-                    "type": item_type,
-                    "parentId": parent_id,
-                    "description": description,
-                },
-            },
+        return parse_upload_job(
+            self._send(
+                upload_job_request(
+                    self._url, title, item_type, parent_id, description, overwrite
+                )
+            )
         )
 
-        if create_response.status_code != 201:
-            raise Exception(
-                f"Failed to create upload job: {create_response.status_code} - {create_response.text}"
-            )
+    def _resolve_folder(
+        self, path: str, resolved: dict[str, str] | None = None
+    ) -> tuple[str, bool]:
+        """
+        Gets or creates the folder at *path*, like ``_get_or_create_folder``.
+
+        Returns:
+            tuple[str, bool]: The ID of the folder, and whether it came from the folder cache.
+        """
+        cached = self._folder_cache.get(path) is not None
+        return self._get_or_create_folder(path, resolved), cached
+
+    def _create_upload_job_in(
+        self,
+        folder_path: str,
+        parent_id: str,
+        cached: bool,
+        *,
+        title: str,
+        item_type: ItemType,
+        description: str,
+        overwrite: bool,
+    ) -> str:
+        """
+        Creates an upload job in the folder at *folder_path*.
 
-        return create_response.json()["jobId"]
+        If *parent_id* came from the folder cache and the job cannot be
+        created, the folder may have been deleted or moved since it was
+        cached: it is resolved again, bypassing the cache, and the job
+        creation retried once.
+
+        Args:
+            folder_path (str): The path of the folder.
+            parent_id (str): The ID of the folder, as resolved by ``_resolve_folder``.
+            cached (bool): Whether parent_id came from the folder cache.
+            title (str): The title of the item.
+            item_type (ItemType): The type of the item.
+            description (str): The description of the item.
+            overwrite (bool): Whether to overwrite existing items.
+
+        Returns:
+            str: The ID of the created upload job.
+
+        Raises:
+            Exception: If the upload job could not be created.
+        """
+        try:
+            return self._create_upload_job(
+                title=title,
+                item_type=item_type,
+                parent_id=parent_id,
+                description=description,
+                overwrite=overwrite,
+            )
+        except Exception as e:
+            if not cached:
+                raise
+            logger.info(
+                "Upload job creation in '%s' failed with cached folder ID %s (%s); "
+                "resolving the folder again",
+                folder_path,
+                parent_id,
+                e,
+            )
+        with self._folder_lock:
+            # Another upload may already have resolved the folder again.
+            fresh_id = self._folder_cache.get(folder_path)
+            if fresh_id is None or fresh_id == parent_id:
+                self._folder_cache.invalidate(folder_path)
+                fresh_id = self._get_or_create_folder(folder_path, refresh=True)
+        return self._create_upload_job(
+            title=title,
+            item_type=item_type,
+            parent_id=fresh_id,
+            description=description,
+            overwrite=overwrite,
+        )
 
     def _send_upload_chunk(
         self,
@@ -240,25 +352,14 @@ class LibraryClient:
         Returns:
             The uploaded item ID when ``finish`` is True, otherwise None.
         """
-        upload_response = self._requests_session.post(
-            f"{self._url}/api/rest/library/v2/upload/{job_id}",
-            data=data,
-            params={
-                "chunk": chunk_index,
-                "finish": finish,
-            },
-            headers={"Content-Type": "application/octet-stream"},
+        return parse_upload_chunk(
+            self._send(
+                upload_chunk_request(self._url, data, job_id, chunk_index, finish)
+            ),
+            chunk_index,
+            finish,
         )
 
-        if upload_response.status_code != 200:
-            raise Exception(
-                f"Failed to upload chunk {chunk_index}: {upload_response.status_code} - {upload_response.text}"
-            )
-
-        if finish:
-            return upload_response.json()["item"]["id"]
-        return None
-
     def _add_data_to_upload_job(
         self,
         data: bytes,
@@ -292,16 +393,7 @@ class LibraryClient:
             ItemNotFoundError: If the item is not found (404).
             Exception: If the item could not be deleted.
         """
-        delete_response = self._requests_session.delete(
-            f"{self._url}/api/rest/library/v2/items/{item_id}",
-        )
-
-        if delete_response.status_code == 404:
-            raise ItemNotFoundError(f"Item not found: {item_id}")
-        if delete_response.status_code != 204:
-            raise Exception(
-                f"Failed to delete item: {delete_response.status_code} - {delete_response.text}"
-            )
+        parse_deleted_item(self._send(delete_item_request(self._url, item_id)), item_id)
 
     def upload_file(
         self,
@@ -328,16 +420,56 @@ class LibraryClient:
         Raises:
             Exception: If the upload fails.
         """
-        path_parts = path.strip("/").split("/")
+        parent_folder_path, title = split_item_path(path)
+        parent_id, cached = self._resolve_folder(parent_folder_path)
+
+        return self._upload_into_folder(
+            data,
+            path,
+            parent_folder_path,
+            title,
+            parent_id,
+            cached,
+            item_type,
+            description,
+            overwrite,
+        )
 
-        parent_parts = path_parts[:-1]
-        parent_folder_path = f"/{'/'.join(parent_parts)}" if parent_parts else "/"
-        parent_id = self._get_or_create_folder(parent_folder_path)
+    def _upload_into_folder(
+        self,
+        data: bytes,
+        path: str,
+        folder_path: str,
+        title: str,
+        parent_id: str,
+        cached: bool,
+        item_type: ItemType,
+        description: str,
+        overwrite: bool,
+    ) -> str:
+        """
+        Uploads a file as a single chunk into an already resolved folder.
 
-        job_id = self._create_upload_job(
-            title=path_parts[-1],
+        Args:
+            data (bytes): The file data to upload.
+            path (str): The full library path of the file, for logging.
+            folder_path (str): The path of the folder to upload into.
+            title (str): The title of the file.
+            parent_id (str): The ID of the folder to upload into.
+            cached (bool): Whether parent_id came from the folder cache.
+            item_type (ItemType): The type of the item.
+            description (str): The description of the item.
+            overwrite (bool): Whether to overwrite existing items.
+
+        Returns:
+            str: The ID of the uploaded file.
+        """
+        job_id = self._create_upload_job_in(
+            folder_path,
+            parent_id,
+            cached,
+            title=title,
             item_type=item_type,
-            parent_id=parent_id,
             description=description,
             overwrite=overwrite,
         )
@@ -347,6 +479,78 @@ class LibraryClient:
         logger.info("File uploaded to %s with ID: %s", path, file_id)
         return file_id
 
+    def upload_many(
+        self,
+        items: Iterable[UploadItem],
+        *,
+        max_workers: int = 8,
+    ) -> list[UploadResult]:
+        """
+        Uploads many files to the Spotfire library concurrently.
+
+        The parent folders of all items are resolved (and created where
+        missing) first, each exactly once, on the calling thread. The uploads
+        then run on a pool of ``max_workers`` threads sharing the client's
+        connection pool; size it with the ``max_connections`` constructor
+        argument. A failing item does not stop the others: its error is
+        returned in its result, as is a failure to resolve its folder.
+
+        Args:
+            items (Iterable[UploadItem]): The files to upload.
+            max_workers (int): The maximum number of concurrent uploads.
+
+        Returns:
+            list[UploadResult]: One result per item, in the order of ``items``.
+
+        Raises:
+            ValueError: If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        items = list(items)
+        targets = [split_item_path(item.path) for item in items]
+
+        resolved: dict[str, str] = {}
+        folders: dict[str, tuple[str, bool]] = {}
+        folder_errors: dict[str, Exception] = {}
+        for folder_path in sorted({folder for folder, _ in targets}):
+            try:
+                folders[folder_path] = self._resolve_folder(folder_path, resolved)
+            except Exception as e:
+                folder_errors[folder_path] = e
+
+        def upload(item: UploadItem, folder_path: str, title: str) -> UploadResult:
+            if folder_path in folder_errors:
+                return UploadResult(
+                    path=item.path, item_id=None, error=folder_errors[folder_path]
+                )
+            parent_id, cached = folders[folder_path]
+            try:
+                item_id = self._upload_into_folder(
+                    item.data,
+                    item.path,
+                    folder_path,
+                    title,
+                    parent_id,
+                    cached,
+                    item.item_type,
+                    item.description,
+                    item.overwrite,
+                )
+            except Exception as e:
+                logger.warning("Upload to %s failed: %s", item.path, e)
+                return UploadResult(path=item.path, item_id=None, error=e)
+            return UploadResult(path=item.path, item_id=item_id, error=None)
+
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            futures = [
+                pool.submit(upload, item, folder_path, title)
+                for item, (folder_path, title) in zip(items, targets)
+            ]
+        return [future.result() for future in futures]
+
     def upload_file_streaming(
         self,
         data_stream: Iterator[bytes],
@@ -355,6 +559,8 @@ class LibraryClient:
         *,
         description: str = "",
         overwrite: bool = False,
+        prefetch: int = 0,
+        chunk_size: int | None = None,
     ) -> str:
         """
         Upload a file to the Spotfire library by streaming chunks.
@@ -363,36 +569,77 @@ class LibraryClient:
         protocol. Each chunk is uploaded sequentially; the final chunk is sent
         with ``finish=True`` to complete the upload.
 
+        With ``prefetch`` set, a background thread pulls chunks from
+        ``data_stream`` while earlier chunks are being sent, so producing the
+        data (e.g. SBDF encoding) overlaps with network I/O. At most
+        ``prefetch`` chunks are buffered, and an exception raised by
+        ``data_stream`` is re-raised here.
+
+        With ``chunk_size`` set, the stream is re-blocked so that every upload
+        request carries exactly ``chunk_size`` bytes (the last one the rest):
+        small chunks, such as the SBDF header and end-of-table sections, are
+        coalesced and larger ones split. Re-blocking happens on the prefetch
+        thread when there is one, and ``prefetch`` then counts re-blocked
+        chunks.
+
         Args:
             data_stream: Iterator yielding bytes chunks.
             path: The full library path including filename (e.g., "/folder/file.sbdf").
             item_type: The type of the library item.
             description: Optional description for the item.
             overwrite: Whether to overwrite an existing item at the same path.
+            prefetch: Number of chunks to read ahead on a background thread; 0 reads
+                and sends chunks in turn on the calling thread.
+            chunk_size: Target size in bytes of each upload request (e.g. 8-32 MiB);
+                None sends the chunks as ``data_stream`` yields them.
 
         Returns:
             str: The ID of the uploaded file.
 
         Raises:
-            ValueError: If data_stream yields no chunks.
+            ValueError: If data_stream yields no chunks, prefetch is negative or
+                chunk_size is not positive.
             Exception: If any upload request fails.
         """
-        path_parts = path.strip("/").split("/")
-        parent_parts = path_parts[:-1]
-        parent_folder_path = f"/{'/'.join(parent_parts)}" if parent_parts else "/"
-        parent_id = self._get_or_create_folder(parent_folder_path)
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+        if chunk_size is not None:
+            if chunk_size < 1:
+                raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+            data_stream = rechunk(data_stream, chunk_size)
+        if prefetch == 0:
+            return self._upload_chunks(
+                iter(data_stream), path, item_type, description, overwrite
+            )
+        with ChunkPrefetcher(data_stream, prefetch) as chunks:
+            return self._upload_chunks(chunks, path, item_type, description, overwrite)
+
+    def _upload_chunks(
+        self,
+        data_iter: Iterator[bytes],
+        path: str,
+        item_type: ItemType,
+        description: str,
+        overwrite: bool,
+    ) -> str:
+        """
+        Upload the chunks of *data_iter* to *path*; see ``upload_file_streaming``.
+        """
+        parent_folder_path, title = split_item_path(path)
+        parent_id, cached = self._resolve_folder(parent_folder_path)
 
         # Peek at the stream before creating an upload job to avoid orphaning it
         # on an empty or all-empty-chunk input.
-        data_iter = iter(data_stream)
         pending_chunk = next((c for c in data_iter if c), None)
         if pending_chunk is None:
             raise ValueError("data_stream yielded no data")
 
-        job_id = self._create_upload_job(
-            title=path_parts[-1],
+        job_id = self._create_upload_job_in(
+            parent_folder_path,
+            parent_id,
+            cached,
+            title=title,
             item_type=item_type,
-            parent_id=parent_id,
             description=description,
             overwrite=overwrite,
         )
@@ -426,6 +673,9 @@ class LibraryClient:
         """
         Deletes a folder from the Spotfire library by path.
 
+        The folder is looked up on the server rather than in the folder cache,
+        and the cached IDs of the folder and everything under it are dropped.
+
         Args:
             path (str): The path of the folder to delete.
             ignore_missing (bool): If True, do nothing when the folder doesn't exist.
@@ -434,17 +684,27 @@ class LibraryClient:
             ItemNotFoundError: If the folder is not found and ignore_missing is False.
             Exception: If the delete request fails for other reasons.
         """
+        self._folder_cache.invalidate(path)
         try:
-            folder_id = self._get_folder_id(path)
+            folder_id = self._get_folder_id(path, refresh=True)
         except ItemNotFoundError:
             if ignore_missing:
                 logger.info("Folder '%s' not found. No action taken.", path)
                 return
             raise ItemNotFoundError(message="Folder not found")
 
-        self._delete_item_by_id(folder_id)
+        try:
+            self._delete_item_by_id(folder_id)
+        finally:
+            self._folder_cache.invalidate(path)
         logger.info("Folder '%s' deleted successfully.", path)
 
+    def clear_folder_cache(self) -> None:
+        """
+        Forgets every cached folder ID, e.g. after folders were changed by another client.
+        """
+        self._folder_cache.clear()
+
     def get_all_dashboards_in_folder(
         self,
         folder_path: str,
@@ -464,24 +724,7 @@ class LibraryClient:
         """
         folder_id = self._get_folder_id(folder_path)
 
-        response = self._requests_session.get(
-            f"{self._url}/api/rest/library/v2/items",
-            params={
-                "searchExpression": "type:dxp",
-                "locationId": folder_id,
-                "maxResults": 1000,  # Arbitrary large number; api does not seem to have pagination
-                "attributes": "path",
-            },
-        )
-
-        if response.status_code != 200:
-            raise Exception(
-                f"Error fetching dashboards: {response.status_code} - {response.text}"
-            )
-
-        data = response.json()
-        items = data.get("items", [])
-        return [LibraryItem.model_validate(item) for item in items]
+        return parse_dashboards(self._send(dashboards_request(self._url, folder_id)))
 
 
 __all__ = [
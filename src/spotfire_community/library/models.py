@@ -1,3 +1,11 @@
+"""Models of the Spotfire library API and of the library clients.
+
+Like the models parsed from API responses, the inputs and results of the
+client's bulk operations are pydantic models: fields are validated and
+named on construction, and all models share one way of being serialized
+(``model_dump``).
+"""
+
 from enum import StrEnum
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
@@ -64,8 +72,48 @@ class LibraryItem(BaseModel):
     description: Optional[str] = None
 
 
+class UploadItem(BaseModel):
+    """
+    One file to upload with LibraryClient.upload_many.
+
+    Attributes:
+        data (bytes): The file data to upload.
+        path (str): The path in the library where the file will be uploaded.
+        item_type (ItemType): The type of the item.
+        description (str): The description of the item.
+        overwrite (bool): Whether to overwrite an existing item.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    data: bytes
+    path: str
+    item_type: ItemType
+    description: str = ""
+    overwrite: bool = False
+
+
+class UploadResult(BaseModel):
+    """
+    Outcome of one item of LibraryClient.upload_many.
+
+    Attributes:
+        path (str): The library path of the item.
+        item_id (str | None): The ID of the uploaded item, or None if it failed.
+        error (Exception | None): The error that stopped the upload, if any.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    path: str
+    item_id: str | None
+    error: Exception | None
+
+
 __all__ = [
     "ItemType",
     "ConflictResolution",
     "LibraryItem",
+    "UploadItem",
+    "UploadResult",
 ]
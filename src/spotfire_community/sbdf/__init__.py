@@ -1,54 +1,118 @@
 """Helpers for producing Spotfire Binary Data Format (SBDF) files.
 
-Two public entry points:
+Public entry points:
 
 * :func:`create_sbdf` — a one-shot convenience that takes CSV/iterable input
   and returns the full SBDF file as :class:`bytes`. Suitable for small tables.
+  :func:`create_sbdf_chunks` and :func:`write_sbdf` take the same input but
+  stream it, yielding SBDF chunks or writing them to a sink.
 
 * :class:`SbdfStreamingWriter` — a low-level streaming writer that emits SBDF
   bytes incrementally (file header, table slices, table end) so callers can
   pipe the output to an upload target without materialising the full file in
-  memory. Suitable for tables that exceed available RAM.
+  memory. Suitable for tables that exceed available RAM. Slices can be built
+  from stringified rows (:meth:`~SbdfStreamingWriter.write_slice`) or from
+  natively typed columns (:meth:`~SbdfStreamingWriter.write_columns`), and
+  asyncio sources are served by :meth:`~SbdfStreamingWriter.achunks`.
+
+* :func:`from_arrow` / :func:`write_dataframe` — convert pandas DataFrames
+  and Arrow tables or record-batch streams using their schema and column
+  buffers (requires the optional ``pyarrow`` dependency).
+
+* :func:`from_cursor` — stream the result set of any DB-API 2.0 cursor.
+
+* :class:`SbdfReader` — the decoding counterpart: yields the table metadata
+  and then one decoded slice at a time from a file object or buffer.
+
+* :func:`concat_sbdf` / :func:`append_sbdf` — merge SBDF files with the same
+  columns, or append to one in place, by copying table slices verbatim.
 """
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
-from collections.abc import Iterable, Iterator, Sequence
-from enum import IntEnum
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from socket import socket
+from typing import IO, Any, cast
 
 from spotfire_community.sbdf._writer import (
     SID_FILE_HEADER,
     SID_TABLE_END,
     SID_TABLE_METADATA,
     SID_TABLE_SLICE,
-    VT_BOOL,
-    VT_DATE,
-    VT_DATETIME,
-    VT_DOUBLE,
-    VT_INT,
-    VT_LONG,
-    VT_STRING,
-    column_slice,
-    csv_to_sbdf as _csv_to_sbdf,
+    ColumnClock,
+    InferenceState,
+    SliceObserver,
+    SliceSizer,
+    column_slice_native_into,
     i32,
-    infer_type,
+    regroup_rows,
+    rows_to_sbdf_views,
     section,
     table_metadata,
+    table_slice,
+    table_slice_into,
+)
+from spotfire_community.sbdf._dbapi import (
+    DbApiCursor,
+    cursor_column_types,
+    cursor_columns,
+)
+from spotfire_community.sbdf._merge import (
+    TABLE_END,
+    concat_views,
+    slice_views,
+    table_end_offset,
+)
+from spotfire_community.sbdf._reader import SbdfReader, SbdfSource
+from spotfire_community.sbdf._stats import ColumnStats, instrumented_table_slice
+from spotfire_community.sbdf.errors import SbdfFormatError
+from spotfire_community.sbdf.models import (
+    SbdfColumnProfile,
+    SbdfColumnSlice,
+    SbdfColumnStats,
+    SbdfSliceIndex,
+    SbdfSliceProfile,
+    SbdfTableMetadata,
+    SbdfTableSlice,
+    ValueEncoding,
+    ValueType,
 )
 
 
-class ValueType(IntEnum):
-    """SBDF column value types supported by this package."""
+class TypeInferrer(InferenceState):
+    """Incremental column type inference over stringified rows.
 
-    BOOL = VT_BOOL
-    INT = VT_INT
-    LONG = VT_LONG
-    DOUBLE = VT_DOUBLE
-    DATETIME = VT_DATETIME
-    DATE = VT_DATE
-    STRING = VT_STRING
+    Feed rows with :meth:`observe` / :meth:`observe_rows` in any number of
+    batches; each value is checked only against the types its column can
+    still take, and memory stays constant in the number of rows. A column
+    whose type is known from elsewhere can be combined in with :meth:`widen`.
+
+    Example:
+        >>> inferrer = TypeInferrer(2)
+        >>> inferrer.observe(["1", "2024-01-01"])
+        >>> inferrer.observe(["2.5", ""])
+        >>> inferrer.column_types
+        [<ValueType.DOUBLE: 5>, <ValueType.DATE: 7>]
+    """
+
+    @property
+    def column_types(self) -> list[ValueType]:
+        """The narrowest :class:`ValueType` per column that fits every value so far."""
+        return [ValueType(t) for t in self.types]
 
 
 def infer_types(
@@ -57,6 +121,9 @@ def infer_types(
 ) -> list[ValueType]:
     """Infer a ``ValueType`` per column from a sample of stringified rows.
 
+    The rows are consumed in a single pass and are not materialised, so the
+    sample may be an arbitrarily long iterator.
+
     Args:
         sample_rows: Iterable of rows (each row a sequence of strings). Rows
             shorter than ``num_cols`` are padded with empty strings.
@@ -65,10 +132,53 @@ def infer_types(
     Returns:
         A list of ``num_cols`` :class:`ValueType` entries.
     """
-    samples = [
-        [row[i] if i < len(row) else "" for i in range(num_cols)] for row in sample_rows
-    ]
-    return [ValueType(infer_type([r[c] for r in samples])) for c in range(num_cols)]
+    inferrer = TypeInferrer(num_cols)
+    inferrer.observe_rows(sample_rows)
+    return inferrer.column_types
+
+
+SbdfSink = IO[bytes] | socket | bytearray | memoryview
+
+
+def _drain(chunks: Iterable[bytes | memoryview], sink: SbdfSink) -> int:
+    """Write every chunk to *sink*; return the number of bytes written.
+
+    A ``bytearray`` sink is appended to, a ``memoryview`` sink is filled from
+    the start, a socket gets ``sendall`` and anything else gets ``write``
+    (retried until short writes from raw files have been completed).
+
+    Raises:
+        ValueError: If a ``memoryview`` sink is too small for the output.
+    """
+    written = 0
+    if isinstance(sink, bytearray):
+        for chunk in chunks:
+            sink += chunk
+            written += len(chunk)
+        return written
+    if isinstance(sink, memoryview):
+        target = sink.cast("B")
+        for chunk in chunks:
+            end = written + len(chunk)
+            if end > len(target):
+                raise ValueError(
+                    f"SBDF output does not fit the {len(target)}-byte sink buffer"
+                )
+            target[written:end] = chunk
+            written = end
+        return written
+    if isinstance(sink, socket):
+        for chunk in chunks:
+            sink.sendall(chunk)
+            written += len(chunk)
+        return written
+    for chunk in chunks:
+        view = memoryview(chunk)
+        while view:
+            # Raw (unbuffered) files may write short; finish the chunk.
+            view = view[sink.write(view) :]
+        written += len(chunk)
+    return written
 
 
 class SbdfStreamingWriter:
@@ -98,36 +208,183 @@ class SbdfStreamingWriter:
             item_type=ItemType.SBDF,
         )
 
+    When the source already yields typed values, pass each batch to
+    :meth:`write_columns` (column-major, ``None`` for nulls) instead of
+    stringifying it for :meth:`write_slice`.
+
+    To avoid a ``bytes`` object per section, :meth:`write_slice_into` and
+    :meth:`write_columns_into` append to a caller-owned ``bytearray`` that
+    can be reused across slices, :meth:`views` yields :class:`memoryview`
+    chunks, and :meth:`write_to` streams the whole file into a file, socket
+    or preallocated buffer.
+
     Args:
         headers: Column names, in order.
         column_types: :class:`ValueType` per column. Must be the same length
             as ``headers``. Use :func:`infer_types` to derive these from a
             sample when the types are not known up front.
+        encodings: Optional :class:`ValueEncoding` per column, same length as
+            ``headers``. ``None`` (the default, per column or for all) picks
+            the smallest encoding for each slice: a bit array for Bool
+            columns, run-length when values repeat, plain otherwise.
+        record_index: Record the byte offset and first row of every table
+            slice, available as :attr:`slice_index` after :meth:`finish`.
+            Offsets assume every returned chunk is written out in order.
+        collect_stats: Summarise every column (row and null counts, min,
+            max, distinct estimate) from the values as they are encoded,
+            available as :attr:`column_stats` after :meth:`finish`.
+        profiler: Called with an :class:`SbdfSliceProfile` after every table
+            slice, breaking its encoding time down by column and phase
+            (parsing, packing, string encoding, bit arrays, value encoding).
+            Useful to find the columns that slow an export down. Without a
+            profiler no timings are taken.
 
     Raises:
-        ValueError: If ``headers`` and ``column_types`` have different lengths.
+        ValueError: If ``headers``, ``column_types`` and ``encodings`` have
+            different lengths, or a bit array is requested for a non-Bool
+            column.
     """
 
     def __init__(
         self,
         headers: Sequence[str],
         column_types: Sequence[ValueType],
+        *,
+        encodings: Sequence[ValueEncoding | None] | None = None,
+        record_index: bool = False,
+        collect_stats: bool = False,
+        profiler: Callable[[SbdfSliceProfile], None] | None = None,
     ) -> None:
         if len(headers) != len(column_types):
             raise ValueError(
                 f"headers ({len(headers)}) and column_types ({len(column_types)}) "
                 "must have the same length"
             )
+        if encodings is None:
+            encodings = [None] * len(headers)
+        if len(encodings) != len(headers):
+            raise ValueError(
+                f"headers ({len(headers)}) and encodings ({len(encodings)}) "
+                "must have the same length"
+            )
+        for name, vtype, enc in zip(headers, column_types, encodings):
+            if enc == ValueEncoding.BIT_ARRAY and vtype != ValueType.BOOL:
+                raise ValueError(
+                    f"Column {name!r}: bit-array encoding requires a BOOL column"
+                )
         self._headers = list(headers)
         self._vtypes = [int(t) for t in column_types]
+        self._encodings = [None if e is None else int(e) for e in encodings]
         self._num_cols = len(headers)
         self._started = False
         self._finished = False
+        self._record_index = record_index
+        self._offset = 0
+        self._row_count = 0
+        self._slice_offsets: list[int] = []
+        self._slice_first_rows: list[int] = []
+        self._stats = (
+            [ColumnStats(vtype) for vtype in self._vtypes] if collect_stats else None
+        )
+        self._profiler = profiler
+        self._slice_count = 0
 
     @property
     def headers(self) -> list[str]:
         return list(self._headers)
 
+    @property
+    def slice_index(self) -> SbdfSliceIndex:
+        """Offsets and row ranges of the slices written, for random access.
+
+        Save it with :meth:`SbdfSliceIndex.to_bytes` next to the file and pass
+        it to :meth:`SbdfReader.read_rows` to page through the table.
+
+        Raises:
+            RuntimeError: If the writer was created without
+                ``record_index=True`` or :meth:`finish` has not been called.
+        """
+        if not self._record_index:
+            raise RuntimeError(
+                "SbdfStreamingWriter.slice_index requires record_index=True"
+            )
+        if not self._finished:
+            raise RuntimeError("SbdfStreamingWriter.slice_index is set by finish()")
+        return SbdfSliceIndex(
+            offsets=list(self._slice_offsets),
+            first_rows=list(self._slice_first_rows),
+            row_count=self._row_count,
+            table_end=self._offset,
+        )
+
+    @property
+    def column_stats(self) -> list[SbdfColumnStats]:
+        """Per-column statistics of the values written, in column order.
+
+        Gathered from the packed values while slices are encoded, so checking
+        an export needs no second pass over the data.
+
+        Raises:
+            RuntimeError: If the writer was created without
+                ``collect_stats=True`` or :meth:`finish` has not been called.
+        """
+        if self._stats is None:
+            raise RuntimeError(
+                "SbdfStreamingWriter.column_stats requires collect_stats=True"
+            )
+        if not self._finished:
+            raise RuntimeError("SbdfStreamingWriter.column_stats is set by finish()")
+        return [stats.result() for stats in self._stats]
+
+    def _observers(self) -> list[SliceObserver] | None:
+        return None if self._stats is None else [s.observe for s in self._stats]
+
+    def _clocks(self) -> list[ColumnClock] | None:
+        return None if self._profiler is None else [ColumnClock() for _ in self._vtypes]
+
+    def _encoder(self) -> Callable[..., Any]:
+        """Slice encoder to run in an executor; see :meth:`_unpack`."""
+        if self._stats is None and self._profiler is None:
+            return table_slice
+        return partial(
+            instrumented_table_slice,
+            collect_stats=self._stats is not None,
+            profile=self._profiler is not None,
+        )
+
+    def _unpack(self, result: Any) -> tuple[bytes, list[ColumnClock] | None]:
+        """Split an :meth:`_encoder` result, folding in its statistics."""
+        if isinstance(result, bytes):
+            return result, None
+        encoded, partial_stats, clocks = result
+        for total, part in zip(self._stats or [], partial_stats or []):
+            total.merge(part)
+        return encoded, clocks
+
+    def _advance(
+        self, rows: int, nbytes: int, clocks: list[ColumnClock] | None = None
+    ) -> None:
+        """Account for a table slice of *rows* rows written as *nbytes* bytes."""
+        if not nbytes:
+            return
+        if self._profiler is not None and clocks is not None:
+            columns = [
+                SbdfColumnProfile(
+                    name, ValueType(vtype), **clock.seconds, nbytes=clock.nbytes
+                )
+                for name, vtype, clock in zip(self._headers, self._vtypes, clocks)
+            ]
+            seconds = sum(column.seconds for column in columns)
+            self._profiler(
+                SbdfSliceProfile(self._slice_count, rows, nbytes, seconds, columns)
+            )
+        self._slice_count += 1
+        if self._record_index:
+            self._slice_offsets.append(self._offset)
+            self._slice_first_rows.append(self._row_count)
+        self._offset += nbytes
+        self._row_count += rows
+
     @property
     def column_types(self) -> list[ValueType]:
         return [ValueType(t) for t in self._vtypes]
@@ -146,12 +403,14 @@ class SbdfStreamingWriter:
         if self._started:
             raise RuntimeError("SbdfStreamingWriter.start() called more than once")
         self._started = True
-        return (
+        header = (
             section(SID_FILE_HEADER)
             + bytes([1, 0])
             + section(SID_TABLE_METADATA)
             + table_metadata(self._headers, self._vtypes)
         )
+        self._offset = len(header)
+        return header
 
     def write_slice(self, rows: Sequence[Sequence[str]]) -> bytes:
         """Encode a batch of rows as one SBDF ``TableSlice`` section.
@@ -168,27 +427,122 @@ class SbdfStreamingWriter:
         Raises:
             RuntimeError: If called before :meth:`start` or after :meth:`finish`.
         """
-        if not self._started:
-            raise RuntimeError(
-                "SbdfStreamingWriter.write_slice() called before start()"
-            )
-        if self._finished:
-            raise RuntimeError(
-                "SbdfStreamingWriter.write_slice() called after finish()"
-            )
-        if not rows:
-            return b""
-        padded = [
-            [row[i] if i < len(row) else "" for i in range(self._num_cols)]
-            for row in rows
-        ]
         out = bytearray()
-        out += section(SID_TABLE_SLICE)
-        out += i32(self._num_cols)
-        for c in range(self._num_cols):
-            out += column_slice([r[c] for r in padded], self._vtypes[c])
+        self.write_slice_into(out, rows)
         return bytes(out)
 
+    def write_slice_into(self, buffer: bytearray, rows: Sequence[Sequence[str]]) -> int:
+        """Append the ``TableSlice`` for *rows* to *buffer*.
+
+        Same as :meth:`write_slice`, but encodes straight into a caller-owned
+        buffer instead of allocating a new ``bytes`` object.
+
+        Returns:
+            The number of bytes appended (0 if ``rows`` is empty).
+
+        Raises:
+            RuntimeError: If called before :meth:`start` or after :meth:`finish`.
+        """
+        self._check_writable("write_slice")
+        start = len(buffer)
+        clocks = self._clocks()
+        table_slice_into(
+            buffer, rows, self._vtypes, self._encodings, self._observers(), clocks
+        )
+        self._advance(len(rows), len(buffer) - start, clocks)
+        return len(buffer) - start
+
+    def write_columns(self, columns: Sequence[Sequence[Any]]) -> bytes:
+        """Encode natively typed columns as one SBDF ``TableSlice`` section.
+
+        Unlike :meth:`write_slice`, values are not parsed from strings, so
+        callers holding typed data (e.g. DB-API rows) skip the ``str()`` /
+        re-parse round-trip. Expected Python types per column:
+
+        * ``BOOL`` — ``bool``
+        * ``INT`` / ``LONG`` — ``int`` (or an integral ``float``; not ``bool``)
+        * ``DOUBLE`` — ``float`` (or ``int``)
+        * ``DATETIME`` — ``datetime`` (naive values are taken as UTC)
+        * ``DATE`` — ``date``
+        * ``STRING`` — ``str``
+        * ``FLOAT`` — ``float`` (rounded to single precision)
+        * ``TIME`` — naive ``time``
+        * ``TIMESPAN`` — ``timedelta``
+        * ``DECIMAL`` — ``Decimal`` (or ``int``)
+        * ``BINARY`` — ``bytes``
+
+        ``None`` marks a null, and a value of another type is written as an
+        invalid (null) cell rather than coerced. ``INT``, ``LONG``, ``FLOAT`` and ``DOUBLE``
+        columns may also be passed as ``array.array`` (typecodes ``"i"``,
+        ``"q"``, ``"f"``, ``"d"``) or any buffer-protocol object of matching
+        item size, which is copied without per-value conversion.
+
+        Args:
+            columns: One sequence of values per column, all the same length.
+
+        Returns:
+            The bytes for a single ``TableSlice`` section. May be empty if the
+            columns hold no rows, in which case no section is written.
+
+        Raises:
+            ValueError: If the number of columns does not match the writer, or
+                the columns have different lengths.
+            RuntimeError: If called before :meth:`start` or after :meth:`finish`.
+        """
+        out = bytearray()
+        self.write_columns_into(out, columns)
+        return bytes(out)
+
+    def write_columns_into(
+        self, buffer: bytearray, columns: Sequence[Sequence[Any]]
+    ) -> int:
+        """Append the ``TableSlice`` for typed *columns* to *buffer*.
+
+        Same as :meth:`write_columns`, but encodes straight into a
+        caller-owned buffer instead of allocating a new ``bytes`` object.
+
+        Returns:
+            The number of bytes appended (0 if the columns hold no rows).
+
+        Raises:
+            ValueError: If the number of columns does not match the writer, or
+                the columns have different lengths.
+            RuntimeError: If called before :meth:`start` or after :meth:`finish`.
+        """
+        self._check_writable("write_columns")
+        if len(columns) != self._num_cols:
+            raise ValueError(f"expected {self._num_cols} columns, got {len(columns)}")
+        lengths = {len(col) for col in columns}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"columns must have the same length, got {sorted(lengths)}"
+            )
+        if not lengths or lengths == {0}:
+            return 0
+        start = len(buffer)
+        buffer += section(SID_TABLE_SLICE)
+        buffer += i32(self._num_cols)
+        observers = self._observers() or [None] * self._num_cols
+        clocks = self._clocks()
+        for c, (col, vtype, enc) in enumerate(
+            zip(columns, self._vtypes, self._encodings)
+        ):
+            if clocks is None:
+                column_slice_native_into(buffer, col, vtype, enc, observers[c])
+                continue
+            clock, column_start = clocks[c], len(buffer)
+            clock.start()
+            column_slice_native_into(buffer, col, vtype, enc, observers[c], clock)
+            clock.nbytes += len(buffer) - column_start
+        self._advance(lengths.pop(), len(buffer) - start, clocks)
+        return len(buffer) - start
+
+    def _check_writable(self, method: str) -> None:
+        if not self._started:
+            raise RuntimeError(f"SbdfStreamingWriter.{method}() called before start()")
+        if self._finished:
+            raise RuntimeError(f"SbdfStreamingWriter.{method}() called after finish()")
+
     def finish(self) -> bytes:
         """Emit the ``TableEnd`` marker. Must be called exactly once, last.
 
@@ -208,6 +562,10 @@ class SbdfStreamingWriter:
     def chunks(
         self,
         row_batches: Iterable[Sequence[Sequence[str]]],
+        *,
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+        slice_bytes: int | None = None,
     ) -> Iterator[bytes]:
         """Yield SBDF bytes for an entire file, one section at a time.
 
@@ -215,28 +573,591 @@ class SbdfStreamingWriter:
         per batch, then :meth:`finish`. Each yielded chunk is a complete SBDF
         section — safe to forward directly to a chunked upload API.
 
+        With ``workers`` > 1, batches are encoded in a process pool instead of
+        on the calling thread. At most ``max_in_flight`` batches are submitted
+        ahead of the consumer, which bounds memory, and chunks are still
+        yielded in input order. Batches must be picklable.
+
+        With ``slice_bytes``, incoming rows are regrouped across batches so
+        that each ``TableSlice`` comes out at roughly that many bytes: the
+        first slice has as many rows as the first batch, and later slice row
+        counts follow the encoded bytes per row of recent slices. This keeps
+        memory and upload chunk sizes predictable whether columns are narrow
+        numbers or wide strings.
+
         Args:
             row_batches: Iterable of row batches. Each batch becomes one
-                ``TableSlice``. Empty batches are skipped silently.
+                ``TableSlice`` unless ``slice_bytes`` is given. Empty batches
+                are skipped silently.
+            workers: Number of worker processes. ``None`` or ``1`` encodes
+                on the calling thread.
+            max_in_flight: Maximum number of batches queued or being encoded
+                at once. Defaults to ``2 * workers``.
+            slice_bytes: Target encoded size of each ``TableSlice``, in bytes.
+                ``None`` keeps the input batching.
 
         Yields:
             Non-empty :class:`bytes` chunks of SBDF data.
+
+        Raises:
+            ValueError: If ``workers``, ``max_in_flight`` or ``slice_bytes``
+                is less than 1.
         """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        row_batches, sizer = _adaptive_batches(row_batches, slice_bytes)
+
         yield self.start()
-        for batch in row_batches:
-            slice_bytes = self.write_slice(batch)
-            if slice_bytes:
-                yield slice_bytes
+        if workers is None or workers == 1:
+            for batch in row_batches:
+                encoded = self.write_slice(batch)
+                if sizer is not None:
+                    sizer.observe(len(batch), len(encoded))
+                if encoded:
+                    yield encoded
+        else:
+            yield from self._parallel_slices(
+                row_batches, workers, max_in_flight or 2 * workers, sizer
+            )
+        yield self.finish()
+
+    async def achunks(
+        self,
+        row_batches: AsyncIterable[Sequence[Sequence[str]]],
+        *,
+        executor: Executor | None = None,
+        max_in_flight: int = 2,
+    ) -> AsyncIterator[bytes]:
+        """Async counterpart of :meth:`chunks` for asyncio row sources.
+
+        Each batch from *row_batches* (e.g. an async database cursor) is
+        encoded in *executor*, so the event loop is never blocked by slice
+        encoding and the next batch is fetched while earlier ones are being
+        encoded. Up to *max_in_flight* batches are encoded at once; chunks are
+        yielded in input order. A batch must not be modified after it has
+        been yielded to the writer.
+
+        Example::
+
+            async def batches():
+                async for rows in cursor.fetch_batches(10_000):
+                    yield [[str(v) for v in row] for row in rows]
+
+            async for chunk in writer.achunks(batches()):
+                await sink.write(chunk)
+
+        Args:
+            row_batches: Async iterable of row batches, one ``TableSlice``
+                each. Empty batches are skipped silently.
+            executor: Where slices are encoded. ``None`` uses the event loop's
+                default thread pool; a ``ProcessPoolExecutor`` also encodes in
+                parallel, in which case batches must be picklable.
+            max_in_flight: Maximum number of batches being encoded at once.
+
+        Yields:
+            Non-empty :class:`bytes` chunks of SBDF data.
+
+        Raises:
+            ValueError: If ``max_in_flight`` is less than 1.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        loop = asyncio.get_running_loop()
+        pending: deque[tuple[asyncio.Future[Any], int]] = deque()
+
+        async def collect() -> bytes:
+            future, rows = pending.popleft()
+            encoded, clocks = self._unpack(await future)
+            self._advance(rows, len(encoded), clocks)
+            return encoded
+
+        yield self.start()
+        try:
+            async for batch in row_batches:
+                if not batch:
+                    continue
+                future = loop.run_in_executor(
+                    executor, self._encoder(), batch, self._vtypes, self._encodings
+                )
+                pending.append((future, len(batch)))
+                if len(pending) >= max_in_flight:
+                    yield await collect()
+            while pending:
+                yield await collect()
+        finally:
+            # Consumer stopped early or a batch failed: drop queued work.
+            for future, _ in pending:
+                future.cancel()
         yield self.finish()
 
+    def views(
+        self,
+        row_batches: Iterable[Sequence[Sequence[str]]],
+        *,
+        slice_bytes: int | None = None,
+    ) -> Iterator[memoryview]:
+        """Like :meth:`chunks`, but yield read-only :class:`memoryview` chunks.
+
+        Each table slice is encoded straight into its own buffer and handed
+        out without the copy to ``bytes`` that :meth:`chunks` makes, which
+        suits sinks that accept any buffer (``file.write``, ``socket.send``).
+        ``slice_bytes`` regroups rows as in :meth:`chunks`.
+
+        Yields:
+            Non-empty :class:`memoryview` chunks of SBDF data.
+        """
+        row_batches, sizer = _adaptive_batches(row_batches, slice_bytes)
+        yield memoryview(self.start())
+        for batch in row_batches:
+            out = bytearray()
+            n = self.write_slice_into(out, batch)
+            if sizer is not None:
+                sizer.observe(len(batch), n)
+            if n:
+                yield memoryview(out).toreadonly()
+        yield memoryview(self.finish())
+
+    def write_to(
+        self,
+        sink: SbdfSink,
+        row_batches: Iterable[Sequence[Sequence[str]]],
+        *,
+        slice_bytes: int | None = None,
+    ) -> int:
+        """Encode an entire file from *row_batches* straight into *sink*.
+
+        Args:
+            sink: A writable binary file object, a connected socket, a
+                ``bytearray`` (appended to) or a preallocated writable
+                ``memoryview`` (filled from the start).
+            row_batches: Iterable of row batches, as for :meth:`chunks`.
+            slice_bytes: Target encoded size per ``TableSlice``, as for
+                :meth:`chunks`.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            ValueError: If a ``memoryview`` sink is too small for the file,
+                or ``slice_bytes`` is less than 1.
+        """
+        return _drain(self.views(row_batches, slice_bytes=slice_bytes), sink)
+
+    def _parallel_slices(
+        self,
+        row_batches: Iterable[Sequence[Sequence[str]]],
+        workers: int,
+        max_in_flight: int,
+        sizer: SliceSizer | None = None,
+    ) -> Iterator[bytes]:
+        pending: deque[tuple[Future[Any], int]] = deque()
+
+        def collect() -> bytes:
+            future, rows = pending.popleft()
+            encoded, clocks = self._unpack(future.result())
+            self._advance(rows, len(encoded), clocks)
+            if sizer is not None:
+                # Estimates lag by up to max_in_flight slices.
+                sizer.observe(rows, len(encoded))
+            return encoded
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            try:
+                for batch in row_batches:
+                    if not batch:
+                        continue
+                    future = pool.submit(
+                        self._encoder(), batch, self._vtypes, self._encodings
+                    )
+                    pending.append((future, len(batch)))
+                    if len(pending) >= max_in_flight:
+                        yield collect()
+                while pending:
+                    yield collect()
+            finally:
+                # Consumer stopped early or a batch failed: drop queued work.
+                for future, _ in pending:
+                    future.cancel()
+
+
+def _adaptive_batches(
+    row_batches: Iterable[Sequence[Sequence[str]]], slice_bytes: int | None
+) -> tuple[Iterable[Sequence[Sequence[str]]], SliceSizer | None]:
+    """Regroup *row_batches* to a byte budget; a no-op without *slice_bytes*."""
+    if slice_bytes is None:
+        return row_batches, None
+    it = iter(row_batches)
+    first = next((b for b in it if b), None)
+    if first is None:
+        return [], SliceSizer(slice_bytes)
+    sizer = SliceSizer(slice_bytes, initial_rows=len(first))
+    return regroup_rows(chain([first], it), sizer), sizer
+
+
+SbdfInput = io.IOBase | Iterable[Sequence[str]]
+
+
+def _iter_rows(data: SbdfInput) -> Iterator[Sequence[str]]:
+    """Yield CSV rows lazily from any input accepted by :func:`create_sbdf`."""
+    if isinstance(data, (str, bytes)):
+        raise TypeError(
+            f"create_sbdf() does not accept {type(data).__name__!r}; "
+            "pass a file-like object or csv.reader."
+        )
+
+    # Text-mode file-like (io.StringIO, open(...) in text mode, etc.).
+    if isinstance(data, io.TextIOBase):
+        yield from csv.reader(data)
+        return
+
+    # Binary file-like (io.BytesIO, open(..., "rb"), raw streams): decode as
+    # UTF-8 on the fly. The wrappers are detached afterwards so the caller's
+    # file object is left open.
+    if isinstance(data, (io.BufferedIOBase, io.RawIOBase)):
+        buffered = (
+            data if isinstance(data, io.BufferedIOBase) else io.BufferedReader(data)
+        )
+        text = io.TextIOWrapper(buffered, encoding="utf-8", newline="")  # type: ignore[arg-type]
+        try:
+            yield from csv.reader(text)
+        finally:
+            text.detach()
+            if buffered is not data:
+                buffered.detach()
+        return
+
+    # Fallback: iterable of rows (e.g. csv.reader). Non-str cells are
+    # stringified as csv.writer would (None -> ""), since the encoders parse
+    # text.
+    for row in cast(Iterable[Sequence[object]], data):
+        if all(type(v) is str for v in row):
+            yield cast(Sequence[str], row)
+        else:
+            yield ["" if v is None else str(v) for v in row]
+
+
+def _full_scan_views(
+    data: io.IOBase, chunk_size: int, slice_bytes: int | None
+) -> Iterator[memoryview]:
+    """Infer types from every row of seekable *data*, rewind, then encode it."""
+    start = data.tell()
+    rows = _iter_rows(data)
+    header = next(rows, None)
+    column_types: list[int] | None = None
+    if header is not None:
+        inferrer = InferenceState(len(header))
+        inferrer.observe_rows(rows)
+        column_types = inferrer.types
+    data.seek(start)
+    yield from rows_to_sbdf_views(
+        _iter_rows(data),
+        chunk_size,
+        column_types=column_types,
+        slice_bytes=slice_bytes,
+    )
+
+
+def _sbdf_views(
+    data: SbdfInput,
+    chunk_size: int,
+    sample_rows: int | None,
+    slice_bytes: int | None = None,
+) -> Iterator[memoryview]:
+    if slice_bytes is not None and slice_bytes < 1:
+        raise ValueError("slice_bytes must be at least 1")
+    if sample_rows is not None:
+        return rows_to_sbdf_views(
+            _iter_rows(data), chunk_size, sample_rows, slice_bytes=slice_bytes
+        )
+    if not (isinstance(data, io.IOBase) and data.seekable()):
+        raise ValueError("sample_rows=None requires a seekable file object")
+    return _full_scan_views(data, chunk_size, slice_bytes)
+
+
+def create_sbdf_chunks(
+    data: SbdfInput,
+    chunk_size: int = 10_000,
+    *,
+    sample_rows: int | None = 1_000,
+    slice_bytes: int | None = None,
+) -> Iterator[bytes]:
+    """Convert tabular data to SBDF, yielding the file one section at a time.
+
+    The streaming counterpart of :func:`create_sbdf`: input is read lazily
+    and each chunk is yielded as soon as it is encoded, so memory stays
+    bounded by ``chunk_size`` (and the inference sample) regardless of the
+    input size. The chunks can be passed straight to
+    ``LibraryClient.upload_file_streaming``.
+
+    Args:
+        data: Same inputs as :func:`create_sbdf`, plus binary file objects,
+            which are decoded as UTF-8.
+        chunk_size: Number of rows per SBDF table slice.
+        sample_rows: Number of leading rows used to infer column types, or
+            ``None`` to infer from the whole input. The whole-input scan makes
+            a separate inference pass and then rewinds, so it requires a
+            seekable file object.
+        slice_bytes: Target encoded size of each table slice, in bytes. When
+            given, ``chunk_size`` is only the row count of the first slice;
+            later slices are sized from the bytes per row observed so far
+            (capped at one million rows).
+
+    Yields:
+        Non-empty :class:`bytes` chunks of SBDF data.
+
+    Raises:
+        TypeError: If *data* is not a supported type.
+        ValueError: If the input has no header row, ``chunk_size`` or
+            ``slice_bytes`` < 1, or ``sample_rows`` is ``None`` and *data* is
+            not seekable.
+    """
+    return map(bytes, _sbdf_views(data, chunk_size, sample_rows, slice_bytes))
+
+
+def write_sbdf(
+    data: SbdfInput,
+    sink: SbdfSink,
+    chunk_size: int = 10_000,
+    *,
+    sample_rows: int | None = 1_000,
+    slice_bytes: int | None = None,
+) -> int:
+    """Convert tabular data to SBDF and write it to a binary sink.
+
+    Streams like :func:`create_sbdf_chunks`; nothing beyond one slice is
+    buffered, and slices are written from their encoding buffer without an
+    intermediate ``bytes`` copy.
+
+    Args:
+        data: Same inputs as :func:`create_sbdf_chunks`.
+        sink: Writable binary file object, connected socket, ``bytearray``
+            (appended to) or preallocated writable ``memoryview`` (filled
+            from the start).
+        chunk_size: Number of rows per SBDF table slice.
+        sample_rows: Number of leading rows used to infer column types, or
+            ``None`` to scan a seekable input in full first.
+        slice_bytes: Target encoded size of each table slice, as for
+            :func:`create_sbdf_chunks`.
+
+    Returns:
+        The number of bytes written.
+
+    Raises:
+        ValueError: As for :func:`create_sbdf_chunks`, or if a ``memoryview``
+            sink is too small for the output.
+    """
+    return _drain(_sbdf_views(data, chunk_size, sample_rows, slice_bytes), sink)
+
+
+def from_arrow(data: Any, chunk_size: int = 10_000) -> Iterator[bytes]:
+    """Convert a pandas DataFrame or Arrow data to SBDF, one section at a time.
+
+    Column types are mapped from the Arrow schema instead of being inferred
+    (booleans → ``BOOL``; integers up to 32 bits → ``INT``, wider → ``LONG``;
+    64-bit floats → ``DOUBLE``, narrower → ``FLOAT``; timestamps →
+    ``DATETIME``; dates → ``DATE``; times → ``TIME``; durations →
+    ``TIMESPAN``; decimals → ``DECIMAL``; binary → ``BINARY``; strings and
+    dictionary-encoded strings → ``STRING``). Values are read from the
+    Arrow buffers directly and nulls become IsInvalid entries. Each record
+    batch is written as one or more table slices of at most ``chunk_size``
+    rows, so record-batch streams are converted without being collected.
+
+    Requires ``pyarrow`` (``pip install spotfire-community[arrow]``), which is
+    imported on the first call only.
+
+    Args:
+        data: A ``pyarrow.Table``, ``RecordBatch`` or ``RecordBatchReader``,
+            any object exporting the Arrow C stream interface, or a
+            ``pandas.DataFrame`` (its index is not written).
+        chunk_size: Maximum number of rows per SBDF table slice.
+
+    Yields:
+        Non-empty :class:`bytes` chunks of SBDF data.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+        TypeError: If *data* is not a supported type or has a column type
+            with no SBDF equivalent (nested types such as list, struct and
+            map, unions, intervals and fixed-size binary).
+        ValueError: If ``chunk_size`` < 1.
+
+        All are raised by this call, not by the iterator.
+    """
+    from spotfire_community.sbdf._arrow import arrow_to_sbdf_views
+
+    return map(bytes, arrow_to_sbdf_views(data, chunk_size))
+
+
+def from_cursor(
+    cursor: DbApiCursor,
+    batch_size: int = 10_000,
+    *,
+    column_types: Sequence[ValueType] | None = None,
+) -> Iterator[bytes]:
+    """Stream the result set of an executed DB-API cursor as SBDF chunks.
+
+    Column names come from ``cursor.description``. Types are mapped from its
+    type codes where the driver reports Python types or SQL type names and
+    they fit the first batch's values, and otherwise from the Python types of
+    those values (mixed ``int`` and ``float`` give ``DOUBLE``). Values in
+    later batches that do not fit a column's type are written as nulls, not
+    truncated. Time-zone aware ``time`` values are written in UTC. Rows are
+    pulled with ``fetchmany(batch_size)`` and each batch is encoded from its
+    native values (see :meth:`SbdfStreamingWriter.write_columns`) as one
+    table slice, so nothing is stringified and memory stays bounded by the
+    batch. The chunks can be passed straight to
+    ``LibraryClient.upload_file_streaming``::
+
+        cursor.execute("SELECT id, name, created FROM orders")
+        library_client.upload_file_streaming(
+            data_stream=from_cursor(cursor),
+            path="/Data/orders.sbdf",
+            item_type=ItemType.SBDF,
+        )
+
+    Args:
+        cursor: A PEP 249 cursor on which a query has been executed.
+        batch_size: Rows per ``fetchmany`` call and per SBDF table slice.
+        column_types: Explicit :class:`ValueType` per column, overriding the
+            mapping. Values that do not fit a type are written as nulls.
+
+    Returns:
+        An iterator of non-empty :class:`bytes` chunks of SBDF data. No rows
+        are fetched before the first chunk is requested.
+
+    Raises:
+        ValueError: If the cursor has no result set, ``batch_size`` < 1, or
+            ``column_types`` does not match the number of columns. Raised by
+            this call, not by the iterator.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    description = cursor.description
+    if description is None:
+        raise ValueError("Cursor has no result set; execute a query first")
+    if column_types is not None and len(column_types) != len(description):
+        raise ValueError(
+            f"Cursor has {len(description)} columns but "
+            f"{len(column_types)} types were given"
+        )
+    return _cursor_chunks(cursor, description, batch_size, column_types)
+
+
+def _cursor_chunks(
+    cursor: DbApiCursor,
+    description: Sequence[Sequence[Any]],
+    batch_size: int,
+    column_types: Sequence[ValueType] | None,
+) -> Iterator[bytes]:
+    """The generator behind :func:`from_cursor`, after argument checks."""
+    rows = cursor.fetchmany(batch_size)
+    if column_types is None:
+        column_types = cursor_column_types(description, rows)
+    writer = SbdfStreamingWriter(
+        headers=[str(column[0]) for column in description],
+        column_types=column_types,
+    )
+    yield writer.start()
+    while rows:
+        yield writer.write_columns(cursor_columns(rows, column_types))
+        rows = cursor.fetchmany(batch_size)
+    yield writer.finish()
+
+
+def write_dataframe(data: Any, sink: SbdfSink, chunk_size: int = 10_000) -> int:
+    """Write a pandas DataFrame or Arrow data to *sink* as SBDF.
+
+    The sink counterpart of :func:`from_arrow`, accepting the same *data*
+    and the same sinks as :func:`write_sbdf`.
+
+    Returns:
+        The number of bytes written.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+        TypeError: As for :func:`from_arrow`.
+        ValueError: If ``chunk_size`` < 1 or a ``memoryview`` sink is too
+            small for the output.
+    """
+    from spotfire_community.sbdf._arrow import arrow_to_sbdf_views
+
+    return _drain(arrow_to_sbdf_views(data, chunk_size), sink)
+
+
+def concat_sbdf(sources: Iterable[SbdfSource], sink: SbdfSink) -> int:
+    """Concatenate SBDF files with identical columns into one, without decoding.
+
+    The first source's file header and table metadata are written, followed
+    by the ``TableSlice`` sections of every source copied verbatim and a
+    single ``TableEnd``. Only the metadata of each source is parsed, so this
+    runs at roughly the speed of copying the files.
+
+    Args:
+        sources: Binary file objects or buffers, each a complete SBDF file.
+            File objects are read sequentially and need not be seekable.
+        sink: Any sink accepted by :func:`write_sbdf`.
+
+    Returns:
+        The number of bytes written.
+
+    Raises:
+        ValueError: If *sources* is empty, a source's column names or types
+            differ from the first source's, or a ``memoryview`` sink is too
+            small for the output.
+        SbdfFormatError: If a source has malformed metadata or does not end
+            with a ``TableEnd`` section. Slice contents are not validated.
+    """
+    return _drain(concat_views(sources), sink)
+
+
+def append_sbdf(target: IO[bytes], sources: Iterable[SbdfSource]) -> int:
+    """Append the table slices of *sources* to an existing SBDF file in place.
+
+    Only the trailing ``TableEnd`` of *target* is rewritten: slices from
+    each source are copied verbatim after the existing ones, then a new
+    ``TableEnd`` is written. To append freshly encoded rows, write them with
+    :class:`SbdfStreamingWriter` into a buffer and pass that as a source.
+
+    If a source fails validation part-way through, *target* is restored to
+    its original content before the error propagates.
+
+    Args:
+        target: Seekable binary file opened for reading and writing
+            (e.g. ``open(path, "r+b")``).
+        sources: SBDF files or buffers with the same column names and types
+            as *target*.
+
+    Returns:
+        The number of bytes written, including the new ``TableEnd``.
+
+    Raises:
+        ValueError: If a source's columns differ from *target*'s.
+        SbdfFormatError: If *target* or a source is malformed or does not end
+            with a ``TableEnd`` section.
+    """
+    metadata, end = table_end_offset(target)
+    target.seek(end)
+    try:
+        written = _drain(chain(slice_views(sources, metadata), [TABLE_END]), target)
+    except BaseException:
+        target.seek(end)
+        target.write(TABLE_END)
+        target.truncate()
+        raise
+    target.truncate()
+    return written
+
 
 def create_sbdf(
-    data: io.IOBase | Iterable[Sequence[str]],
+    data: SbdfInput,
     chunk_size: int = 10_000,
 ) -> bytes:
     """Convert tabular data to SBDF bytes (one-shot, in-memory).
 
-    For large tables use :class:`SbdfStreamingWriter` instead.
+    For large tables use :func:`create_sbdf_chunks`, :func:`write_sbdf` or
+    :class:`SbdfStreamingWriter` instead.
 
     Args:
         data: Either a text-mode file-like object (e.g. ``open("f.csv")``,
@@ -252,36 +1173,32 @@ def create_sbdf(
         TypeError: If *data* is not a supported type.
         ValueError: If the CSV cannot be parsed or the SBDF cannot be written.
     """
-    if isinstance(data, (str, bytes)):
-        raise TypeError(
-            f"create_sbdf() does not accept {type(data).__name__!r}; "
-            "pass a file-like object or csv.reader."
-        )
-
-    # Text-mode file-like (io.StringIO, open(...) in text mode, etc.).
-    if isinstance(data, io.TextIOBase):
-        return _csv_to_sbdf(data.read().encode(), chunk_size)
-
-    # Binary buffered file-like (io.BytesIO, open(..., "rb"), etc.).
-    if isinstance(data, io.BufferedIOBase):
-        return _csv_to_sbdf(data.read(), chunk_size)
-
-    # Raw binary file-like.
-    if isinstance(data, io.RawIOBase):
-        raw = data.read()
-        return _csv_to_sbdf(raw if raw is not None else b"", chunk_size)
-
-    # Fallback: iterable of rows (e.g. csv.reader).
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    for row in data:
-        writer.writerow(row)
-    return _csv_to_sbdf(buf.getvalue().encode(), chunk_size)
+    out = bytearray()
+    write_sbdf(data, out, chunk_size)
+    return bytes(out)
 
 
 __all__ = [
+    "SbdfColumnProfile",
+    "SbdfColumnSlice",
+    "SbdfColumnStats",
+    "SbdfFormatError",
+    "SbdfReader",
+    "SbdfSliceIndex",
+    "SbdfSliceProfile",
     "SbdfStreamingWriter",
+    "SbdfTableMetadata",
+    "SbdfTableSlice",
+    "TypeInferrer",
+    "ValueEncoding",
     "ValueType",
+    "append_sbdf",
+    "concat_sbdf",
     "create_sbdf",
+    "create_sbdf_chunks",
+    "from_arrow",
+    "from_cursor",
     "infer_types",
+    "write_dataframe",
+    "write_sbdf",
 ]
@@ -0,0 +1,360 @@
+# PyArrow ships without type information; its objects are handled as Any.
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportMissingTypeStubs=false
+"""Arrow / pandas → SBDF adapter.
+
+Internal module. :func:`spotfire_community.sbdf.from_arrow` and
+:func:`spotfire_community.sbdf.write_dataframe` import it on first use, so
+PyArrow (and NumPy) are only needed by callers of those entry points.
+
+Column types come from the Arrow schema rather than from inference, and each
+column is encoded from its Arrow buffers through NumPy: values, validity
+bitmap and string offsets are read in place instead of being converted to
+Python objects. Output is byte-identical to encoding the same values through
+:meth:`~spotfire_community.sbdf.SbdfStreamingWriter.write_columns`.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError as e:  # pragma: no cover - exercised without pyarrow only
+    raise ImportError(
+        "Arrow/pandas support requires pyarrow; "
+        "install it with `pip install spotfire-community[arrow]`."
+    ) from e
+
+from spotfire_community.sbdf import _vectorized
+from spotfire_community.sbdf._writer import (
+    SID_FILE_HEADER,
+    SID_TABLE_END,
+    SID_TABLE_METADATA,
+    SID_TABLE_SLICE,
+    VT_BINARY,
+    VT_BOOL,
+    VT_DATE,
+    VT_DATETIME,
+    VT_DECIMAL,
+    VT_DOUBLE,
+    VT_FLOAT,
+    VT_INT,
+    VT_LONG,
+    VT_STRING,
+    VT_TIME,
+    VT_TIMESPAN,
+    decimal_value_bytes,
+    i32,
+    packed_column_slice_into,
+    section,
+    table_metadata,
+)
+
+_MS_PER_DAY = 86_400_000
+# Days from the SBDF epoch (0001-01-01) to the Unix epoch (1970-01-01).
+_UNIX_EPOCH_DAYS = 719_162
+
+# Arrow timestamp unit → (multiplier, divisor) to milliseconds. Division
+# floors, matching the writer's handling of sub-millisecond datetimes.
+_TIMESTAMP_TO_MS = {"s": (1000, 1), "ms": (1, 1), "us": (1, 1000), "ns": (1, 1_000_000)}
+
+# Widest decimal precision whose unscaled values always fit the 113-bit
+# coefficient of an SBDF Decimal without rounding.
+_DECIMAL_MAX_PRECISION = 34
+_DECIMAL_BIAS = 6176
+
+
+def sbdf_type(arrow_type: Any) -> int:
+    """Map an Arrow data type to the SBDF value type it is written as.
+
+    Raises:
+        TypeError: If the Arrow type has no SBDF equivalent in this writer.
+    """
+    types = pa.types
+    if types.is_dictionary(arrow_type):
+        return sbdf_type(arrow_type.value_type)
+    if types.is_boolean(arrow_type):
+        return VT_BOOL
+    if types.is_integer(arrow_type):
+        # Int holds up to 32 signed bits; everything wider goes to Long.
+        signed = types.is_signed_integer(arrow_type)
+        return VT_INT if arrow_type.bit_width < (64 if signed else 32) else VT_LONG
+    if types.is_floating(arrow_type):
+        return VT_DOUBLE if arrow_type.bit_width == 64 else VT_FLOAT
+    if types.is_timestamp(arrow_type):
+        return VT_DATETIME
+    if types.is_date(arrow_type):
+        return VT_DATE
+    if types.is_time(arrow_type):
+        return VT_TIME
+    if types.is_duration(arrow_type):
+        return VT_TIMESPAN
+    if types.is_decimal(arrow_type):
+        return VT_DECIMAL
+    if (
+        types.is_string(arrow_type)
+        or types.is_large_string(arrow_type)
+        or types.is_string_view(arrow_type)
+        or types.is_null(arrow_type)
+    ):
+        return VT_STRING
+    if (
+        types.is_binary(arrow_type)
+        or types.is_large_binary(arrow_type)
+        or types.is_binary_view(arrow_type)
+    ):
+        return VT_BINARY
+    raise TypeError(f"Arrow type {arrow_type} has no SBDF equivalent")
+
+
+def _null_mask(arr: Any) -> np.ndarray | None:
+    """Boolean mask of null slots, read from the validity bitmap."""
+    if pa.types.is_null(arr.type):
+        return np.ones(len(arr), dtype=np.bool_)
+    if arr.null_count == 0:
+        return None
+    bitmap = np.frombuffer(arr.buffers()[0], dtype=np.uint8)
+    valid = np.unpackbits(bitmap, count=arr.offset + len(arr), bitorder="little")
+    return valid[arr.offset :] == 0
+
+
+def _fixed_values(arr: Any) -> np.ndarray:
+    """View the value buffer of a primitive array as a NumPy array (no copy)."""
+    n = len(arr)
+    buf = arr.buffers()[1]
+    if pa.types.is_boolean(arr.type):
+        bits = np.frombuffer(buf, dtype=np.uint8)
+        return np.unpackbits(bits, count=arr.offset + n, bitorder="little")[
+            arr.offset :
+        ]
+    if pa.types.is_floating(arr.type):
+        kind = "f"
+    elif pa.types.is_unsigned_integer(arr.type):
+        kind = "u"
+    else:  # signed integers, timestamps, dates, times and durations
+        kind = "i"
+    width = arr.type.bit_width // 8
+    return np.frombuffer(
+        buf, dtype=f"<{kind}{width}", count=n, offset=arr.offset * width
+    )
+
+
+def _fixed_payload(
+    arr: Any, vtype: int, nulls: np.ndarray | None
+) -> tuple[bytes, np.ndarray | None]:
+    """Pack a primitive column in SBDF layout; return ``(payload, invalid)``.
+
+    Null slots (whatever their buffer holds) and values outside the SBDF
+    type's range are written as 0 and reported in the invalid mask, as the
+    row-based writer does for unparseable cells.
+    """
+    values = _fixed_values(arr)
+    invalid = nulls
+    if vtype == VT_BOOL:
+        packed = values.astype("?")
+    elif vtype == VT_DOUBLE:
+        packed = values.astype("<f8")
+    elif vtype == VT_FLOAT:
+        packed = values.astype("<f4")
+    elif vtype == VT_INT:
+        packed = values.astype("<i4")  # only types of at most 32 bits map here
+    elif vtype == VT_LONG:
+        if values.dtype == np.uint64:
+            too_big = values > np.uint64(2**63 - 1)
+            if too_big.any():
+                invalid = too_big if invalid is None else invalid | too_big
+        packed = values.astype("<i8")
+    elif vtype == VT_DATETIME:
+        mul, div = _TIMESTAMP_TO_MS[arr.type.unit]
+        ms = values.astype("<i8") * mul // div
+        packed = ms + _UNIX_EPOCH_DAYS * _MS_PER_DAY
+    elif vtype == VT_TIME:  # never negative, so floor division truncates
+        mul, div = _TIMESTAMP_TO_MS[arr.type.unit]
+        packed = values.astype("<i8") * mul // div
+    elif vtype == VT_TIMESPAN:  # truncate toward zero, as for timedelta
+        mul, div = _TIMESTAMP_TO_MS[arr.type.unit]
+        ticks = values.astype("<i8") * mul
+        packed = np.sign(ticks) * (np.abs(ticks) // div)
+    else:  # VT_DATE: date32 counts days, date64 counts milliseconds
+        days_or_ms = values.astype("<i8")
+        if pa.types.is_date32(arr.type):
+            days_or_ms = days_or_ms * _MS_PER_DAY
+        packed = days_or_ms + _UNIX_EPOCH_DAYS * _MS_PER_DAY
+    if invalid is not None:
+        packed = np.where(invalid, 0, packed).astype(packed.dtype)
+    return packed.tobytes(), invalid
+
+
+def _decimal_payload(
+    arr: Any, nulls: np.ndarray | None
+) -> tuple[bytes, np.ndarray | None]:
+    """Re-pack Arrow decimals as SBDF decimal128 (BID) cells.
+
+    Arrow stores a two's complement unscaled integer and a fixed scale per
+    column; SBDF stores sign, exponent and magnitude per value. Columns wider
+    than 34 digits (or not 128-bit) may need rounding and go through the
+    row-based converter instead.
+    """
+    n = len(arr)
+    if (
+        not pa.types.is_decimal128(arr.type)
+        or arr.type.precision > _DECIMAL_MAX_PRECISION
+    ):
+        cells = [
+            bytes(16) if v is None else decimal_value_bytes(v) for v in arr.to_pylist()
+        ]
+        return b"".join(cells), nulls
+    words = np.frombuffer(
+        arr.buffers()[1], dtype="<u8", count=2 * n, offset=arr.offset * 16
+    ).reshape(n, 2)
+    lo, hi = words[:, 0], words[:, 1]
+    negative = hi >> np.uint64(63) == 1
+    # Magnitude of the negative values: two's complement negation over both words.
+    neg_lo = ~lo + np.uint64(1)
+    neg_hi = ~hi + (neg_lo == 0).astype(np.uint64)
+    lo = np.where(negative, neg_lo, lo)
+    hi = np.where(negative, neg_hi, hi)
+    exponent = np.uint64(_DECIMAL_BIAS - arr.type.scale)
+    hi = hi | exponent << np.uint64(49) | negative.astype(np.uint64) << np.uint64(63)
+    packed = np.stack([lo, hi], axis=1)
+    if nulls is not None:
+        packed[nulls] = 0
+    return packed.astype("<u8").tobytes(), nulls
+
+
+def _string_payload(arr: Any, nulls: np.ndarray | None) -> bytes:
+    """Concatenate ``pack7(len) + bytes`` per value straight from the buffers.
+
+    Serves both String (UTF-8 already) and Binary columns, which share the
+    offsets + data layout in Arrow and the length-prefixed layout in SBDF.
+    """
+    n = len(arr)
+    if pa.types.is_null(arr.type):
+        return bytes(n)  # every cell is the empty string: one zero length byte
+    if pa.types.is_string_view(arr.type):
+        arr = arr.cast(pa.large_string())
+    elif pa.types.is_binary_view(arr.type):
+        arr = arr.cast(pa.large_binary())
+    width = (
+        8
+        if pa.types.is_large_string(arr.type) or pa.types.is_large_binary(arr.type)
+        else 4
+    )
+    offsets = np.frombuffer(
+        arr.buffers()[1], dtype=f"<i{width}", count=n + 1, offset=arr.offset * width
+    ).astype(np.int64)
+    data_buf = arr.buffers()[2]
+    data = (
+        np.frombuffer(data_buf, dtype=np.uint8)
+        if data_buf is not None
+        else np.empty(0, dtype=np.uint8)
+    )
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+    if nulls is not None:
+        lengths[nulls] = 0
+
+    # 7-bit packed length prefix: 1 byte per started 7 bits of the length.
+    prefix = np.ones(n, dtype=np.int64)
+    for k in range(1, 5):
+        prefix += lengths >= (1 << (7 * k))
+    cell = prefix + lengths
+    begins = np.cumsum(cell) - cell
+    out = np.empty(int(cell.sum()), dtype=np.uint8)
+    for k in range(5):
+        sel = prefix > k
+        low = (lengths[sel] >> (7 * k)) & 0x7F
+        out[begins[sel] + k] = low | np.where(prefix[sel] > k + 1, 0x80, 0)
+
+    total = int(lengths.sum())
+    if total:
+        within = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        out[np.repeat(begins + prefix, lengths) + within] = data[
+            np.repeat(starts, lengths) + within
+        ]
+    return out.tobytes()
+
+
+def _column_into(out: bytearray, arr: Any, vtype: int) -> None:
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    nulls = _null_mask(arr)
+    if vtype in (VT_STRING, VT_BINARY):
+        payload = _string_payload(arr, nulls)
+        invalid = nulls
+    elif vtype == VT_DECIMAL:
+        payload, invalid = _decimal_payload(arr, nulls)
+    else:
+        payload, invalid = _fixed_payload(arr, vtype, nulls)
+    bits = (
+        _vectorized.bit_array_bytes(invalid)
+        if invalid is not None and invalid.any()
+        else None
+    )
+    packed_column_slice_into(out, vtype, len(arr), payload, bits, None)
+
+
+def _record_batches(data: Any) -> tuple[Any, Iterator[Any]]:
+    """Return ``(schema, batches)`` for any supported tabular input."""
+    pandas = sys.modules.get("pandas")  # only set if the caller uses pandas
+    if pandas is not None and isinstance(data, pandas.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    if isinstance(data, pa.Table):
+        return data.schema, iter(data.to_batches())
+    if isinstance(data, pa.RecordBatch):
+        return data.schema, iter([data])
+    if isinstance(data, pa.RecordBatchReader):
+        return data.schema, iter(data)
+    if hasattr(data, "__arrow_c_stream__"):
+        reader = pa.RecordBatchReader.from_stream(data)
+        return reader.schema, iter(reader)
+    raise TypeError(
+        f"Expected a pandas DataFrame or an Arrow table, record batch or "
+        f"stream, got {type(data).__name__!r}"
+    )
+
+
+def arrow_to_sbdf_views(data: Any, chunk_size: int) -> Iterator[memoryview]:
+    """Return an iterator over a complete SBDF file, one section at a time.
+
+    Record batches are re-sliced (zero-copy) so that no table slice holds
+    more than *chunk_size* rows; empty batches are skipped. The arguments
+    and the schema are checked by this call, before anything is encoded.
+
+    Raises:
+        TypeError: If *data* is not a supported type or a column type has no
+            SBDF equivalent.
+        ValueError: If *chunk_size* is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    schema, batches = _record_batches(data)
+    vtypes = [sbdf_type(field.type) for field in schema]
+    return _sbdf_views(schema.names, vtypes, batches, chunk_size)
+
+
+def _sbdf_views(
+    names: list[str], vtypes: list[int], batches: Iterator[Any], chunk_size: int
+) -> Iterator[memoryview]:
+    """The generator behind :func:`arrow_to_sbdf_views`, after the checks."""
+    yield memoryview(
+        section(SID_FILE_HEADER)
+        + bytes([1, 0])
+        + section(SID_TABLE_METADATA)
+        + table_metadata(names, vtypes)
+    )
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunk_size):
+            part = batch.slice(start, chunk_size)
+            out = bytearray()
+            out += section(SID_TABLE_SLICE)
+            out += i32(len(vtypes))
+            for column, vtype in zip(part.columns, vtypes):
+                _column_into(out, column, vtype)
+            yield memoryview(out).toreadonly()
+    yield memoryview(section(SID_TABLE_END))
@@ -0,0 +1,196 @@
+"""Map DB-API 2.0 (PEP 249) cursor columns to SBDF value types.
+
+Internal module. Callers should use :func:`spotfire_community.sbdf.from_cursor`.
+
+``cursor.description`` type codes are driver specific: some drivers report
+Python types, some report SQL type names, others opaque numbers (PostgreSQL
+OIDs) or nothing at all (sqlite3). Python types and common SQL type names are
+mapped directly; for any other code the type is taken from the Python type of
+the non-null values the driver returned in the first batch, which needs no
+parsing. Mixed value types in a column are joined to a type that holds all
+of them (``int`` and ``float`` → Double), so no sampled value is truncated.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Protocol
+
+from spotfire_community.sbdf.models import ValueType
+
+
+class DbApiCursor(Protocol):
+    """The parts of a PEP 249 cursor that :func:`from_cursor` uses."""
+
+    @property
+    def description(self) -> Sequence[Sequence[Any]] | None: ...
+
+    def fetchmany(self, size: int = ..., /) -> Sequence[Sequence[Any]]: ...
+
+
+# Ordered: bool before int (bool subclasses int), datetime before date.
+_PYTHON_TYPES: tuple[tuple[type | tuple[type, ...], ValueType], ...] = (
+    (bool, ValueType.BOOL),
+    (int, ValueType.LONG),
+    (float, ValueType.DOUBLE),
+    (Decimal, ValueType.DECIMAL),
+    (datetime, ValueType.DATETIME),
+    (date, ValueType.DATE),
+    (time, ValueType.TIME),
+    (timedelta, ValueType.TIMESPAN),
+    (str, ValueType.STRING),
+    ((bytes, bytearray, memoryview), ValueType.BINARY),
+)
+
+_SQL_TYPES: dict[str, ValueType] = {
+    **dict.fromkeys(["BOOL", "BOOLEAN"], ValueType.BOOL),
+    **dict.fromkeys(
+        ["TINYINT", "SMALLINT", "MEDIUMINT", "INT2", "INT4"], ValueType.INT
+    ),
+    **dict.fromkeys(["INT", "INTEGER", "BIGINT", "INT8", "LONG"], ValueType.LONG),
+    **dict.fromkeys(["FLOAT4"], ValueType.FLOAT),
+    **dict.fromkeys(["REAL", "FLOAT", "FLOAT8", "DOUBLE"], ValueType.DOUBLE),
+    **dict.fromkeys(["DECIMAL", "NUMERIC", "NUMBER", "MONEY"], ValueType.DECIMAL),
+    **dict.fromkeys(
+        ["DATETIME", "DATETIME2", "SMALLDATETIME", "TIMESTAMP", "TIMESTAMPTZ"],
+        ValueType.DATETIME,
+    ),
+    **dict.fromkeys(
+        ["TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"], ValueType.DATETIME
+    ),
+    "DATE": ValueType.DATE,
+    # TIMETZ values are converted to UTC by cursor_columns.
+    **dict.fromkeys(["TIME", "TIMETZ"], ValueType.TIME),
+    **dict.fromkeys(["INTERVAL"], ValueType.TIMESPAN),
+    **dict.fromkeys(
+        ["CHAR", "VARCHAR", "VARCHAR2", "NCHAR", "NVARCHAR", "NVARCHAR2", "TEXT"],
+        ValueType.STRING,
+    ),
+    **dict.fromkeys(["STRING", "CLOB", "NCLOB", "UUID", "JSON"], ValueType.STRING),
+    **dict.fromkeys(
+        ["BINARY", "VARBINARY", "BLOB", "BYTEA", "RAW", "IMAGE"], ValueType.BINARY
+    ),
+}
+
+_SQL_NAME = re.compile(r"[A-Z_]+[0-9]*")
+
+# Python types each value type can encode without losing information.
+_ACCEPTS: dict[ValueType, tuple[type, ...]] = {
+    ValueType.BOOL: (bool,),
+    ValueType.INT: (int,),
+    ValueType.LONG: (int,),
+    ValueType.FLOAT: (int, float),
+    ValueType.DOUBLE: (int, float, Decimal),
+    ValueType.DECIMAL: (int, Decimal),
+    ValueType.DATETIME: (datetime,),
+    ValueType.DATE: (date,),
+    ValueType.TIME: (time,),
+    ValueType.TIMESPAN: (timedelta,),
+    ValueType.BINARY: (bytes, bytearray, memoryview),
+}
+
+
+# Joins of mixed Python-value types that every value converts to losslessly
+# (Decimal -> Double excepted, as for an explicit DOUBLE column). Any other
+# mix becomes STRING.
+_JOINS: dict[frozenset[ValueType], ValueType] = {
+    frozenset({ValueType.LONG, ValueType.DOUBLE}): ValueType.DOUBLE,
+    frozenset({ValueType.LONG, ValueType.DECIMAL}): ValueType.DECIMAL,
+    frozenset({ValueType.DOUBLE, ValueType.DECIMAL}): ValueType.DOUBLE,
+    frozenset({ValueType.LONG, ValueType.DOUBLE, ValueType.DECIMAL}): (
+        ValueType.DOUBLE
+    ),
+    frozenset({ValueType.DATE, ValueType.DATETIME}): ValueType.DATETIME,
+}
+
+
+def _python_type(value: Any) -> ValueType:
+    for python_type, vtype in _PYTHON_TYPES:
+        if isinstance(value, python_type):
+            return vtype
+    return ValueType.STRING
+
+
+def _accepts(vtype: ValueType, value: Any) -> bool:
+    if vtype not in _ACCEPTS:
+        return True
+    if isinstance(value, bool) and vtype is not ValueType.BOOL:
+        return False
+    # datetime subclasses date, but a DATE column would drop its time of day.
+    if isinstance(value, datetime) and vtype is ValueType.DATE:
+        return False
+    return isinstance(value, _ACCEPTS[vtype])
+
+
+def _join(values: Sequence[Any]) -> ValueType:
+    types = frozenset(_python_type(v) for v in values)
+    if len(types) == 1:
+        return next(iter(types))
+    return _JOINS.get(types, ValueType.STRING)
+
+
+def _utc_time(value: Any) -> Any:
+    """A time-zone aware ``time`` as a naive UTC ``time``; others unchanged."""
+    if not isinstance(value, time) or value.tzinfo is None:
+        return value
+    offset = value.utcoffset()
+    if offset is None:  # a zone needing a date; left to be written as null
+        return value
+    moment = datetime.combine(date(2000, 1, 2), value.replace(tzinfo=None))
+    return (moment - offset).time()
+
+
+def type_from_code(type_code: Any) -> ValueType | None:
+    """Map a ``cursor.description`` type code, or ``None`` if it is unknown."""
+    if isinstance(type_code, type):
+        for python_type, vtype in _PYTHON_TYPES:
+            if issubclass(type_code, python_type):
+                return vtype
+        return None
+    if isinstance(type_code, str):
+        match = _SQL_NAME.match(type_code.strip().upper())
+        return _SQL_TYPES.get(match.group()) if match else None
+    return None
+
+
+def cursor_column_types(
+    description: Sequence[Sequence[Any]], first_rows: Sequence[Sequence[Any]]
+) -> list[ValueType]:
+    """Resolve one value type per column of a cursor's result set.
+
+    The description's type code is used when it is recognised and accepts
+    every non-null value in *first_rows* (a driver may return ``str`` for a
+    ``DATE`` column, say); otherwise the Python types of those values decide,
+    joined where they differ (``int`` and ``float`` → ``DOUBLE``, ``date``
+    and ``datetime`` → ``DATETIME``, other mixes → ``STRING``). Columns with
+    no recognised code and only nulls in *first_rows* become ``STRING``.
+    """
+    types: list[ValueType] = []
+    for index, column in enumerate(description):
+        vtype = type_from_code(column[1])
+        values = [row[index] for row in first_rows if row[index] is not None]
+        if values and (vtype is None or not all(_accepts(vtype, v) for v in values)):
+            vtype = _join(values)
+        types.append(ValueType.STRING if vtype is None else vtype)
+    return types
+
+
+def cursor_columns(
+    rows: Sequence[Sequence[Any]], column_types: Sequence[ValueType]
+) -> list[Sequence[Any]]:
+    """Transpose fetched *rows* into columns for ``write_columns``.
+
+    Time-zone aware ``time`` values (e.g. from ``TIMETZ`` columns) in
+    ``TIME`` columns are converted to UTC, as aware datetimes are.
+    """
+    columns: list[Sequence[Any]] = list(zip(*rows))
+    for index, vtype in enumerate(column_types):
+        if vtype is ValueType.TIME:
+            columns[index] = [_utc_time(v) for v in columns[index]]
+    return columns
+
+
+__all__ = ["DbApiCursor", "cursor_column_types", "cursor_columns", "type_from_code"]
@@ -0,0 +1,116 @@
+"""Concatenate SBDF files by copying their table slices verbatim.
+
+Internal module. Callers should use :func:`spotfire_community.sbdf.concat_sbdf`
+and :func:`spotfire_community.sbdf.append_sbdf`.
+
+Every ``TableSlice`` section is self-contained, so files that share the same
+columns can be joined by keeping one file header and table metadata, then
+copying the bytes between each file's metadata and its trailing ``TableEnd``
+marker. Only the metadata is decoded; slice bytes are streamed in large
+blocks and never parsed.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+from spotfire_community.sbdf._reader import ByteSource, SbdfSource, read_table_metadata
+from spotfire_community.sbdf._writer import SID_TABLE_END, section
+from spotfire_community.sbdf.errors import SbdfFormatError
+from spotfire_community.sbdf.models import SbdfTableMetadata
+
+TABLE_END = section(SID_TABLE_END)
+
+
+def _slice_bytes(src: ByteSource) -> Iterator[bytes | memoryview]:
+    """Yield the raw slice bytes left in *src*, minus the ``TableEnd`` marker.
+
+    The last ``len(TABLE_END)`` bytes are held back rather than yielded, so
+    the marker is found without seeking or knowing the length of the input.
+    """
+    keep = len(TABLE_END)
+    held = b""
+    for block in src.remainder():
+        if len(held) + len(block) <= keep:
+            held += bytes(block)
+            continue
+        if len(block) >= keep:
+            if held:
+                yield held
+            yield block[:-keep]
+            held = bytes(block[-keep:])
+        else:
+            joined = held + bytes(block)
+            yield joined[:-keep]
+            held = joined[-keep:]
+    if held != TABLE_END:
+        raise SbdfFormatError("SBDF data does not end with a TableEnd section")
+
+
+def _check_metadata(
+    metadata: SbdfTableMetadata, expected: SbdfTableMetadata, index: int
+) -> None:
+    if metadata != expected:
+        raise ValueError(
+            f"SBDF source {index} does not have the same column names and "
+            f"types as the first source"
+        )
+
+
+def slice_views(
+    sources: Iterable[SbdfSource], expected: SbdfTableMetadata, start: int = 0
+) -> Iterator[bytes | memoryview]:
+    """Yield the table slice bytes of every source, checking its metadata.
+
+    *start* is the index of the first source, used in error messages.
+    """
+    for index, source in enumerate(sources, start):
+        src = ByteSource(source)
+        _check_metadata(read_table_metadata(src), expected, index)
+        yield from _slice_bytes(src)
+
+
+def concat_views(sources: Iterable[SbdfSource]) -> Iterator[bytes | memoryview]:
+    """Yield one SBDF file holding the slices of every source, in order.
+
+    The file header and table metadata are copied from the first source.
+
+    Raises:
+        ValueError: If there are no sources or their columns differ.
+        SbdfFormatError: If a source has malformed metadata or does not end
+            with a ``TableEnd`` section.
+    """
+    it = iter(sources)
+    first = next(it, None)
+    if first is None:
+        raise ValueError("No SBDF sources to concatenate")
+    src = ByteSource(first, keep=True)
+    metadata = read_table_metadata(src)
+    yield src.consumed()
+    yield from _slice_bytes(src)
+    yield from slice_views(it, metadata, start=1)
+    yield TABLE_END
+
+
+def table_end_offset(target: IO[bytes]) -> tuple[SbdfTableMetadata, int]:
+    """Return the metadata of *target* and the offset of its ``TableEnd``.
+
+    Raises:
+        SbdfFormatError: If the metadata is malformed or the file does not end
+            with a ``TableEnd`` section.
+    """
+    target.seek(0)
+    src = ByteSource(target)
+    metadata = read_table_metadata(src)
+    metadata_end = target.tell()
+    end = target.seek(0, io.SEEK_END) - len(TABLE_END)
+    if end >= metadata_end:
+        target.seek(end)
+        if target.read(len(TABLE_END)) == TABLE_END:
+            return metadata, end
+    raise SbdfFormatError("SBDF data does not end with a TableEnd section")
+
+
+__all__ = ["TABLE_END", "concat_views", "slice_views", "table_end_offset"]
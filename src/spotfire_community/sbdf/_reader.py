@@ -0,0 +1,699 @@
+"""Pure-Python streaming SBDF decoder.
+
+Internal module. Callers should use :class:`spotfire_community.sbdf.SbdfReader`.
+The layout handled here mirrors what :mod:`spotfire_community.sbdf._writer`
+emits; see that module for the section and value-array encodings.
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+from collections.abc import Iterator, Sequence
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from mmap import mmap
+from typing import IO, Any
+
+from spotfire_community.sbdf._writer import (
+    ENC_BIT_ARRAY,
+    ENC_PLAIN,
+    ENC_RUN_LENGTH,
+    MAGIC,
+    SBDF_EPOCH,
+    SID_COLUMN_SLICE,
+    SID_FILE_HEADER,
+    SID_TABLE_END,
+    SID_TABLE_METADATA,
+    SID_TABLE_SLICE,
+    VT_BINARY,
+    VT_BOOL,
+    VT_DATE,
+    VT_DATETIME,
+    VT_DECIMAL,
+    VT_DOUBLE,
+    VT_FLOAT,
+    VT_INT,
+    VT_LONG,
+    VT_STRING,
+    VT_TIME,
+    VT_TIMESPAN,
+)
+from spotfire_community.sbdf.errors import SbdfFormatError
+from spotfire_community.sbdf.models import (
+    SbdfColumnSlice,
+    SbdfSliceIndex,
+    SbdfTableMetadata,
+    SbdfTableSlice,
+    ValueType,
+)
+
+# Byte width of every fixed-size SBDF value type.
+_FIXED_SIZES = {
+    VT_BOOL: 1,
+    VT_INT: 4,
+    VT_LONG: 8,
+    VT_FLOAT: 4,
+    VT_DOUBLE: 8,
+    VT_DATETIME: 8,
+    VT_DATE: 8,
+    VT_TIME: 8,
+    VT_TIMESPAN: 8,
+    VT_DECIMAL: 16,
+}
+
+_STRUCT_CODES = {VT_INT: "i", VT_LONG: "q", VT_FLOAT: "f", VT_DOUBLE: "d"}
+
+# Int-keyed set rather than ``x in ValueType``, which raises on Python < 3.12.
+_VALUE_TYPES = frozenset(int(t) for t in ValueType)
+
+SbdfSource = IO[bytes] | bytes | bytearray | memoryview | mmap
+
+
+# ---------------------------------------------------------------------------
+# Byte source
+# ---------------------------------------------------------------------------
+
+
+class ByteSource:
+    """Sequential reads over a binary file object or an in-memory buffer.
+
+    Buffers are sliced without copying; file objects are read on demand, so
+    only the bytes of the value array currently being decoded are held. With
+    ``keep=True`` the bytes read from a file object are also retained, so
+    that :meth:`consumed` can return them.
+
+    Offsets (:meth:`tell`, :meth:`seek`) count from where a seekable file
+    object was positioned when it was wrapped, i.e. from the start of the
+    SBDF data even if it follows other data in the file.
+    """
+
+    def __init__(self, source: SbdfSource, *, keep: bool = False) -> None:
+        self._file: IO[bytes] | None = None
+        self._view: memoryview | None = None
+        self._kept: bytearray | None = None
+        self._pos = 0
+        self._origin = 0
+        if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+            self._view = memoryview(source).cast("B")
+        else:
+            self._file = source
+            if source.seekable():
+                self._origin = source.tell()
+            if keep:
+                self._kept = bytearray()
+
+    def read(self, n: int) -> bytes | memoryview:
+        """Return exactly *n* bytes or raise :class:`SbdfFormatError`."""
+        if self._view is not None:
+            end = self._pos + n
+            if end > len(self._view):
+                raise SbdfFormatError("Unexpected end of SBDF data")
+            out = self._view[self._pos : end]
+            self._pos = end
+            return out
+        assert self._file is not None
+        data = self._file.read(n)
+        while len(data) < n:
+            more = self._file.read(n - len(data))
+            if not more:
+                raise SbdfFormatError("Unexpected end of SBDF data")
+            data += more
+        if self._kept is not None:
+            self._kept += data
+        return data
+
+    def consumed(self) -> bytes | memoryview:
+        """Return every byte read so far (needs ``keep=True`` for files)."""
+        if self._view is not None:
+            return self._view[: self._pos]
+        if self._kept is None:
+            raise RuntimeError("ByteSource was not created with keep=True")
+        return bytes(self._kept)
+
+    def remainder(self, block_size: int = 1 << 20) -> Iterator[bytes | memoryview]:
+        """Yield the unread bytes in blocks of up to *block_size* bytes."""
+        if self._view is not None:
+            rest = self._view[self._pos :]
+            self._pos = len(self._view)
+            if rest:
+                yield rest
+            return
+        assert self._file is not None
+        while block := self._file.read(block_size):
+            yield block
+
+    def seekable(self) -> bool:
+        return self._view is not None or bool(self._file and self._file.seekable())
+
+    def tell(self) -> int:
+        if self._view is not None:
+            return self._pos
+        assert self._file is not None
+        return self._file.tell() - self._origin
+
+    def seek(self, pos: int) -> None:
+        """Move to offset *pos* of the SBDF data (buffers and seekable files only)."""
+        if self._view is not None:
+            if not 0 <= pos <= len(self._view):
+                raise SbdfFormatError(f"Offset {pos} is outside the SBDF data")
+            self._pos = pos
+            return
+        assert self._file is not None
+        self._file.seek(self._origin + pos)
+
+    def skip(self, n: int) -> None:
+        """Advance past *n* bytes without decoding (or, if seekable, reading) them."""
+        if n < 0:
+            raise SbdfFormatError(f"Negative SBDF length {n}")
+        if self._view is not None:
+            if self._pos + n > len(self._view):
+                raise SbdfFormatError("Unexpected end of SBDF data")
+            self._pos += n
+            return
+        assert self._file is not None
+        if self._file.seekable():
+            # Overshooting EOF is caught by the next read.
+            self._file.seek(n, io.SEEK_CUR)
+            return
+        while n:
+            data = self._file.read(min(n, 1 << 20))
+            if not data:
+                raise SbdfFormatError("Unexpected end of SBDF data")
+            n -= len(data)
+
+    def read_byte(self) -> int:
+        return self.read(1)[0]
+
+    def read_i32(self) -> int:
+        return struct.unpack("<i", self.read(4))[0]
+
+    def read_str_u(self) -> str:
+        return str(self.read(self.read_i32()), "utf-8")
+
+    def read_section(self, expected: int | None = None) -> int:
+        """Read a section marker; return its id (checked against *expected*)."""
+        head = self.read(3)
+        if bytes(head[:2]) != MAGIC:
+            raise SbdfFormatError("Missing SBDF section marker")
+        sid = head[2]
+        if expected is not None and sid != expected:
+            raise SbdfFormatError(
+                f"Expected SBDF section 0x{expected:02x}, found 0x{sid:02x}"
+            )
+        return sid
+
+
+# ---------------------------------------------------------------------------
+# Value decoding
+# ---------------------------------------------------------------------------
+
+
+def _unpack7(buf: bytes | memoryview, pos: int) -> tuple[int, int]:
+    """Decode a 7-bit packed integer at *pos*; return ``(value, new_pos)``."""
+    value = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _datetime_from_ms(ms: int) -> datetime:
+    try:
+        return SBDF_EPOCH + timedelta(milliseconds=ms)
+    except OverflowError:
+        raise SbdfFormatError(f"Date/time value out of range: {ms}") from None
+
+
+def _time_from_ms(ms: int) -> time:
+    if not 0 <= ms < 86_400_000:
+        raise SbdfFormatError(f"Time value out of range: {ms}")
+    seconds, millis = divmod(ms, 1000)
+    minutes, second = divmod(seconds, 60)
+    return time(minutes // 60, minutes % 60, second, millis * 1000)
+
+
+def _timespan_from_ms(ms: int) -> timedelta:
+    try:
+        return timedelta(milliseconds=ms)
+    except OverflowError:
+        raise SbdfFormatError(f"TimeSpan value out of range: {ms}") from None
+
+
+def decimal_from_bytes(cell: bytes | memoryview) -> Decimal:
+    """Decode one decimal128 (BID) value, as written by the SBDF writer."""
+    bits = int.from_bytes(cell, "little")
+    if bits >> 125 & 0b11 == 0b11:
+        raise SbdfFormatError("Unsupported Decimal encoding (special or large)")
+    coefficient = bits & ((1 << 113) - 1)
+    exponent = (bits >> 113 & 0x3FFF) - 6176
+    return Decimal((bits >> 127, tuple(map(int, str(coefficient))), exponent))
+
+
+def decode_plain(vtype: int, count: int, buf: bytes | memoryview) -> list[Any]:
+    """Decode *count* values of *vtype* from a fixed-width plain array."""
+    if vtype == VT_BOOL:
+        return [b != 0 for b in buf]
+    code = _STRUCT_CODES.get(vtype)
+    if code is not None:
+        return list(struct.unpack(f"<{count}{code}", buf))
+    if vtype == VT_DECIMAL:
+        return [decimal_from_bytes(buf[i : i + 16]) for i in range(0, 16 * count, 16)]
+    millis = struct.unpack(f"<{count}q", buf)
+    if vtype == VT_DATETIME:
+        return [_datetime_from_ms(ms) for ms in millis]
+    if vtype == VT_TIME:
+        return [_time_from_ms(ms) for ms in millis]
+    if vtype == VT_TIMESPAN:
+        return [_timespan_from_ms(ms) for ms in millis]
+    return [_datetime_from_ms(ms).date() for ms in millis]
+
+
+def _decode_packed(vtype: int, count: int, buf: bytes | memoryview) -> list[Any]:
+    """Decode *count* 7-bit length-prefixed strings or binaries from *buf*."""
+    out: list[Any] = []
+    pos = 0
+    for _ in range(count):
+        n, pos = _unpack7(buf, pos)
+        item = buf[pos : pos + n]
+        out.append(str(item, "utf-8") if vtype == VT_STRING else bytes(item))
+        pos += n
+    return out
+
+
+def _read_bits(src: ByteSource, count: int) -> list[bool]:
+    buf = src.read((count + 7) // 8)
+    return [bool(buf[i >> 3] & (0x80 >> (i & 7))) for i in range(count)]
+
+
+def _read_plain(src: ByteSource, vtype: int) -> list[Any]:
+    """Read the body of a plain value array (count, then the values)."""
+    count = src.read_i32()
+    if count < 0:
+        raise SbdfFormatError(f"Negative SBDF value count {count}")
+    if vtype in (VT_STRING, VT_BINARY):
+        return _decode_packed(vtype, count, src.read(src.read_i32()))
+    if vtype not in _FIXED_SIZES or vtype not in _VALUE_TYPES:
+        raise SbdfFormatError(f"Unsupported SBDF value type 0x{vtype:02x}")
+    return decode_plain(vtype, count, src.read(count * _FIXED_SIZES[vtype]))
+
+
+def _read_value_array(src: ByteSource) -> tuple[int, list[Any]]:
+    """Read one encoded value array; return ``(vtype, values)``."""
+    encoding = src.read_byte()
+    vtype = src.read_byte()
+    if encoding == ENC_PLAIN:
+        return vtype, _read_plain(src, vtype)
+    if encoding == ENC_BIT_ARRAY:
+        if vtype != VT_BOOL:
+            raise SbdfFormatError("Bit-array encoding is only valid for Bool")
+        return vtype, _read_bits(src, src.read_i32())
+    if encoding == ENC_RUN_LENGTH:
+        total = src.read_i32()
+        lengths = bytes(src.read(src.read_i32()))
+        run_values = _read_plain(src, vtype)
+        if len(run_values) != len(lengths):
+            raise SbdfFormatError("Run-length value and length counts differ")
+        values: list[Any] = []
+        for n, v in zip(lengths, run_values):
+            values.extend([v] * (n + 1))
+        if len(values) != total:
+            raise SbdfFormatError("Run-length array does not match its count")
+        return vtype, values
+    raise SbdfFormatError(f"Unsupported SBDF value encoding 0x{encoding:02x}")
+
+
+def _skip_plain(src: ByteSource, vtype: int) -> int:
+    """Skip the body of a plain value array; return its value count."""
+    count = src.read_i32()
+    if count < 0:
+        raise SbdfFormatError(f"Negative SBDF value count {count}")
+    if vtype in (VT_STRING, VT_BINARY):
+        src.skip(src.read_i32())
+    elif vtype in _FIXED_SIZES:
+        src.skip(count * _FIXED_SIZES[vtype])
+    else:
+        raise SbdfFormatError(f"Unsupported SBDF value type 0x{vtype:02x}")
+    return count
+
+
+def _skip_value_array(src: ByteSource) -> int:
+    """Skip one encoded value array by its length headers; return its count."""
+    encoding = src.read_byte()
+    vtype = src.read_byte()
+    if encoding == ENC_PLAIN:
+        return _skip_plain(src, vtype)
+    if encoding == ENC_BIT_ARRAY:
+        count = src.read_i32()
+        src.skip((count + 7) // 8)
+        return count
+    if encoding == ENC_RUN_LENGTH:
+        total = src.read_i32()
+        src.skip(src.read_i32())
+        _skip_plain(src, vtype)
+        return total
+    raise SbdfFormatError(f"Unsupported SBDF value encoding 0x{encoding:02x}")
+
+
+def _read_metadata_value(src: ByteSource, vtype: int) -> Any:
+    """Read a single metadata value (unpacked string/binary, raw otherwise)."""
+    if vtype in (VT_STRING, VT_BINARY):
+        data = src.read(src.read_i32())
+        return str(data, "utf-8") if vtype == VT_STRING else bytes(data)
+    size = _FIXED_SIZES.get(vtype)
+    if size is None:
+        raise SbdfFormatError(f"Unsupported SBDF metadata type 0x{vtype:02x}")
+    return decode_plain(vtype, 1, src.read(size))[0]
+
+
+# ---------------------------------------------------------------------------
+# Sections
+# ---------------------------------------------------------------------------
+
+
+def read_table_metadata(src: ByteSource) -> SbdfTableMetadata:
+    """Read the ``FileHeader`` and ``TableMetadata`` sections."""
+    src.read_section(SID_FILE_HEADER)
+    major, _minor = src.read_byte(), src.read_byte()
+    if major != 1:
+        raise SbdfFormatError(f"Unsupported SBDF version {major}")
+    src.read_section(SID_TABLE_METADATA)
+
+    # Table-level metadata is not surfaced, but must be consumed.
+    for _ in range(src.read_i32()):
+        src.read_str_u()
+        vtype = src.read_byte()
+        for _present in range(2):  # value, then default value
+            if src.read_byte():
+                _read_metadata_value(src, vtype)
+
+    num_cols = src.read_i32()
+    md_types: list[tuple[str, int]] = []
+    for _ in range(src.read_i32()):
+        name = src.read_str_u()
+        vtype = src.read_byte()
+        if src.read_byte():
+            _read_metadata_value(src, vtype)
+        md_types.append((name, vtype))
+
+    headers: list[str] = []
+    column_types: list[ValueType] = []
+    for c in range(num_cols):
+        values: dict[str, Any] = {}
+        for name, vtype in md_types:
+            if src.read_byte():
+                values[name] = _read_metadata_value(src, vtype)
+        data_type = values.get("DataType")
+        if not data_type or data_type[0] not in _VALUE_TYPES:
+            raise SbdfFormatError(f"Unsupported data type for column {c}")
+        headers.append(values.get("Name", ""))
+        column_types.append(ValueType(data_type[0]))
+    return SbdfTableMetadata(headers=headers, column_types=column_types)
+
+
+def read_column_slice(src: ByteSource) -> SbdfColumnSlice:
+    """Read one ``ColumnSlice`` section including its ``IsInvalid`` property."""
+    src.read_section(SID_COLUMN_SLICE)
+    _, values = _read_value_array(src)
+    invalid: list[bool] | None = None
+    for _ in range(src.read_i32()):
+        name = src.read_str_u()
+        _, prop = _read_value_array(src)
+        if name == "IsInvalid":
+            invalid = prop
+    return SbdfColumnSlice(values=values, invalid=invalid)
+
+
+def skip_column_slice(src: ByteSource) -> int:
+    """Skip one ``ColumnSlice`` section by its length headers; return its rows."""
+    src.read_section(SID_COLUMN_SLICE)
+    count = _skip_value_array(src)
+    for _ in range(src.read_i32()):
+        src.skip(src.read_i32())  # property name
+        _skip_value_array(src)
+    return count
+
+
+def _next_table_slice(src: ByteSource, num_cols: int) -> bool:
+    """Read the next section header; ``False`` at ``TableEnd``.
+
+    After ``True``, the source is positioned at the slice's first column.
+    """
+    sid = src.read_section()
+    if sid == SID_TABLE_END:
+        return False
+    if sid != SID_TABLE_SLICE:
+        raise SbdfFormatError(f"Unexpected SBDF section 0x{sid:02x}")
+    found = src.read_i32()
+    if found != num_cols:
+        raise SbdfFormatError(f"Table slice has {found} columns, expected {num_cols}")
+    return True
+
+
+def read_table_slices(
+    src: ByteSource, num_cols: int, selected: Sequence[int] | None = None
+) -> Iterator[SbdfTableSlice]:
+    """Yield every ``TableSlice`` up to and including the ``TableEnd`` marker.
+
+    With *selected*, only those column indices are decoded and returned, in
+    the given order; the other column slices are skipped unread.
+    """
+    wanted = set(selected or ())
+    while _next_table_slice(src, num_cols):
+        if selected is None:
+            yield SbdfTableSlice(
+                columns=[read_column_slice(src) for _ in range(num_cols)]
+            )
+            continue
+        decoded: dict[int, SbdfColumnSlice] = {}
+        for c in range(num_cols):
+            if c in wanted:
+                decoded[c] = read_column_slice(src)
+            else:
+                skip_column_slice(src)
+        yield SbdfTableSlice(columns=[decoded[c] for c in selected])
+
+
+def scan_slice_index(src: ByteSource, num_cols: int) -> SbdfSliceIndex:
+    """Index the remaining table slices by skipping over their columns."""
+    offsets: list[int] = []
+    first_rows: list[int] = []
+    rows = 0
+    while True:
+        pos = src.tell()
+        if not _next_table_slice(src, num_cols):
+            return SbdfSliceIndex(offsets, first_rows, rows, pos)
+        counts = [skip_column_slice(src) for _ in range(num_cols)]
+        offsets.append(pos)
+        first_rows.append(rows)
+        rows += counts[0] if counts else 0
+
+
+def _take(table_slice: SbdfTableSlice, start: int, stop: int) -> SbdfTableSlice:
+    """Return rows ``[start, stop)`` of *table_slice*."""
+    if start == 0 and stop >= table_slice.row_count:
+        return table_slice
+    return SbdfTableSlice(
+        columns=[
+            SbdfColumnSlice(
+                values=c.values[start:stop],
+                invalid=None if c.invalid is None else c.invalid[start:stop],
+            )
+            for c in table_slice.columns
+        ]
+    )
+
+
+# ---------------------------------------------------------------------------
+# Public reader
+# ---------------------------------------------------------------------------
+
+
+class SbdfReader:
+    """Incremental SBDF reader.
+
+    Decodes one ``TableSlice`` at a time, so memory use is bounded by the
+    largest slice rather than by the file. Accepts any readable binary file
+    object — an open file, a ``zipfile`` member of a DXP, a streamed HTTP
+    response body — or an in-memory ``bytes``/``memoryview``/``mmap``, which
+    is sliced without copying.
+
+    Passing *columns* projects the table: only the selected column slices
+    are decoded, and the others are skipped using their length headers alone
+    (with a seek on seekable files). *max_rows* stops reading once that many
+    rows have been returned, truncating the last slice.
+
+    With a :class:`SbdfSliceIndex` for the file, :meth:`read_rows` seeks
+    straight to the slices holding a row range instead of scanning from the
+    start. Memory-map large files for this (``mmap.mmap(f.fileno(), 0,
+    access=mmap.ACCESS_READ)``) so that only the pages touched are read.
+
+    Example::
+
+        with open("export.sbdf", "rb") as f:
+            reader = SbdfReader(f)
+            print(reader.metadata.headers)
+            for table_slice in reader:
+                for column in table_slice.columns:
+                    print(column.to_list())
+
+    Args:
+        source: Binary file-like object or buffer holding SBDF data.
+        columns: Names or indices of the columns to decode, in the order they
+            should be returned. ``None`` decodes every column.
+        max_rows: Maximum number of rows to return. ``None`` reads all rows.
+
+    Raises:
+        ValueError: If *columns* is empty or *max_rows* is negative.
+    """
+
+    def __init__(
+        self,
+        source: SbdfSource,
+        *,
+        columns: Sequence[str | int] | None = None,
+        max_rows: int | None = None,
+    ) -> None:
+        if columns is not None and not columns:
+            raise ValueError("columns must select at least one column")
+        if max_rows is not None and max_rows < 0:
+            raise ValueError("max_rows must not be negative")
+        self._src = ByteSource(source)
+        self._columns = None if columns is None else list(columns)
+        self._max_rows = max_rows
+        self._metadata: SbdfTableMetadata | None = None
+        self._num_cols = 0
+        self._selected: list[int] | None = None
+        self._data_start = 0
+        self._moved = False
+        self._consumed = False
+
+    @property
+    def metadata(self) -> SbdfTableMetadata:
+        """Column names and types. Reads the file header on first access.
+
+        With a column selection, only the selected columns are described, in
+        selection order, so the entries line up with each slice's columns.
+
+        Raises:
+            SbdfFormatError: If the header or metadata is malformed.
+            ValueError: If a selected column name or index does not exist.
+        """
+        if self._metadata is None:
+            metadata = read_table_metadata(self._src)
+            self._num_cols = len(metadata.headers)
+            self._data_start = self._src.tell() if self._src.seekable() else 0
+            if self._columns is not None:
+                self._selected = [self._resolve(metadata, c) for c in self._columns]
+                metadata = SbdfTableMetadata(
+                    headers=[metadata.headers[c] for c in self._selected],
+                    column_types=[metadata.column_types[c] for c in self._selected],
+                )
+            self._metadata = metadata
+        return self._metadata
+
+    @staticmethod
+    def _resolve(metadata: SbdfTableMetadata, column: str | int) -> int:
+        if isinstance(column, str):
+            if column not in metadata.headers:
+                raise ValueError(f"SBDF table has no column named {column!r}")
+            return metadata.headers.index(column)
+        if not 0 <= column < len(metadata.headers):
+            raise ValueError(
+                f"Column index {column} is out of range for "
+                f"{len(metadata.headers)} columns"
+            )
+        return column
+
+    def slices(self) -> Iterator[SbdfTableSlice]:
+        """Yield the table slices in file order.
+
+        The underlying source is consumed as slices are yielded, so this can
+        only be iterated once.
+
+        Raises:
+            RuntimeError: If the slices have already been iterated.
+            SbdfFormatError: If the data is malformed or truncated.
+        """
+        if self._consumed:
+            raise RuntimeError("SbdfReader.slices() can only be iterated once")
+        self._consumed = True
+        _ = self.metadata  # reads the header and resolves the column selection
+        if self._moved:
+            self._src.seek(self._data_start)
+        remaining = self._max_rows
+        if remaining == 0:
+            return
+        for table_slice in read_table_slices(self._src, self._num_cols, self._selected):
+            if remaining is not None:
+                if table_slice.row_count >= remaining:
+                    yield _take(table_slice, 0, remaining)
+                    return
+                remaining -= table_slice.row_count
+            yield table_slice
+
+    def build_index(self) -> SbdfSliceIndex:
+        """Index the slices of an existing file for :meth:`read_rows`.
+
+        Only section and length headers are read; no values are decoded.
+
+        Raises:
+            ValueError: If the source is not a buffer or seekable file.
+            SbdfFormatError: If the data is malformed or truncated.
+        """
+        self._seek_data()
+        return scan_slice_index(self._src, self._num_cols)
+
+    def read_rows(
+        self, index: SbdfSliceIndex, start: int, stop: int | None = None
+    ) -> Iterator[SbdfTableSlice]:
+        """Yield rows ``[start, stop)`` using *index* to skip earlier slices.
+
+        The first and last slices are trimmed to the range, and a column
+        selection applies as for :meth:`slices`; ``max_rows`` does not. This
+        can be called any number of times, e.g. once per page.
+
+        Args:
+            index: The slice index of this file.
+            start: First row to return.
+            stop: Row to stop before; ``None`` or past the end reads to the
+                last row.
+
+        Raises:
+            ValueError: If the source is not a buffer or seekable file, or
+                *start* is negative or after *stop*.
+            SbdfFormatError: If *index* does not match the file.
+        """
+        stop = index.row_count if stop is None else min(stop, index.row_count)
+        if start < 0 or start > stop:
+            raise ValueError(f"Invalid row range [{start}, {stop})")
+        if start == stop:
+            return
+        pos = index.locate(start)
+        self._seek_data(index.offsets[pos])
+        for table_slice in read_table_slices(self._src, self._num_cols, self._selected):
+            first = index.first_rows[pos]
+            pos += 1
+            yield _take(table_slice, max(start - first, 0), stop - first)
+            if first + table_slice.row_count >= stop:
+                return
+
+    def _seek_data(self, offset: int | None = None) -> None:
+        """Seek to *offset*, or to the first slice; needs a seekable source."""
+        _ = self.metadata
+        if not self._src.seekable():
+            raise ValueError("Random access needs a buffer or seekable file")
+        self._src.seek(self._data_start if offset is None else offset)
+        self._moved = True
+
+    def __iter__(self) -> Iterator[SbdfTableSlice]:
+        return self.slices()
+
+
+__all__ = [
+    "SbdfReader",
+]
@@ -0,0 +1,147 @@
+"""NumPy-backed column encoding for the SBDF writer.
+
+Internal module. :mod:`spotfire_community.sbdf._writer` imports it only when
+NumPy is installed and falls back to its pure-Python loops otherwise. Every
+function here must produce output byte-identical to that fallback.
+
+This module deliberately knows nothing about SBDF value-type ids: the writer
+passes in the NumPy dtype and the per-cell parse function for each column.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+# NumPy's bool scalar, which is not a subclass of ``bool``; the writer accepts
+# it in Bool columns (e.g. from iterating a boolean array).
+BOOL_SCALAR = np.bool_
+
+
+def pack_values(
+    values: Sequence[Any],
+    dtype: str,
+    parse: Callable[[Any], int | float | None],
+    lap: Callable[[str], None] | None = None,
+) -> tuple[bytes, bytes | None]:
+    """Parse a whole column slice and pack it as a little-endian array.
+
+    Args:
+        values: The cells of one column slice, stringified or native.
+        dtype: Little-endian NumPy dtype of the packed payload (e.g. ``"<i4"``).
+        parse: Converts one cell. Raising ``ValueError``/``TypeError``/
+            ``OverflowError`` or returning ``None`` marks the cell invalid; it
+            is then packed as 0.
+        lap: Optional ``ColumnClock.lap``, called after the ``"parse"``,
+            ``"pack"`` and ``"bits"`` steps.
+
+    Returns:
+        ``(payload, invalid_bits)`` where ``invalid_bits`` is the packed
+        IsInvalid bit array, or ``None`` when every cell is valid.
+    """
+    # Fast path: every cell parses and fits the dtype, so the whole column is
+    # converted in one call and no validity mask is needed.
+    try:
+        parsed = list(map(parse, values))
+        if None not in parsed:
+            if lap is not None:
+                lap("parse")
+            payload = np.array(parsed, dtype=dtype).tobytes()
+            if lap is not None:
+                lap("pack")
+            return payload, None
+    except (ValueError, TypeError, OverflowError):
+        pass
+
+    packed = np.zeros(len(values), dtype=dtype)
+    invalid = np.zeros(len(values), dtype=np.bool_)
+    for i, s in enumerate(values):
+        try:
+            v = parse(s)
+            if v is None:
+                invalid[i] = True
+            else:
+                packed[i] = v
+        except (ValueError, TypeError, OverflowError):
+            invalid[i] = True
+    if lap is not None:
+        lap("parse")  # cells are parsed and packed in one loop here
+    payload = packed.tobytes()
+    bits = bit_array_bytes(invalid) if invalid.any() else None
+    if lap is not None:
+        lap("bits")
+    return payload, bits
+
+
+def runs(payload: bytes, width: int) -> list[tuple[int, int]]:
+    """Return ``(start, length)`` for each run of equal *width*-byte cells.
+
+    Cells are compared byte-for-byte, like ``_writer._runs``.
+    """
+    cells = np.frombuffer(payload, dtype=np.uint8).reshape(-1, width)
+    changed = np.any(cells[1:] != cells[:-1], axis=1)
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    lengths = np.diff(np.append(starts, len(cells)))
+    return list(zip(starts.tolist(), lengths.tolist()))
+
+
+def bit_array_bytes(flags: Sequence[int] | np.ndarray) -> bytes:
+    """Pack *flags* MSB-first into bytes, matching SBDF's bit-array layout."""
+    return np.packbits(np.asarray(flags, dtype=np.bool_)).tobytes()
+
+
+def _mix64(keys: np.ndarray) -> np.ndarray:
+    """SplitMix64 finaliser over uint64 keys (wraps modulo 2**64)."""
+    x = keys + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hll_add(
+    registers: bytearray, keys: Sequence[int] | np.ndarray, precision: int
+) -> None:
+    """Add unsigned 64-bit *keys* to HyperLogLog *registers*.
+
+    Matches ``_stats._hll_add`` register for register.
+    """
+    hashes = _mix64(np.asarray(keys, dtype=np.uint64))
+    index = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    rest = hashes & np.uint64((1 << (64 - precision)) - 1)
+    # frexp's exponent is the bit length; exact since rest < 2**53.
+    _, bit_length = np.frexp(rest.astype(np.float64))
+    rank = (64 - precision + 1 - bit_length).astype(np.uint8)
+    np.maximum.at(np.frombuffer(registers, dtype=np.uint8), index, rank)
+
+
+def fixed_stats(
+    payload: bytes | bytearray,
+    dtype: str,
+    count: int,
+    invalid_bits: bytes | None,
+    registers: bytearray,
+    precision: int,
+) -> tuple[int, Any, Any]:
+    """Summarise the valid cells of a packed fixed-width column slice.
+
+    Every valid cell is added to the HyperLogLog *registers* as its raw bytes
+    (read as an unsigned integer). NaNs count as distinct values but are left
+    out of the minimum and maximum.
+
+    Returns:
+        ``(valid_count, minimum, maximum)``; the extremes are ``None`` when no
+        valid, non-NaN cell exists.
+    """
+    values = np.frombuffer(payload, dtype=dtype, count=count)
+    if invalid_bits is not None:
+        invalid = np.unpackbits(
+            np.frombuffer(invalid_bits, dtype=np.uint8), count=count
+        ).astype(np.bool_)
+        values = values[~invalid]
+    hll_add(registers, values.view(f"<u{values.dtype.itemsize}"), precision)
+    ordered = values[~np.isnan(values)] if values.dtype.kind == "f" else values
+    if not len(ordered):
+        return len(values), None, None
+    return len(values), ordered.min().item(), ordered.max().item()
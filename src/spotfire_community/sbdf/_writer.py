@@ -1,18 +1,42 @@
-"""Pure-Python SBDF binary writer (CSV → SBDF).
+"""Pure-Python SBDF binary writer (rows → SBDF).
 
 Internal module. Callers should use :mod:`spotfire_community.sbdf`, which
 re-exports the high-level API (:func:`create_sbdf`, :class:`SbdfStreamingWriter`,
 :class:`ValueType`, :func:`infer_types`).
+
+When NumPy is installed, fixed-width columns are encoded through
+:mod:`spotfire_community.sbdf._vectorized` instead of the per-cell loops
+below. Both paths produce identical bytes.
 """
 
 from __future__ import annotations
 
-import csv
-import io
+import base64
+import binascii
+import operator
+import re
 import struct
-from collections import deque
-from collections.abc import Sequence
-from datetime import date, datetime, timezone
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Context, Decimal, InvalidOperation
+from functools import lru_cache
+from itertools import chain, groupby, islice
+from time import perf_counter
+from types import ModuleType
+from typing import Any
+
+_vectorized: ModuleType | None
+try:
+    from spotfire_community.sbdf import _vectorized
+except ImportError:  # NumPy is optional; use the pure-Python loops.
+    _vectorized = None
+
+
+def vectorized_available() -> bool:
+    """Whether the NumPy encoder is used for fixed-width column slices."""
+    return _vectorized is not None
+
 
 # Section IDs
 SID_FILE_HEADER = 0x01
@@ -25,20 +49,79 @@ SID_TABLE_END = 0x05
 VT_BOOL = 0x01
 VT_INT = 0x02
 VT_LONG = 0x03
+VT_FLOAT = 0x04
 VT_DOUBLE = 0x05
 VT_DATETIME = 0x06
 VT_DATE = 0x07
+VT_TIME = 0x08
+VT_TIMESPAN = 0x09
 VT_STRING = 0x0A
 VT_BINARY = 0x0C
+VT_DECIMAL = 0x0D
 
 ENC_PLAIN = 0x01
+ENC_RUN_LENGTH = 0x02
 ENC_BIT_ARRAY = 0x03
 
+# Byte width of each fixed-size value type this writer emits.
+_FIXED_WIDTHS = {
+    VT_BOOL: 1,
+    VT_INT: 4,
+    VT_LONG: 8,
+    VT_FLOAT: 4,
+    VT_DOUBLE: 8,
+    VT_DATETIME: 8,
+    VT_DATE: 8,
+    VT_TIME: 8,
+    VT_TIMESPAN: 8,
+    VT_DECIMAL: 16,
+}
+
+# Encoded bytes as produced by the packers; bytearrays are not copied to bytes.
+Payload = bytes | bytearray
+
+# Called with ``(count, payload, invalid_bits, cells)`` for every column slice
+# encoded, before the payload is run-length encoded; see ``_stats``.
+SliceObserver = Callable[[int, Payload, bytes | None, list[Payload] | None], None]
+
+# Encoding phases a ColumnClock tells apart, in the order they run.
+PHASES = ("parse", "pack", "strings", "bits", "encode")
+
+
+class ColumnClock:
+    """Time spent by one column in each encoding phase, and bytes produced.
+
+    The encoders call :meth:`lap` at each phase boundary when given a clock,
+    and skip the calls entirely otherwise. Picklable, so clocks can travel
+    back from worker processes with the slice they timed.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.nbytes = 0
+        self._last = 0.0
+
+    def start(self) -> None:
+        """Begin timing; the next :meth:`lap` is measured from here."""
+        self._last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap (or start) to *phase*."""
+        now = perf_counter()
+        self.seconds[phase] += now - self._last
+        self._last = now
+
+
+# A run-length entry is one byte holding (run length - 1), so runs are capped.
+_MAX_RUN = 256
+# Leading cells inspected before paying for a full run-length scan.
+_RLE_PROBE = 64
+
 MAGIC = b"\xdf\x5b"
 
 # Spotfire SBDF stores Date and DateTime as int64 milliseconds since
 # 0001-01-01 00:00:00 UTC. See pod2co/sbdf crate for reference semantics.
-_SBDF_EPOCH = datetime(1, 1, 1, tzinfo=timezone.utc)
+SBDF_EPOCH = datetime(1, 1, 1, tzinfo=timezone.utc)
 
 
 # ---------------------------------------------------------------------------
@@ -75,6 +158,11 @@ def str_p(s: str) -> bytes:
     return pack7(len(enc)) + enc
 
 
+def bytes_p(b: bytes | bytearray | memoryview) -> bytes:
+    """Bytes packed: pack7(len) + data."""
+    return pack7(len(b)) + bytes(b)
+
+
 def bytes_u(b: bytes) -> bytes:
     """Bytes unpacked: i32(len) + data."""
     return i32(len(b)) + b
@@ -96,17 +184,76 @@ def _timedelta_ms(dt: datetime) -> int:
     large deltas; computing from ``days``/``seconds``/``microseconds`` keeps
     the result exact and deterministic.
     """
-    delta = dt - _SBDF_EPOCH
+    delta = dt - SBDF_EPOCH
     return delta.days * 86_400_000 + delta.seconds * 1000 + delta.microseconds // 1000
 
 
+# Bounded memo for string -> milliseconds results. Date columns typically hold
+# few distinct values across many rows, so most cells become a dict lookup.
+_PARSE_CACHE_SIZE = 4096
+
+_MS_PER_DAY = 86_400_000
+
+
+def _fast_date_ms(s: str) -> int | None:
+    """Milliseconds for a strict ``YYYY-MM-DD`` prefix of *s*, else ``None``.
+
+    Only ASCII-digit fields in the fixed layout are handled; anything else
+    (including out-of-range fields) is left to the ``fromisoformat`` path.
+    """
+    if len(s) < 10 or s[4] != "-" or s[7] != "-" or not s.isascii():
+        return None
+    y, m, d = s[0:4], s[5:7], s[8:10]
+    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+        return None
+    try:
+        ordinal = date(int(y), int(m), int(d)).toordinal()
+    except ValueError:
+        return None
+    return (ordinal - 1) * _MS_PER_DAY
+
+
+def _fast_datetime_ms(s: str) -> int | None:
+    """Milliseconds for ``YYYY-MM-DD[Thh:mm:ss[.fff|.ffffff]][Z]``, else ``None``.
+
+    Handles the fixed-layout shapes that dominate exported data without
+    building ``datetime`` objects. ``None`` means "not handled here", never
+    "invalid": the caller then falls back to ``fromisoformat``.
+    """
+    n = len(s)
+    if n and s[-1] == "Z":
+        n -= 1
+    day_ms = _fast_date_ms(s)
+    if day_ms is None:
+        return None
+    if n == 10 == len(s):
+        return day_ms
+    if n not in (19, 23, 26) or s[10] not in "T " or s[13] != ":" or s[16] != ":":
+        return None
+    hh, mm, ss = s[11:13], s[14:16], s[17:19]
+    frac = s[20:n]
+    if not (hh.isdigit() and mm.isdigit() and ss.isdigit()):
+        return None
+    if frac and (s[19] != "." or not frac.isdigit()):
+        return None
+    h, mi, sec = int(hh), int(mm), int(ss)
+    if h > 23 or mi > 59 or sec > 59:
+        return None
+    ms = int(frac[:3]) if frac else 0
+    return day_ms + h * 3_600_000 + mi * 60_000 + sec * 1000 + ms
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def _parse_datetime_ms(s: str) -> int | None:
     """Parse *s* as an ISO-8601 datetime; return milliseconds since SBDF epoch.
 
     Accepts a trailing ``Z`` (UTC) which ``datetime.fromisoformat`` does not
     handle natively on Python 3.10. Naive inputs (no offset) are interpreted
-    as UTC. Returns ``None`` if *s* cannot be parsed.
+    as UTC. Returns ``None`` if *s* cannot be parsed. Results are memoised.
     """
+    fast = _fast_datetime_ms(s)
+    if fast is not None:
+        return fast
     normalized = s[:-1] + "+00:00" if s.endswith("Z") else s
     try:
         dt = datetime.fromisoformat(normalized)
@@ -117,16 +264,130 @@ def _parse_datetime_ms(s: str) -> int | None:
     return _timedelta_ms(dt)
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def _parse_date_ms(s: str) -> int | None:
     """Parse *s* as an ISO date (YYYY-MM-DD); return milliseconds since SBDF epoch.
 
-    Returns ``None`` if *s* cannot be parsed.
+    Returns ``None`` if *s* cannot be parsed. Results are memoised.
     """
+    if len(s) == 10:
+        fast = _fast_date_ms(s)
+        if fast is not None:
+            return fast
     try:
         d = date.fromisoformat(s)
     except ValueError:
         return None
-    return _timedelta_ms(datetime(d.year, d.month, d.day, tzinfo=timezone.utc))
+    return (d.toordinal() - 1) * _MS_PER_DAY
+
+
+# ---------------------------------------------------------------------------
+# Float/Time/TimeSpan/Decimal/Binary helpers
+# ---------------------------------------------------------------------------
+
+_FLOAT32 = struct.Struct("<f")
+
+
+def _float32(v: float) -> float:
+    """Round *v* to single precision; ``OverflowError`` if it does not fit."""
+    return _FLOAT32.unpack(_FLOAT32.pack(v))[0]
+
+
+def _parse_float32(s: str) -> float:
+    return _float32(float(s))
+
+
+def _time_ms(t: time) -> int:
+    """Milliseconds since midnight for a time of day (SBDF Time)."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1000 + t.microsecond // 1000
+
+
+def _timespan_ms(td: timedelta) -> int:
+    """Whole milliseconds in *td*, truncated toward zero (SBDF TimeSpan)."""
+    us = (td.days * 86_400 + td.seconds) * 1_000_000 + td.microseconds
+    return us // 1000 if us >= 0 else -(-us // 1000)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_time_ms(s: str) -> int | None:
+    """Parse an ISO time of day (``hh:mm[:ss[.fff]]``); ``None`` if invalid.
+
+    Times with a UTC offset are rejected, since SBDF Time has no time zone.
+    """
+    try:
+        t = time.fromisoformat(s)
+    except ValueError:
+        return None
+    return None if t.tzinfo is not None else _time_ms(t)
+
+
+# ``[-][d.]hh:mm:ss[.fffffff]`` (.NET TimeSpan, as Spotfire displays them),
+# or ``[-]d day[s], h:mm:ss[.ffffff]`` (``str(timedelta)``).
+_TIMESPAN = re.compile(
+    r"(?P<neg>-)?(?:(?P<days>\d+)(?:\.|(?P<word> days?, )))?"
+    r"(?P<h>\d+):(?P<m>[0-5]\d):(?P<s>[0-5]\d)(?:\.(?P<f>\d{1,7}))?"
+)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_timespan_ms(s: str) -> int | None:
+    """Parse a duration string into whole milliseconds; ``None`` if invalid.
+
+    In the ``str(timedelta)`` form only the day count carries the sign
+    (``-1 day, 23:00:00`` is minus one hour); in the .NET form the sign
+    applies to the whole span.
+    """
+    match = _TIMESPAN.fullmatch(s.strip())
+    if match is None:
+        return None
+    days = int(match["days"] or 0)
+    ms = (int(match["h"]) * 60 + int(match["m"])) * 60_000 + int(match["s"]) * 1000
+    ms += int((match["f"] or "0")[:3].ljust(3, "0"))
+    if match["word"]:
+        return (-days if match["neg"] else days) * _MS_PER_DAY + ms
+    ms += days * _MS_PER_DAY
+    return -ms if match["neg"] else ms
+
+
+# SBDF Decimal is an IEEE 754-2008 decimal128 in the binary integer decimal
+# (BID) layout: sign bit, 14-bit biased exponent, 113-bit coefficient.
+_DECIMAL_BIAS = 6176
+_DECIMAL_EXP_MAX = 6111
+_DECIMAL_CONTEXT = Context(prec=34)
+
+
+def _decimal_bytes(v: Decimal) -> bytes:
+    """Encode *v* as decimal128 (BID), rounding to 34 significant digits.
+
+    Raises:
+        ValueError: If *v* is NaN, infinite or its exponent is out of range.
+    """
+    if not v.is_finite():
+        raise ValueError(f"{v} has no SBDF Decimal representation")
+    if len(v.as_tuple().digits) > 34:
+        v = _DECIMAL_CONTEXT.plus(v)
+    sign, digits, exponent = v.as_tuple()
+    assert isinstance(exponent, int)
+    if not -_DECIMAL_BIAS <= exponent <= _DECIMAL_EXP_MAX:
+        raise ValueError(f"{v} is out of the SBDF Decimal range")
+    coefficient = int("".join(map(str, digits)) or "0")
+    bits = sign << 127 | (exponent + _DECIMAL_BIAS) << 113 | coefficient
+    return bits.to_bytes(16, "little")
+
+
+def _parse_decimal_bytes(s: str) -> bytes:
+    try:
+        return _decimal_bytes(Decimal(s))
+    except InvalidOperation:
+        raise ValueError(f"{s!r} is not a decimal number") from None
+
+
+def _parse_binary(s: str) -> bytes:
+    """Decode a Base64 cell (the text form of SBDF Binary values)."""
+    try:
+        return base64.b64decode(s, validate=True)
+    except binascii.Error:
+        raise ValueError(f"{s!r} is not valid Base64") from None
 
 
 # ---------------------------------------------------------------------------
@@ -143,40 +404,143 @@ def _parse_bool(s: str) -> bool | None:
     return None
 
 
-def infer_type(sample: list[str]) -> int:
+# Candidate types in the order inference prefers them. A column keeps every
+# candidate that accepted all of its non-empty values so far and resolves to
+# the first one left; String is the implicit top of the lattice.
+_INFERENCE_ORDER: tuple[int, ...] = (
+    VT_BOOL,
+    VT_INT,
+    VT_LONG,
+    VT_DOUBLE,
+    VT_DATE,
+    VT_DATETIME,
+    VT_TIME,
+    VT_TIMESPAN,
+)
+
+# The chain each candidate widens along; a type only widens within its chain
+# (Bool has none of its own, so anything else sends it straight to String).
+# Float, Decimal and Binary are never inferred from text: Float and Decimal
+# join the Double chain, and Binary only joins String.
+_WIDENS_TO: dict[int, tuple[int, ...]] = {
+    VT_BOOL: (VT_BOOL,),
+    VT_INT: (VT_INT, VT_LONG, VT_DOUBLE),
+    VT_LONG: (VT_LONG, VT_DOUBLE),
+    VT_FLOAT: (VT_DOUBLE,),
+    VT_DOUBLE: (VT_DOUBLE,),
+    VT_DECIMAL: (VT_DOUBLE,),
+    VT_DATE: (VT_DATE, VT_DATETIME),
+    VT_DATETIME: (VT_DATETIME,),
+    VT_TIME: (VT_TIME, VT_TIMESPAN),
+    VT_TIMESPAN: (VT_TIMESPAN,),
+    VT_STRING: (),
+    VT_BINARY: (),
+}
+
+
+def _narrow(candidates: list[int], v: str) -> list[int]:
+    """Return the members of *candidates* that accept the non-empty value *v*.
+
+    Only the parsers for types still in play run, and ``int()`` runs at most
+    once for both Int and Long, so a settled column costs one parse per value.
+    """
+    keep: list[int] = []
+    as_int: int | None = None
+    int_parsed = False
+    for t in candidates:
+        if t == VT_BOOL:
+            ok = _parse_bool(v) is not None
+        elif t == VT_INT or t == VT_LONG:
+            if not int_parsed:
+                int_parsed = True
+                try:
+                    as_int = int(v)
+                except ValueError:
+                    as_int = None
+            bound = 2**31 if t == VT_INT else 2**63
+            ok = as_int is not None and -bound <= as_int < bound
+        elif t == VT_DOUBLE:
+            try:
+                float(v)
+                ok = True
+            except ValueError:
+                ok = False
+        elif t == VT_DATE:
+            # "T"/" " excluded so date-times never settle as Date, even where
+            # date.fromisoformat is lenient enough to accept them.
+            ok = "T" not in v and " " not in v and _parse_date_ms(v) is not None
+        elif t == VT_DATETIME:
+            ok = _parse_datetime_ms(v) is not None
+        elif t == VT_TIME:
+            ok = _parse_time_ms(v) is not None
+        else:  # VT_TIMESPAN
+            ok = _parse_timespan_ms(v) is not None
+        if ok:
+            keep.append(t)
+    return keep
+
+
+class InferenceState:
+    """Single-pass, incremental type inference over stringified rows.
+
+    Each column tracks the candidate types that have accepted all of its
+    non-empty values so far, so every value is checked only against types
+    still in play and memory does not grow with the number of rows observed.
+    Empty strings are treated as null and do not constrain the type.
+    """
+
+    def __init__(self, num_cols: int) -> None:
+        self._candidates: list[list[int]] = [
+            list(_INFERENCE_ORDER) for _ in range(num_cols)
+        ]
+        self._seen = [False] * num_cols
+
+    def observe(self, row: Sequence[str]) -> None:
+        """Narrow every column by one row; missing trailing cells are null."""
+        for c, candidates in enumerate(self._candidates):
+            if not candidates or c >= len(row):
+                continue
+            v = row[c]
+            if v:
+                self._seen[c] = True
+                self._candidates[c] = _narrow(candidates, v)
+
+    def observe_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        for row in rows:
+            self.observe(row)
+
+    def widen(self, column: int, vtype: int) -> int:
+        """Widen *column* so that its type is at least *vtype*; return the result.
+
+        Widening follows the lattice Int → Long → Double, Date → DateTime
+        and Time → TimeSpan (Float and Decimal widen to Double); joining
+        types from different chains (or Bool with anything else) yields
+        String. Widening never narrows a column.
+        """
+        allowed = set(_WIDENS_TO[vtype])
+        self._seen[column] = True
+        self._candidates[column] = [t for t in self._candidates[column] if t in allowed]
+        return self.types[column]
+
+    @property
+    def types(self) -> list[int]:
+        return [
+            candidates[0] if seen and candidates else VT_STRING
+            for candidates, seen in zip(self._candidates, self._seen)
+        ]
+
+
+def infer_type(sample: Iterable[str]) -> int:
     """Pick the most specific SBDF value type that accepts every non-empty value.
 
-    Tries in order: Bool, Int, Long, Double, Date, DateTime, then falls back
-    to String. Empty strings are treated as null and do not constrain the type.
+    Tries in order: Bool, Int, Long, Double, Date, DateTime, Time, TimeSpan,
+    then falls back to String. Empty strings are treated as null and do not
+    constrain the type.
     """
-    nz = [v for v in sample if v]
-    if not nz:
-        return VT_STRING
-    if all(_parse_bool(v) is not None for v in nz):
-        return VT_BOOL
-    try:
-        parsed = [int(v) for v in nz]
-        if all(-(2**31) <= n <= 2**31 - 1 for n in parsed):
-            return VT_INT
-        if all(-(2**63) <= n <= 2**63 - 1 for n in parsed):
-            return VT_LONG
-    except ValueError:
-        pass
-    try:
-        for v in nz:
-            float(v)
-        return VT_DOUBLE
-    except ValueError:
-        pass
-    # Date is checked before DateTime so "YYYY-MM-DD" stays Date rather than
-    # promoting to DateTime (datetime.fromisoformat accepts bare dates).
-    if all(_parse_date_ms(v) is not None for v in nz) and not any(
-        "T" in v or " " in v for v in nz
-    ):
-        return VT_DATE
-    if all(_parse_datetime_ms(v) is not None for v in nz):
-        return VT_DATETIME
-    return VT_STRING
+    state = InferenceState(1)
+    for v in sample:
+        state.observe((v,))
+    return state.types[0]
 
 
 # ---------------------------------------------------------------------------
@@ -184,7 +548,9 @@ def infer_type(sample: list[str]) -> int:
 # ---------------------------------------------------------------------------
 
 
-def _bit_array_bytes(flags: list[bool]) -> bytes:
+def _bit_array_bytes(flags: Sequence[int]) -> bytes:
+    if _vectorized is not None:
+        return _vectorized.bit_array_bytes(flags)
     buf = bytearray((len(flags) + 7) // 8)
     for i, f in enumerate(flags):
         if f:
@@ -192,14 +558,280 @@ def _bit_array_bytes(flags: list[bool]) -> bytes:
     return bytes(buf)
 
 
-def column_slice(values: list[str], vtype: int) -> bytes:
-    """Encode one column as a ColumnSlice (section marker + values + props).
+def _is_invalid_props_into(out: bytearray, count: int, bit_bytes: bytes | None) -> None:
+    """Append the column-slice property block (IsInvalid only, if any)."""
+    if bit_bytes is None:
+        out += i32(0)
+        return
+    out += i32(1)
+    out += str_u("IsInvalid")
+    out += bytes([ENC_BIT_ARRAY, VT_BOOL])
+    out += i32(count)
+    out += bit_bytes
+
+
+def _split_cells(payload: Payload, width: int) -> list[Payload]:
+    return [payload[i : i + width] for i in range(0, len(payload), width)]
+
+
+def split_packed(payload: Payload, count: int) -> list[Payload]:
+    """Split concatenated 7-bit length-prefixed items back into cells."""
+    cells: list[Payload] = []
+    pos = 0
+    for _ in range(count):
+        start = pos
+        n = 0
+        shift = 0
+        while True:
+            b = payload[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            if not b & 0x80:
+                break
+            shift += 7
+        pos += n
+        cells.append(payload[start:pos])
+    return cells
+
+
+def _runs(cells: Sequence[Payload]) -> list[tuple[Payload, int]]:
+    """Group equal consecutive cells into ``(cell, run_length)`` pairs.
+
+    Cells are compared as encoded bytes, so e.g. ``0.0`` and ``-0.0`` stay
+    distinct and every NaN payload is preserved exactly.
+    """
+    return [(cell, sum(1 for _ in group)) for cell, group in groupby(cells)]
+
+
+def _fixed_runs(payload: Payload, width: int) -> list[tuple[Payload, int]]:
+    if _vectorized is not None:
+        return [
+            (payload[start * width : (start + 1) * width], length)
+            for start, length in _vectorized.runs(payload, width)
+        ]
+    return _runs(_split_cells(payload, width))
+
+
+def _run_length_into(
+    out: bytearray,
+    vtype: int,
+    count: int,
+    runs: list[tuple[Payload, int]],
+    packed: bool,
+) -> None:
+    """Append *runs* as a run-length value array.
+
+    Layout: total value count, then a byte array of ``run length - 1`` per
+    run, then a plain array holding one value per run.
+    """
+    lengths = bytearray()
+    values: list[Payload] = []
+    for cell, n in runs:
+        while n > 0:
+            take = min(n, _MAX_RUN)
+            lengths.append(take - 1)
+            values.append(cell)
+            n -= take
+    out += bytes([ENC_RUN_LENGTH, vtype])
+    out += i32(count)
+    out += i32(len(lengths))
+    out += lengths
+    out += i32(len(values))
+    if packed:
+        out += i32(sum(map(len, values)))
+    for cell in values:
+        out += cell
+
+
+def _run_length_size(runs: list[tuple[Payload, int]], packed: bool) -> int:
+    entries = sum((n + _MAX_RUN - 1) // _MAX_RUN for _, n in runs)
+    data = sum(len(cell) * ((n + _MAX_RUN - 1) // _MAX_RUN) for cell, n in runs)
+    return 2 + 4 + 4 + entries + 4 + (4 if packed else 0) + data
+
+
+def _value_array_into(
+    out: bytearray,
+    vtype: int,
+    count: int,
+    payload: Payload,
+    encoding: int | None = None,
+    cells: list[Payload] | None = None,
+) -> None:
+    """Append a column's values, encoded from their packed plain payload.
+
+    Args:
+        out: Buffer the value array is appended to.
+        vtype: SBDF value type of the column.
+        count: Number of values.
+        payload: The plain encoding of the values (fixed-width cells, or the
+            concatenated 7-bit length-prefixed items for String).
+        encoding: ``ENC_PLAIN``, ``ENC_RUN_LENGTH`` or ``ENC_BIT_ARRAY`` to
+            force an encoding, or ``None`` to pick the smallest. Bit arrays
+            apply to Bool only. Run-length is only tried automatically when
+            the leading cells show repetition, so high-cardinality columns
+            skip the full scan.
+        cells: The individual String items, when already at hand.
+
+    Raises:
+        ValueError: If a bit array is forced for a non-Bool column.
+    """
+    packed = vtype not in _FIXED_WIDTHS
+    if encoding == ENC_BIT_ARRAY and vtype != VT_BOOL and count:
+        raise ValueError("Bit-array encoding is only valid for Bool columns")
+
+    # Candidate sizes are computed up front so only the winner is written.
+    best, best_size = ENC_PLAIN, 2 + 4 + (4 if packed else 0) + len(payload)
+    if encoding == ENC_PLAIN or count == 0:
+        encoding = ENC_PLAIN
+    elif vtype == VT_BOOL and encoding in (None, ENC_BIT_ARRAY):
+        bits_size = 2 + 4 + (count + 7) // 8
+        if encoding == ENC_BIT_ARRAY or bits_size < best_size:
+            best, best_size = ENC_BIT_ARRAY, bits_size
+
+    runs: list[tuple[Payload, int]] | None = None
+    if encoding in (None, ENC_RUN_LENGTH):
+        if packed and cells is None:
+            cells = split_packed(payload, count)
+        if encoding is None:
+            if cells is not None:
+                probe = cells[:_RLE_PROBE]
+            else:
+                width = _FIXED_WIDTHS[vtype]
+                probe = _split_cells(payload[: _RLE_PROBE * width], width)
+            skip = len(_runs(probe)) > len(probe) // 2
+        else:
+            skip = False
+        if not skip:
+            if cells is not None:
+                runs = _runs(cells)
+            else:
+                runs = _fixed_runs(payload, _FIXED_WIDTHS[vtype])
+            if encoding is None and _run_length_size(runs, packed) >= best_size:
+                runs = None
+
+    if runs is not None:
+        _run_length_into(out, vtype, count, runs, packed)
+    elif best == ENC_BIT_ARRAY:
+        out += bytes([ENC_BIT_ARRAY, VT_BOOL])
+        out += i32(count)
+        out += _bit_array_bytes(list(payload))
+    else:
+        out += bytes([ENC_PLAIN, vtype])
+        out += i32(count)
+        if packed:
+            out += i32(len(payload))
+        out += payload
+
+
+def packed_column_slice_into(
+    out: bytearray,
+    vtype: int,
+    count: int,
+    payload: Payload,
+    bit_bytes: bytes | None,
+    encoding: int | None,
+    cells: list[Payload] | None = None,
+    observe: SliceObserver | None = None,
+    clock: ColumnClock | None = None,
+) -> None:
+    """Append a ColumnSlice of *count* already packed values to *out*.
+
+    *payload* holds the packed cells (or *cells* lists them one by one for
+    variable-width types) and *bit_bytes* the IsInvalid bit array, if any.
+    """
+    if observe is not None:
+        observe(count, payload, bit_bytes, cells)
+        if clock is not None:
+            clock.start()  # statistics are not part of encoding
+    out += section(SID_COLUMN_SLICE)
+    _value_array_into(out, vtype, count, payload, encoding, cells)
+    _is_invalid_props_into(out, count, bit_bytes)
+    if clock is not None:
+        clock.lap("encode")
+
+
+# NumPy dtype and per-cell parser for each fixed-width type the vectorized
+# encoder handles. Parsers must agree exactly with the loops in column_slice.
+_VECTORIZED_TYPES: dict[int, tuple[str, Callable[[str], int | float | None]]] = {
+    VT_INT: ("<i4", int),
+    VT_LONG: ("<i8", int),
+    VT_DOUBLE: ("<f8", float),
+    VT_DATETIME: ("<i8", _parse_datetime_ms),
+    VT_DATE: ("<i8", _parse_date_ms),
+    VT_FLOAT: ("<f4", _parse_float32),
+    VT_TIME: ("<i8", _parse_time_ms),
+    VT_TIMESPAN: ("<i8", _parse_timespan_ms),
+}
+
+
+def _pack_ms(ms: int | None) -> bytes | None:
+    return None if ms is None else struct.pack("<q", ms)
+
+
+# Cell packers for the fixed-width types without a loop of their own in
+# column_slice_into. Each returns the packed cell, or raises or returns
+# ``None`` for a value that is invalid for the type.
+_TEXT_PACKERS: dict[int, Callable[[str], bytes | None]] = {
+    VT_FLOAT: lambda s: _FLOAT32.pack(float(s)),
+    VT_TIME: lambda s: _pack_ms(_parse_time_ms(s)),
+    VT_TIMESPAN: lambda s: _pack_ms(_parse_timespan_ms(s)),
+    VT_DECIMAL: _parse_decimal_bytes,
+}
+
+
+def _pack_cells(
+    values: Sequence[Any], pack: Callable[[Any], bytes | None], width: int
+) -> tuple[bytearray, list[bool]]:
+    """Pack each value with *pack*; invalid cells become *width* zero bytes."""
+    arr = bytearray()
+    invalid: list[bool] = []
+    zero = bytes(width)
+    for v in values:
+        try:
+            cell = pack(v)
+        except (TypeError, ValueError, OverflowError, struct.error):
+            cell = None
+        invalid.append(cell is None)
+        arr += zero if cell is None else cell
+    return arr, invalid
+
+
+def column_slice(values: list[str], vtype: int, encoding: int | None = None) -> bytes:
+    """Encode one column as a ColumnSlice (section marker + values + props)."""
+    out = bytearray()
+    column_slice_into(out, values, vtype, encoding)
+    return bytes(out)
+
+
+def column_slice_into(
+    out: bytearray,
+    values: list[str],
+    vtype: int,
+    encoding: int | None = None,
+    observe: SliceObserver | None = None,
+    clock: ColumnClock | None = None,
+) -> None:
+    """Append one column, encoded as a ColumnSlice, to *out*.
 
     Rows that cannot be parsed as *vtype* are encoded with a placeholder value
     and marked in the column's IsInvalid bit array, matching the behaviour of
-    the existing Bool/Int/Long/Double branches.
+    the existing Bool/Int/Long/Double branches. *encoding* is passed through
+    to :func:`_value_array_into`; *observe*, if given, sees the packed values
+    and *clock*, if given and started, times each phase.
     """
+    count = len(values)
+    if _vectorized is not None and vtype in _VECTORIZED_TYPES:
+        dtype, parse = _VECTORIZED_TYPES[vtype]
+        lap = None if clock is None else clock.lap
+        payload, bit_bytes = _vectorized.pack_values(values, dtype, parse, lap)
+        packed_column_slice_into(
+            out, vtype, count, payload, bit_bytes, encoding, None, observe, clock
+        )
+        return
+
     invalid: list[bool] = []
+    cells: list[Payload] | None = None
+    arr: Payload
 
     if vtype == VT_BOOL:
         arr = bytearray()
@@ -211,8 +843,6 @@ def column_slice(values: list[str], vtype: int) -> bytes:
             else:
                 invalid.append(False)
                 arr.append(1 if b else 0)
-        payload = i32(len(values)) + bytes(arr)
-        value_bytes = bytes([ENC_PLAIN, VT_BOOL]) + payload
 
     elif vtype == VT_INT:
         arr = bytearray()
@@ -223,7 +853,6 @@ def column_slice(values: list[str], vtype: int) -> bytes:
             except (ValueError, struct.error):
                 arr += struct.pack("<i", 0)
                 invalid.append(True)
-        value_bytes = bytes([ENC_PLAIN, VT_INT]) + i32(len(values)) + bytes(arr)
 
     elif vtype == VT_LONG:
         arr = bytearray()
@@ -234,7 +863,6 @@ def column_slice(values: list[str], vtype: int) -> bytes:
             except (ValueError, struct.error):
                 arr += struct.pack("<q", 0)
                 invalid.append(True)
-        value_bytes = bytes([ENC_PLAIN, VT_LONG]) + i32(len(values)) + bytes(arr)
 
     elif vtype == VT_DOUBLE:
         arr = bytearray()
@@ -245,7 +873,6 @@ def column_slice(values: list[str], vtype: int) -> bytes:
             except (ValueError, struct.error):
                 arr += struct.pack("<d", 0.0)
                 invalid.append(True)
-        value_bytes = bytes([ENC_PLAIN, VT_DOUBLE]) + i32(len(values)) + bytes(arr)
 
     elif vtype == VT_DATETIME:
         arr = bytearray()
@@ -257,7 +884,6 @@ def column_slice(values: list[str], vtype: int) -> bytes:
             else:
                 invalid.append(False)
                 arr += struct.pack("<q", ms)
-        value_bytes = bytes([ENC_PLAIN, VT_DATETIME]) + i32(len(values)) + bytes(arr)
 
     elif vtype == VT_DATE:
         arr = bytearray()
@@ -269,34 +895,329 @@ def column_slice(values: list[str], vtype: int) -> bytes:
             else:
                 invalid.append(False)
                 arr += struct.pack("<q", ms)
-        value_bytes = bytes([ENC_PLAIN, VT_DATE]) + i32(len(values)) + bytes(arr)
+
+    elif vtype in _TEXT_PACKERS:
+        arr, invalid = _pack_cells(values, _TEXT_PACKERS[vtype], _FIXED_WIDTHS[vtype])
+
+    elif vtype == VT_BINARY:
+        cells = []
+        for s in values:
+            try:
+                cells.append(bytes_p(_parse_binary(s)) if s else b"\x00")
+                invalid.append(not s)
+            except ValueError:
+                cells.append(b"\x00")
+                invalid.append(True)
+        arr = b"".join(cells)
 
     else:  # VT_STRING
-        parts = bytearray()
+        cells = []
         for s in values:
             invalid.append(len(s) == 0)
-            parts += str_p(s)
-        value_bytes = (
-            bytes([ENC_PLAIN, VT_STRING])
-            + i32(len(values))
-            + i32(len(parts))
-            + bytes(parts)
-        )
+            cells.append(str_p(s))
+        arr = b"".join(cells)
+
+    if clock is not None:
+        # Fixed-width cells are parsed and packed in one loop, so that time
+        # is all charged to parsing.
+        clock.lap("parse" if cells is None else "strings")
+    bit_bytes = _bit_array_bytes(invalid) if any(invalid) else None
+    if clock is not None:
+        clock.lap("bits")
+    packed_column_slice_into(
+        out, vtype, count, arr, bit_bytes, encoding, cells, observe, clock
+    )
+
+
+# ---------------------------------------------------------------------------
+# Native (typed) column slice encoding
+# ---------------------------------------------------------------------------
+
+
+def _bool_value(v: object) -> bool:
+    """A ``bool`` cell; truthy or falsy non-bools (``1``, ``"false"``) are rejected."""
+    if isinstance(v, bool) or (
+        _vectorized is not None and isinstance(v, _vectorized.BOOL_SCALAR)
+    ):
+        return bool(v)
+    raise TypeError(f"expected bool, got {type(v).__name__}")
+
+
+def _int_value(v: object) -> int:
+    """An integer cell: an ``int`` (not ``bool``), integer scalar or integral float."""
+    if isinstance(v, float):
+        if not v.is_integer():
+            raise ValueError(f"non-integral float {v!r}")
+        return int(v)
+    if isinstance(v, bool):
+        raise TypeError("expected int, got bool")
+    return operator.index(v)  # type: ignore[arg-type]
+
+
+def _datetime_value_ms(v: object) -> int:
+    """Milliseconds since the SBDF epoch for a ``datetime`` (or ``date``).
+
+    Naive datetimes are interpreted as UTC, as in :func:`_parse_datetime_ms`.
+    """
+    if isinstance(v, datetime):
+        return _timedelta_ms(v if v.tzinfo else v.replace(tzinfo=timezone.utc))
+    if isinstance(v, date):
+        return _timedelta_ms(datetime(v.year, v.month, v.day, tzinfo=timezone.utc))
+    raise TypeError(f"expected date or datetime, got {type(v).__name__}")
+
+
+def _float32_value(v: object) -> float:
+    return _float32(float(v))  # type: ignore[arg-type]
+
+
+def _time_value_ms(v: object) -> int:
+    """Milliseconds since midnight for a naive ``time``."""
+    if not isinstance(v, time):
+        raise TypeError(f"expected time, got {type(v).__name__}")
+    if v.tzinfo is not None:
+        raise ValueError("SBDF Time values have no time zone")
+    return _time_ms(v)
+
+
+def _timespan_value_ms(v: object) -> int:
+    if not isinstance(v, timedelta):
+        raise TypeError(f"expected timedelta, got {type(v).__name__}")
+    return _timespan_ms(v)
+
+
+def decimal_value_bytes(v: object) -> bytes:
+    """Decimal128 cell for a ``Decimal``, ``int``, ``float`` or numeric ``str``."""
+    if isinstance(v, Decimal):
+        return _decimal_bytes(v)
+    if isinstance(v, bool) or not isinstance(v, (int, float, str)):
+        raise TypeError(f"expected Decimal, got {type(v).__name__}")
+    # repr() gives the shortest decimal that round-trips a float (0.1, not
+    # the 55-digit exact binary expansion).
+    return _parse_decimal_bytes(repr(v) if isinstance(v, float) else str(v))
+
+
+def _binary_value(v: object) -> bytes:
+    if isinstance(v, (bytes, bytearray)):
+        return bytes_p(v)
+    if isinstance(v, memoryview):
+        return bytes_p(v.tobytes())
+    raise TypeError(f"expected bytes, got {type(v).__name__}")
+
+
+def _date_value_ms(v: object) -> int:
+    """Milliseconds since the SBDF epoch for a ``date`` (time part dropped)."""
+    if isinstance(v, datetime):
+        v = v.date()
+    if isinstance(v, date):
+        return _timedelta_ms(datetime(v.year, v.month, v.day, tzinfo=timezone.utc))
+    raise TypeError(f"expected date, got {type(v).__name__}")
+
+
+# struct format code and converter for each fixed-width type. Converters raise
+# (TypeError for None) rather than return a sentinel for invalid cells.
+_NATIVE_TYPES: dict[int, tuple[str, Callable[[Any], bool | int | float]]] = {
+    VT_BOOL: ("?", _bool_value),
+    VT_INT: ("i", _int_value),
+    VT_LONG: ("q", _int_value),
+    VT_DOUBLE: ("d", float),
+    VT_DATETIME: ("q", _datetime_value_ms),
+    VT_DATE: ("q", _date_value_ms),
+    VT_FLOAT: ("f", _float32_value),
+    VT_TIME: ("q", _time_value_ms),
+    VT_TIMESPAN: ("q", _timespan_value_ms),
+}
+
+_NUMPY_DTYPES = {"?": "?", "i": "<i4", "q": "<i8", "f": "<f4", "d": "<f8"}
+
+# Buffer formats whose memory already matches the SBDF payload byte-for-byte
+# (given a little-endian host and matching item size).
+_BUFFER_FORMATS: dict[int, frozenset[str]] = {
+    VT_INT: frozenset({"i", "l"}),
+    VT_LONG: frozenset({"q", "l"}),
+    VT_FLOAT: frozenset({"f"}),
+    VT_DOUBLE: frozenset({"d"}),
+}
+
+
+def _buffer_payload(values: object, vtype: int) -> bytes | None:
+    """Return the raw bytes of *values* if it is a buffer in SBDF layout."""
+    formats = _BUFFER_FORMATS.get(vtype)
+    if formats is None or sys.byteorder != "little":
+        return None
+    try:
+        view = memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+    code = _NATIVE_TYPES[vtype][0]
+    if (
+        view.ndim != 1
+        or view.format.lstrip("@=<") not in formats
+        or view.itemsize != struct.calcsize(code)
+    ):
+        return None
+    return view.tobytes()
+
+
+def _pack_native(
+    values: Sequence[Any], vtype: int, clock: ColumnClock | None = None
+) -> tuple[bytes, bytes | None]:
+    """Pack native Python values; return ``(payload, IsInvalid bits or None)``.
+
+    Only the NumPy path reports separate phases to *clock*; elsewhere the
+    caller charges the whole call to packing.
+    """
+    buffered = _buffer_payload(values, vtype)
+    if buffered is not None:
+        return buffered, None
+    if vtype == VT_DECIMAL:
+        arr, flags = _pack_cells(values, decimal_value_bytes, _FIXED_WIDTHS[vtype])
+        return bytes(arr), _bit_array_bytes(flags) if any(flags) else None
+
+    code, convert = _NATIVE_TYPES[vtype]
+    if _vectorized is not None:
+        lap = None if clock is None else clock.lap
+        return _vectorized.pack_values(values, _NUMPY_DTYPES[code], convert, lap)
+
+    try:
+        return struct.pack(f"<{len(values)}{code}", *map(convert, values)), None
+    except (TypeError, ValueError, OverflowError, struct.error):
+        pass
+
+    single = struct.Struct(f"<{code}")
+    arr = bytearray()
+    invalid: list[bool] = []
+    for v in values:
+        try:
+            arr += single.pack(convert(v))
+            invalid.append(False)
+        except (TypeError, ValueError, OverflowError, struct.error):
+            arr += single.pack(0)
+            invalid.append(True)
+    return bytes(arr), _bit_array_bytes(invalid) if any(invalid) else None
+
+
+def column_slice_native(
+    values: Sequence[Any], vtype: int, encoding: int | None = None
+) -> bytes:
+    """Encode one column of native Python values as a ColumnSlice."""
+    out = bytearray()
+    column_slice_native_into(out, values, vtype, encoding)
+    return bytes(out)
 
-    has_invalid = any(invalid)
-    if has_invalid:
-        bit_bytes = _bit_array_bytes(invalid)
-        is_invalid = (
-            str_u("IsInvalid")
-            + bytes([ENC_BIT_ARRAY, VT_BOOL])
-            + i32(len(invalid))
-            + bit_bytes
+
+def column_slice_native_into(
+    out: bytearray,
+    values: Sequence[Any],
+    vtype: int,
+    encoding: int | None = None,
+    observe: SliceObserver | None = None,
+    clock: ColumnClock | None = None,
+) -> None:
+    """Append one column of native Python values, encoded as a ColumnSlice.
+
+    Counterpart of :func:`column_slice` for already-typed input: ``None`` marks
+    a null, ``bool`` feeds Bool, ``int`` (or an integral ``float``) feeds
+    Int/Long, ``int``/``float`` feed Float/Double, ``datetime``,
+    ``date``, ``time`` and ``timedelta`` objects feed DateTime/Date/Time/
+    TimeSpan, ``Decimal`` (or ``int``/``float``/``str``) feeds Decimal,
+    ``bytes``-like objects feed Binary, and any value is accepted for String
+    (non-``str`` values are passed through ``str()``). ``array.array`` and other
+    buffer-protocol objects whose layout matches Int/Long/Float/Double are
+    copied verbatim. Values that cannot be converted are marked invalid, as in
+    :func:`column_slice`.
+    """
+    count = len(values)
+    if vtype not in (VT_STRING, VT_BINARY):
+        payload, bit_bytes = _pack_native(values, vtype, clock)
+        if clock is not None:
+            clock.lap("pack")
+        packed_column_slice_into(
+            out, vtype, count, payload, bit_bytes, encoding, None, observe, clock
         )
-        props = i32(1) + is_invalid
-    else:
-        props = i32(0)
+        return
+
+    cells: list[Payload] = []
+    invalid: list[bool] = []
+    for v in values:
+        if v is None:
+            invalid.append(True)
+            cells.append(b"\x00")
+        elif vtype == VT_BINARY:
+            try:
+                cells.append(_binary_value(v))
+                invalid.append(False)
+            except TypeError:
+                cells.append(b"\x00")
+                invalid.append(True)
+        else:
+            invalid.append(False)
+            cells.append(str_p(v if isinstance(v, str) else str(v)))
+    payload = b"".join(cells)
+    if clock is not None:
+        clock.lap("strings")
+    bit_bytes = _bit_array_bytes(invalid) if any(invalid) else None
+    if clock is not None:
+        clock.lap("bits")
+    packed_column_slice_into(
+        out, vtype, count, payload, bit_bytes, encoding, cells, observe, clock
+    )
+
+
+# ---------------------------------------------------------------------------
+# Table slice encoding
+# ---------------------------------------------------------------------------
 
-    return section(SID_COLUMN_SLICE) + value_bytes + props
+
+def table_slice(
+    rows: Sequence[Sequence[str]],
+    vtypes: Sequence[int],
+    encodings: Sequence[int | None] | None = None,
+) -> bytes:
+    """Encode stringified rows as one TableSlice section.
+
+    Returns ``b""`` for an empty batch. Module-level (and so picklable) so
+    that slices can be encoded in worker processes.
+    """
+    out = bytearray()
+    table_slice_into(out, rows, vtypes, encodings)
+    return bytes(out)
+
+
+def table_slice_into(
+    out: bytearray,
+    rows: Sequence[Sequence[str]],
+    vtypes: Sequence[int],
+    encodings: Sequence[int | None] | None = None,
+    observers: Sequence[SliceObserver] | None = None,
+    clocks: Sequence[ColumnClock] | None = None,
+) -> None:
+    """Append stringified rows, encoded as one TableSlice section, to *out*.
+
+    Rows shorter than ``len(vtypes)`` are padded with empty strings; extra
+    elements are ignored. Nothing is appended for an empty batch.
+    *observers* and *clocks*, if given, hold one :data:`SliceObserver` or
+    :class:`ColumnClock` per column.
+    """
+    if not rows:
+        return
+    num_cols = len(vtypes)
+    if encodings is None:
+        encodings = [None] * num_cols
+    padded = [[row[i] if i < len(row) else "" for i in range(num_cols)] for row in rows]
+    out += section(SID_TABLE_SLICE)
+    out += i32(num_cols)
+    for c in range(num_cols):
+        observe = None if observers is None else observers[c]
+        if clocks is None:
+            column_slice_into(
+                out, [r[c] for r in padded], vtypes[c], encodings[c], observe
+            )
+            continue
+        clock, start = clocks[c], len(out)
+        clock.start()
+        values = [r[c] for r in padded]
+        column_slice_into(out, values, vtypes[c], encodings[c], observe, clock)
+        clock.nbytes += len(out) - start
 
 
 # ---------------------------------------------------------------------------
@@ -332,59 +1253,154 @@ def table_metadata(headers: Sequence[str], vtypes: Sequence[int]) -> bytes:
 
 
 # ---------------------------------------------------------------------------
-# Public entry point (used by create_sbdf)
+# Byte-budgeted slice sizing
 # ---------------------------------------------------------------------------
 
+# Upper bound on rows per slice in byte-budgeted mode, so one tiny-width
+# estimate cannot produce an unbounded batch.
+MAX_ADAPTIVE_ROWS = 1_000_000
 
-def csv_to_sbdf(
-    csv_bytes: bytes,
-    chunk_size: int = 10_000,
-    sample_rows: int = 1_000,
-) -> bytes:
-    reader = csv.reader(io.StringIO(csv_bytes.decode()))
-    headers = next(reader, None)
-    if headers is None:
-        raise ValueError("CSV has no header row")
-    num_cols = len(headers)
 
-    def _pad(row: list[str]) -> list[str]:
-        return [row[i] if i < len(row) else "" for i in range(num_cols)]
-
-    # Phase 1: sample rows for type inference
-    sampled: list[list[str]] = []
-    for _, row in zip(range(sample_rows), reader):
-        sampled.append(_pad(row))
+class SliceSizer:
+    """Predict how many rows fit in a byte budget from recently encoded slices.
 
-    vtypes = [infer_type([r[c] for r in sampled]) for c in range(num_cols)]
+    The encoded width of a row is tracked as an exponentially weighted
+    average of ``bytes / rows`` over the slices reported to :meth:`observe`,
+    so the row count follows gradual changes in the data (e.g. string
+    lengths) without overreacting to a single unusual slice. The first
+    slice, before any estimate exists, has ``initial_rows`` rows.
+    """
 
-    out = bytearray()
-    out += section(SID_FILE_HEADER) + bytes([1, 0])
-    out += section(SID_TABLE_METADATA) + table_metadata(headers, vtypes)
+    def __init__(
+        self,
+        target_bytes: int,
+        *,
+        initial_rows: int = 1_000,
+        max_rows: int = MAX_ADAPTIVE_ROWS,
+        smoothing: float = 0.5,
+    ) -> None:
+        if target_bytes < 1:
+            raise ValueError("slice_bytes must be at least 1")
+        self._target = target_bytes
+        self._initial_rows = max(1, min(initial_rows, max_rows))
+        self._max_rows = max_rows
+        self._smoothing = smoothing
+        self._bytes_per_row: float | None = None
+
+    @property
+    def bytes_per_row(self) -> float | None:
+        """Current estimate of encoded bytes per row (``None`` before data)."""
+        return self._bytes_per_row
+
+    def next_rows(self) -> int:
+        """Number of rows the next slice should hold."""
+        if self._bytes_per_row is None:
+            return self._initial_rows
+        rows = int(self._target / max(self._bytes_per_row, 1e-9))
+        return max(1, min(rows, self._max_rows))
+
+    def observe(self, rows: int, nbytes: int) -> None:
+        """Record that a slice of *rows* rows encoded to *nbytes* bytes."""
+        if rows < 1:
+            return
+        width = nbytes / rows
+        if self._bytes_per_row is None:
+            self._bytes_per_row = width
+        else:
+            a = self._smoothing
+            self._bytes_per_row = a * width + (1 - a) * self._bytes_per_row
+
+
+def regroup_rows(
+    batches: Iterable[Sequence[Sequence[str]]], sizer: SliceSizer
+) -> Iterator[list[Sequence[str]]]:
+    """Re-batch rows from *batches* into slices of ``sizer.next_rows()`` rows.
+
+    The sizer is consulted afresh for every slice, so callers that report
+    each encoded slice back to it get slices tracking the byte budget.
+    """
+    rows = chain.from_iterable(batches)
+    while batch := list(islice(rows, sizer.next_rows())):
+        yield batch
 
-    # Phase 2: stream table slices from sampled queue + remaining rows
-    queue: deque[list[str]] = deque(sampled)
 
-    while True:
-        while len(queue) < chunk_size:
-            row = next(reader, None)
-            if row is None:
-                break
-            queue.append(_pad(row))
+# ---------------------------------------------------------------------------
+# Streaming CSV/rows → SBDF (used by create_sbdf and friends)
+# ---------------------------------------------------------------------------
 
-        if not queue:
-            break
 
-        take = min(chunk_size, len(queue))
-        chunk = [queue.popleft() for _ in range(take)]
-        at_eof = take < chunk_size
+def rows_to_sbdf_views(
+    rows: Iterable[Sequence[str]],
+    chunk_size: int = 10_000,
+    sample_rows: int = 1_000,
+    column_types: Sequence[int] | None = None,
+    slice_bytes: int | None = None,
+) -> Iterator[memoryview]:
+    """Yield a complete SBDF file, one section at a time, from stringified rows.
+
+    Each section is encoded straight into its own buffer and yielded as a
+    read-only :class:`memoryview` of it, without a final copy to ``bytes``.
+    The first row is the header. Unless *column_types* is given, column types
+    are inferred from the next *sample_rows* rows, which are then replayed
+    into the first slices, so at most ``max(sample_rows, chunk_size)`` rows
+    are held at once and the input is consumed lazily.
+
+    With *slice_bytes*, slices target that many encoded bytes instead of a
+    fixed row count: the first slice has *chunk_size* rows, and later ones
+    are sized from the bytes per row observed so far (see
+    :class:`SliceSizer`).
+
+    Raises:
+        ValueError: If there is no header row, *chunk_size* or *slice_bytes*
+            is not positive, or *column_types* does not match the header.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    sizer = (
+        None
+        if slice_bytes is None
+        else SliceSizer(slice_bytes, initial_rows=chunk_size)
+    )
+    it = iter(rows)
+    header = next(it, None)
+    if header is None:
+        raise ValueError("CSV has no header row")
+    headers = list(header)
+    num_cols = len(headers)
+    if column_types is not None and len(column_types) != num_cols:
+        raise ValueError(
+            f"CSV has {num_cols} columns but {len(column_types)} types were given"
+        )
 
-        out += section(SID_TABLE_SLICE)
-        out += i32(num_cols)
-        for c in range(num_cols):
-            out += column_slice([r[c] for r in chunk], vtypes[c])
+    def _pad(row: Sequence[str]) -> list[str]:
+        return [row[i] if i < len(row) else "" for i in range(num_cols)]
 
-        if at_eof:
-            break
+    # Phase 1: sample rows for type inference (unless types are given)
+    sampled = [_pad(row) for row in islice(it, sample_rows)]
+    if column_types is None:
+        state = InferenceState(num_cols)
+        state.observe_rows(sampled)
+        vtypes = state.types
+    else:
+        vtypes = list(column_types)
+
+    yield memoryview(
+        section(SID_FILE_HEADER)
+        + bytes([1, 0])
+        + section(SID_TABLE_METADATA)
+        + table_metadata(headers, vtypes)
+    )
+
+    # Phase 2: stream table slices from the sample followed by remaining rows
+    remaining = chain(sampled, it)
+    del sampled
+    while batch := list(
+        islice(remaining, chunk_size if sizer is None else sizer.next_rows())
+    ):
+        out = bytearray()
+        table_slice_into(out, batch, vtypes)
+        if sizer is not None:
+            sizer.observe(len(batch), len(out))
+        yield memoryview(out).toreadonly()
 
-    out += section(SID_TABLE_END)
-    return bytes(out)
+    yield memoryview(section(SID_TABLE_END))
@@ -0,0 +1,18 @@
+"""Exceptions raised by the SBDF reader and writer."""
+
+
+class SbdfFormatError(Exception):
+    """
+    Exception raised when input is not a well-formed SBDF stream.
+
+    Args:
+        message (str): Description of the error.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+__all__ = [
+    "SbdfFormatError",
+]
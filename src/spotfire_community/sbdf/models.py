@@ -0,0 +1,289 @@
+"""Public models for SBDF value types and decoded table contents."""
+
+from __future__ import annotations
+
+import struct
+from bisect import bisect_right
+from enum import IntEnum
+from typing import Any, NamedTuple
+
+from spotfire_community.sbdf._writer import (
+    ENC_BIT_ARRAY,
+    ENC_PLAIN,
+    ENC_RUN_LENGTH,
+    VT_BINARY,
+    VT_BOOL,
+    VT_DATE,
+    VT_DATETIME,
+    VT_DECIMAL,
+    VT_DOUBLE,
+    VT_FLOAT,
+    VT_INT,
+    VT_LONG,
+    VT_STRING,
+    VT_TIME,
+    VT_TIMESPAN,
+)
+from spotfire_community.sbdf.errors import SbdfFormatError
+
+# Sidecar index layout: magic, version byte, then little-endian int64s
+# (slice count, row count, TableEnd offset, slice offsets, slice first rows).
+_INDEX_MAGIC = b"SBDFIDX"
+_INDEX_VERSION = 1
+
+
+class ValueType(IntEnum):
+    """
+    SBDF column value types supported by this package.
+
+    Attributes:
+        BOOL: ``bool``.
+        INT: 32-bit signed integer.
+        LONG: 64-bit signed integer.
+        DOUBLE: 64-bit float.
+        DATETIME: ``datetime`` with millisecond precision (UTC).
+        DATE: ``date``.
+        STRING: ``str``.
+        FLOAT: 32-bit float, half the size of ``DOUBLE``.
+        TIME: Time of day (``time``) with millisecond precision.
+        TIMESPAN: Duration (``timedelta``) with millisecond precision.
+        DECIMAL: ``Decimal`` with up to 34 significant digits.
+        BINARY: ``bytes``.
+    """
+
+    BOOL = VT_BOOL
+    INT = VT_INT
+    LONG = VT_LONG
+    DOUBLE = VT_DOUBLE
+    DATETIME = VT_DATETIME
+    DATE = VT_DATE
+    STRING = VT_STRING
+    FLOAT = VT_FLOAT
+    TIME = VT_TIME
+    TIMESPAN = VT_TIMESPAN
+    DECIMAL = VT_DECIMAL
+    BINARY = VT_BINARY
+
+
+class ValueEncoding(IntEnum):
+    """
+    SBDF value-array encodings a column slice can be written with.
+
+    Attributes:
+        PLAIN: One value after another.
+        RUN_LENGTH: Runs of equal consecutive values stored once with a
+            repeat count. Shrinks sorted and low-cardinality columns.
+        BIT_ARRAY: One bit per value. Bool columns only.
+    """
+
+    PLAIN = ENC_PLAIN
+    RUN_LENGTH = ENC_RUN_LENGTH
+    BIT_ARRAY = ENC_BIT_ARRAY
+
+
+class SbdfTableMetadata(NamedTuple):
+    """
+    Table-level information decoded from an SBDF ``TableMetadata`` section.
+
+    Attributes:
+        headers (list[str]): Column names, in order.
+        column_types (list[ValueType]): Value type of each column.
+    """
+
+    headers: list[str]
+    column_types: list[ValueType]
+
+
+class SbdfColumnSlice(NamedTuple):
+    """
+    One column of one decoded ``TableSlice``.
+
+    Attributes:
+        values (list[Any]): Decoded values. Rows flagged invalid hold the
+            placeholder value that was written for them.
+        invalid (list[bool] | None): The column's ``IsInvalid`` flags, or
+            ``None`` when the slice carries no such property.
+    """
+
+    values: list[Any]
+    invalid: list[bool] | None
+
+    def to_list(self) -> list[Any]:
+        """Return the values with ``None`` in place of every invalid row."""
+        if self.invalid is None:
+            return list(self.values)
+        return [None if bad else v for v, bad in zip(self.values, self.invalid)]
+
+
+class SbdfTableSlice(NamedTuple):
+    """
+    One decoded ``TableSlice``: a horizontal band of rows across all columns.
+
+    Attributes:
+        columns (list[SbdfColumnSlice]): One entry per column, in order.
+    """
+
+    columns: list[SbdfColumnSlice]
+
+    @property
+    def row_count(self) -> int:
+        return len(self.columns[0].values) if self.columns else 0
+
+
+class SbdfColumnStats(NamedTuple):
+    """
+    Summary of the values written to one column, for data-quality checks.
+
+    Attributes:
+        row_count (int): Rows written.
+        null_count (int): Rows written as null or invalid (including empty
+            strings and cells that could not be parsed as the column type).
+        min (Any): Smallest valid value, or ``None`` if there is none. NaNs
+            are ignored; strings compare by code point.
+        max (Any): Largest valid value, or ``None`` if there is none.
+        distinct (int): HyperLogLog estimate of the number of distinct valid
+            values (about 1.6% standard error, less for small columns).
+    """
+
+    row_count: int
+    null_count: int
+    min: Any
+    max: Any
+    distinct: int
+
+
+class SbdfColumnProfile(NamedTuple):
+    """
+    Where the time went while encoding one column of one ``TableSlice``.
+
+    Attributes:
+        name (str): Column name.
+        value_type (ValueType): Column value type.
+        parse (float): Seconds converting cells to values. Where a cell is
+            parsed and packed in the same loop, that loop counts as parsing.
+        pack (float): Seconds building the fixed-width value array, including
+            the conversion of typed values written with ``write_columns``.
+        strings (float): Seconds encoding String and Binary cells.
+        bits (float): Seconds building the ``IsInvalid`` bit array.
+        encode (float): Seconds choosing the value encoding (plain,
+            run-length or bit array) and writing the ``ColumnSlice``.
+        nbytes (int): Size of the encoded ``ColumnSlice``.
+    """
+
+    name: str
+    value_type: ValueType
+    parse: float
+    pack: float
+    strings: float
+    bits: float
+    encode: float
+    nbytes: int
+
+    @property
+    def seconds(self) -> float:
+        """Total seconds spent on this column."""
+        return self.parse + self.pack + self.strings + self.bits + self.encode
+
+
+class SbdfSliceProfile(NamedTuple):
+    """
+    Timings of one encoded ``TableSlice``, reported to a writer's profiler.
+
+    Attributes:
+        number (int): Zero-based position of the slice in the file.
+        rows (int): Rows in the slice.
+        nbytes (int): Size of the encoded ``TableSlice`` section.
+        seconds (float): Time spent encoding the slice, measured where it was
+            encoded (a worker process, for parallel encoding).
+        columns (list[SbdfColumnProfile]): Breakdown per column, in order.
+    """
+
+    number: int
+    rows: int
+    nbytes: int
+    seconds: float
+    columns: list[SbdfColumnProfile]
+
+
+class SbdfSliceIndex(NamedTuple):
+    """
+    Byte offset and first row of every ``TableSlice`` in one SBDF file.
+
+    SBDF has no index of its own, so this is kept next to the file (e.g. as
+    ``export.sbdf.idx``) and lets :meth:`SbdfReader.read_rows` seek straight
+    to the slices holding a row range. Record one while writing with
+    ``SbdfStreamingWriter(..., record_index=True)`` or build one for an
+    existing file with :meth:`SbdfReader.build_index`.
+
+    Attributes:
+        offsets (list[int]): Byte offset of each ``TableSlice`` section from
+            the start of the SBDF data, in file order.
+        first_rows (list[int]): Index of the first row in each slice.
+        row_count (int): Total number of rows in the table.
+        table_end (int): Byte offset of the ``TableEnd`` section.
+    """
+
+    offsets: list[int]
+    first_rows: list[int]
+    row_count: int
+    table_end: int
+
+    def locate(self, row: int) -> int:
+        """Return the position in :attr:`offsets` of the slice holding *row*.
+
+        Raises:
+            IndexError: If *row* is outside ``[0, row_count)``.
+        """
+        if not 0 <= row < self.row_count:
+            raise IndexError(f"Row {row} is out of range for {self.row_count} rows")
+        return bisect_right(self.first_rows, row) - 1
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the compact sidecar format read by :meth:`from_bytes`."""
+        n = len(self.offsets)
+        return (
+            _INDEX_MAGIC
+            + bytes([_INDEX_VERSION])
+            + struct.pack(
+                f"<3q{2 * n}q",
+                n,
+                self.row_count,
+                self.table_end,
+                *self.offsets,
+                *self.first_rows,
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> SbdfSliceIndex:
+        """Parse a sidecar index written by :meth:`to_bytes`.
+
+        Raises:
+            SbdfFormatError: If *data* is not a valid slice index.
+        """
+        data = bytes(data)
+        head = len(_INDEX_MAGIC) + 1
+        if data[: len(_INDEX_MAGIC)] != _INDEX_MAGIC or len(data) < head + 24:
+            raise SbdfFormatError("Not an SBDF slice index")
+        if data[len(_INDEX_MAGIC)] != _INDEX_VERSION:
+            raise SbdfFormatError(
+                f"Unsupported SBDF slice index version {data[len(_INDEX_MAGIC)]}"
+            )
+        n, row_count, table_end = struct.unpack_from("<3q", data, head)
+        if n < 0 or len(data) != head + 24 + 16 * n:
+            raise SbdfFormatError("SBDF slice index is truncated or corrupt")
+        values = struct.unpack_from(f"<{2 * n}q", data, head + 24)
+        return cls(list(values[:n]), list(values[n:]), row_count, table_end)
+
+
+__all__ = [
+    "ValueType",
+    "ValueEncoding",
+    "SbdfTableMetadata",
+    "SbdfColumnSlice",
+    "SbdfTableSlice",
+    "SbdfSliceIndex",
+    "SbdfColumnStats",
+    "SbdfColumnProfile",
+    "SbdfSliceProfile",
+]
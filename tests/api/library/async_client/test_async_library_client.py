@@ -0,0 +1,140 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from mock_spotfire import app
+from spotfire_community.library.async_client import AsyncLibraryClient
+from spotfire_community.library.errors import ItemNotFoundError
+from spotfire_community.library.models import ItemType
+
+
+class CountingTransport(httpx.ASGITransport):
+    def __init__(self):
+        super().__init__(app=app)
+        self.requests: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return await super().handle_async_request(request)
+
+
+def _client(transport: httpx.AsyncBaseTransport) -> AsyncLibraryClient:
+    return AsyncLibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+        transport=transport,
+    )
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def test_concurrent_uploads_create_shared_folders_once():
+    transport = CountingTransport()
+
+    async def run() -> list[str]:
+        async with _client(transport) as client:
+            ids = await asyncio.gather(
+                *(
+                    client.upload_file(
+                        f"data {i}".encode(),
+                        f"/AsyncTest/a/b/f{i}.sbdf",
+                        ItemType.SBDF,
+                    )
+                    for i in range(20)
+                )
+            )
+            await client.delete_folder("/AsyncTest")
+            return ids
+
+    ids = asyncio.run(run())
+    assert len(set(ids)) == 20
+    folder_posts = [
+        r
+        for r in transport.requests
+        if r.method == "POST" and r.url.path.endswith("/library/v2/items")
+    ]
+    assert len(folder_posts) == 3
+
+
+def test_streaming_upload_delete_and_listing():
+    transport = CountingTransport()
+
+    async def run() -> None:
+        async with _client(transport) as client:
+            file_id = await client.upload_file_streaming(
+                _chunks(b"head", b"", b"x" * 25, b"end"),
+                "/AsyncStream/data.sbdf",
+                ItemType.SBDF,
+                chunk_size=10,
+            )
+            assert file_id
+            sent = [
+                r.content
+                for r in transport.requests
+                if "/library/v2/upload/" in r.url.path
+            ]
+            assert [len(c) for c in sent] == [10, 10, 10, 2]
+            assert b"".join(sent) == b"head" + b"x" * 25 + b"end"
+
+            with pytest.raises(ValueError, match="no data"):
+                await client.upload_file_streaming(
+                    _chunks(b""), "/AsyncStream/empty.sbdf", ItemType.SBDF
+                )
+            with pytest.raises(ItemNotFoundError):
+                await client.get_all_dashboards_in_folder("/does-not-exist")
+
+            await client.delete_folder("/AsyncStream")
+            with pytest.raises(ItemNotFoundError):
+                await client.delete_folder("/AsyncStream", ignore_missing=False)
+            with pytest.raises(ItemNotFoundError):
+                await client._get_folder_id("/AsyncStream")  # pyright: ignore[reportPrivateUsage]
+
+    asyncio.run(run())
+
+
+def test_authentication_failure_closes_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, text="denied")
+
+    async def run() -> None:
+        client = _client(httpx.MockTransport(handler))
+        with pytest.raises(Exception, match="401 - denied"):
+            async with client:
+                pass
+        assert client._http.is_closed  # pyright: ignore[reportPrivateUsage]
+
+    asyncio.run(run())
+
+
+def test_upload_into_a_stale_cached_folder_resolves_it_again():
+    transport = CountingTransport()
+
+    async def run() -> None:
+        async with _client(transport) as client, _client(transport) as other:
+            await client.upload_file(b"x", "/AsyncStale/a/f1.sbdf", ItemType.SBDF)
+            await other.delete_folder("/AsyncStale/a")
+
+            await asyncio.gather(
+                *(
+                    client.upload_file(b"x", f"/AsyncStale/a/g{i}.sbdf", ItemType.SBDF)
+                    for i in range(5)
+                )
+            )
+            folder_id = await other._get_folder_id("/AsyncStale/a")  # pyright: ignore[reportPrivateUsage]
+            assert await client._get_folder_id("/AsyncStale/a") == folder_id  # pyright: ignore[reportPrivateUsage]
+            await other.delete_folder("/AsyncStale")
+
+    asyncio.run(run())
+    folder_posts = [
+        r
+        for r in transport.requests
+        if r.method == "POST" and r.url.path.endswith("/library/v2/items")
+    ]
+    # /AsyncStale and /AsyncStale/a, then /AsyncStale/a once more.
+    assert len(folder_posts) == 3
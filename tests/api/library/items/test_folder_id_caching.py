@@ -0,0 +1,98 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from spotfire_community.library.client import LibraryClient
+from spotfire_community.library.models import ItemType, UploadItem
+
+
+def _count_gets(monkeypatch: pytest.MonkeyPatch, test_client: TestClient) -> list[str]:
+    paths: list[str] = []
+    get = test_client.get
+
+    def counting_get(url: str, *args: Any, **kwargs: Any) -> Any:
+        paths.append(kwargs.get("params", {}).get("path"))
+        return get(url, *args, **kwargs)
+
+    monkeypatch.setattr(test_client, "get", counting_get)
+    return paths
+
+
+def test_repeated_uploads_resolve_folders_once(
+    monkeypatch: pytest.MonkeyPatch, test_client: TestClient
+):
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+    gets = _count_gets(monkeypatch, test_client)
+
+    for name in ("one", "two", "three"):
+        client.upload_file(
+            data=b"x",
+            path=f"/CacheTest/a/b/{name}.sbdf",
+            item_type=ItemType.SBDF,
+        )
+    # Only the first upload looks up the (missing) folders and the root.
+    assert gets == ["/CacheTest", "/", "/CacheTest/a", "/CacheTest/a/b"]
+
+    client.delete_folder("/CacheTest/a")
+    assert client._get_folder_id("/CacheTest") is not None  # pyright: ignore[reportPrivateUsage]
+    gets.clear()
+    client.upload_file(
+        data=b"x",
+        path="/CacheTest/a/b/four.sbdf",
+        item_type=ItemType.SBDF,
+    )
+    assert gets == ["/CacheTest/a", "/CacheTest/a/b"]
+    client.delete_folder("/CacheTest")
+
+
+def test_disabled_cache_asks_the_server_every_time(
+    monkeypatch: pytest.MonkeyPatch, test_client: TestClient
+):
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+        folder_cache_size=0,
+    )
+    client.upload_file(data=b"x", path="/NoCache/f.sbdf", item_type=ItemType.SBDF)
+    gets = _count_gets(monkeypatch, test_client)
+    client.upload_file(data=b"x", path="/NoCache/g.sbdf", item_type=ItemType.SBDF)
+    assert gets == ["/NoCache"]
+    client.delete_folder("/NoCache")
+
+
+def test_upload_into_a_stale_cached_folder_resolves_it_again(
+    monkeypatch: pytest.MonkeyPatch, test_client: TestClient
+):
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+    other = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+    client.upload_file(data=b"x", path="/Stale/a/f1.sbdf", item_type=ItemType.SBDF)
+    other.delete_folder("/Stale/a")
+
+    gets = _count_gets(monkeypatch, test_client)
+    item_id = client.upload_file(
+        data=b"x", path="/Stale/a/f2.sbdf", item_type=ItemType.SBDF
+    )
+    assert gets == ["/Stale", "/Stale/a"]
+    folder_id = other._get_folder_id("/Stale/a")  # pyright: ignore[reportPrivateUsage]
+    assert client._get_folder_id("/Stale/a") == folder_id  # pyright: ignore[reportPrivateUsage]
+
+    other.delete_folder("/Stale/a")
+    [result] = client.upload_many(
+        [UploadItem(data=b"x", path="/Stale/a/f3.sbdf", item_type=ItemType.SBDF)]
+    )
+    assert result.error is None and result.item_id not in (None, item_id)
+    other.delete_folder("/Stale")
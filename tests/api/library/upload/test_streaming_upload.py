@@ -1,3 +1,6 @@
+from typing import Any
+
+import pytest
 from fastapi.testclient import TestClient
 
 from spotfire_community.library.client import LibraryClient
@@ -103,3 +106,88 @@ def test_streaming_upload_with_overwrite(test_client: TestClient):
 
     # Should reuse the same item ID on overwrite
     assert file_id_1 == file_id_2
+
+
+def test_streaming_upload_with_prefetch(test_client: TestClient):
+    """Prefetched chunks should upload like sequential ones."""
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+
+    file_id = client.upload_file_streaming(
+        data_stream=iter([b"chunk1", b"", b"chunk2", b"chunk3"]),
+        path="/StreamTest/prefetch.sbdf",
+        item_type=ItemType.SBDF,
+        prefetch=2,
+    )
+    assert isinstance(file_id, str) and len(file_id) > 0
+
+
+def test_streaming_upload_prefetch_propagates_stream_errors(test_client: TestClient):
+    """An error raised by the chunk producer should reach the caller."""
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+
+    def failing_stream():
+        yield b"chunk1"
+        raise RuntimeError("producer failed")
+
+    with pytest.raises(RuntimeError, match="producer failed"):
+        client.upload_file_streaming(
+            data_stream=failing_stream(),
+            path="/StreamTest/prefetch_error.sbdf",
+            item_type=ItemType.SBDF,
+            prefetch=1,
+        )
+    with pytest.raises(ValueError, match="prefetch"):
+        client.upload_file_streaming(
+            data_stream=iter([b"x"]),
+            path="/StreamTest/prefetch_error.sbdf",
+            item_type=ItemType.SBDF,
+            prefetch=-1,
+        )
+
+
+def test_streaming_upload_reblocks_to_chunk_size(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    """chunk_size should coalesce small chunks and split large ones."""
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+    bodies: list[bytes] = []
+    post = test_client.post
+
+    def recording_post(url: str, *args: Any, **kwargs: Any) -> Any:
+        if "/upload/" in url:
+            bodies.append(kwargs["data"])
+        return post(url, *args, **kwargs)
+
+    monkeypatch.setattr(test_client, "post", recording_post)
+
+    for prefetch in (0, 2):
+        bodies.clear()
+        client.upload_file_streaming(
+            data_stream=iter([b"head", b"x" * 25, b"", b"end"]),
+            path=f"/StreamTest/reblocked_{prefetch}.sbdf",
+            item_type=ItemType.SBDF,
+            prefetch=prefetch,
+            chunk_size=10,
+        )
+        assert [len(b) for b in bodies] == [10, 10, 10, 2]
+        assert b"".join(bodies) == b"head" + b"x" * 25 + b"end"
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        client.upload_file_streaming(
+            data_stream=iter([b"x"]),
+            path="/StreamTest/reblocked.sbdf",
+            item_type=ItemType.SBDF,
+            chunk_size=0,
+        )
@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from spotfire_community.library import UploadItem, UploadResult
+from spotfire_community.library.client import LibraryClient
+from spotfire_community.library.models import ItemType
+
+
+def test_upload_many_resolves_each_folder_once(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+        folder_cache_size=0,
+    )
+    looked_up: list[str] = []
+    get = test_client.get
+
+    def recording_get(url: str, *args: Any, **kwargs: Any) -> Any:
+        looked_up.append(kwargs["params"]["path"])
+        return get(url, *args, **kwargs)
+
+    monkeypatch.setattr(test_client, "get", recording_get)
+
+    paths = [f"/Bulk/a/f{i}.sbdf" for i in range(6)] + [
+        "/Bulk/a/b/g.sbdf",
+        "/Bulk/c/h.sbdf",
+        "/Bulk/a/f0.sbdf",  # already exists and overwrite=False
+    ]
+    results = client.upload_many(
+        [
+            UploadItem(data=f"data {p}".encode(), path=p, item_type=ItemType.SBDF)
+            for p in paths
+        ],
+        max_workers=4,
+    )
+
+    assert sorted(looked_up) == ["/", "/Bulk", "/Bulk/a", "/Bulk/a/b", "/Bulk/c"]
+    assert [r.path for r in results] == paths
+    assert all(r.item_id and r.error is None for r in results[:-1])
+    assert len({r.item_id for r in results[:-1]}) == len(paths) - 1
+    assert results[-1].item_id is None
+    assert isinstance(results[-1].error, Exception)
+    client.delete_folder("/Bulk")
+
+
+def test_upload_many_reports_folder_errors_per_item(test_client: TestClient):
+    client = LibraryClient(
+        spotfire_url="http://testserver",
+        client_id="id",
+        client_secret="secret",
+    )
+    results = client.upload_many(
+        [
+            UploadItem(
+                data=b"x", path="/BulkErr/return-500/f.dxp", item_type=ItemType.DXP
+            ),
+            UploadItem(
+                data=b"y",
+                path="/BulkErr/ok.dxp",
+                item_type=ItemType.DXP,
+                overwrite=True,
+            ),
+        ]
+    )
+    failed, ok = results
+    assert failed.item_id is None and isinstance(failed.error, Exception)
+    assert ok == UploadResult(path="/BulkErr/ok.dxp", item_id=ok.item_id, error=None)
+    assert ok.item_id
+
+    assert client.upload_many([]) == []
+    with pytest.raises(ValueError, match="max_workers"):
+        client.upload_many([], max_workers=0)
+    client.delete_folder("/BulkErr")
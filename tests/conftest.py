@@ -48,7 +48,7 @@ def patch_requests_session(monkeypatch: MonkeyPatch, test_client: TestClient):
     monkeypatch.setattr(
         lib_client,
         "SpotfireRequestsSession",
-        lambda timeout=None: test_client,  # type: ignore[misc]
+        lambda timeout=None, pool_maxsize=None: test_client,  # type: ignore[misc]
     )
 
     monkeypatch.setattr(
@@ -40,3 +40,9 @@ def test_timeout_injection(monkeypatch: MonkeyPatch):
     s.request("GET", "http://example.com", timeout=9)
     # Existing timeout should be preserved
     assert captured.get("timeout") == 9
+
+
+def test_pool_maxsize_sizes_adapters():
+    s = SpotfireRequestsSession(pool_maxsize=32)
+    for prefix in ("http://", "https://"):
+        assert s.get_adapter(prefix + "example.com")._pool_maxsize == 32  # type: ignore[attr-defined]
@@ -0,0 +1,47 @@
+import pytest
+
+from spotfire_community.library._chunking import rechunk
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected"),
+    [
+        ([b"ab", b"", b"c", b"defg", b"h"], [b"abcd", b"efgh"]),
+        ([b"abcdefghij"], [b"abcd", b"efgh", b"ij"]),
+        ([b"a", b"bcdefghij", b"k"], [b"abcd", b"efgh", b"ijk"]),
+        ([b"a"], [b"a"]),
+        ([b"", b""], []),
+    ],
+)
+def test_rechunk_coalesces_and_splits(chunks: list[bytes], expected: list[bytes]):
+    assert list(rechunk(chunks, 4)) == expected
+
+
+def test_rechunk_passes_aligned_chunks_through():
+    aligned = b"wxyz"
+    out = list(rechunk([aligned, b"ab", b"cd"], 4))
+    assert out == [b"wxyz", b"abcd"]
+    assert out[0] is aligned
+
+
+def test_rechunk_copies_leftovers_of_a_reused_buffer():
+    def reused(data: bytes, piece: int):
+        buffer = bytearray(piece)
+        for start in range(0, len(data), piece):
+            part = data[start : start + piece]
+            buffer[: len(part)] = part
+            yield buffer[: len(part)] if len(part) < piece else buffer
+
+    data = bytes(range(26))
+    for piece in (3, 4, 5, 9):
+        out: list[bytes] = []
+        for block in rechunk(reused(data, piece), 4):
+            assert type(block) is bytes
+            out.append(block)
+        assert b"".join(out) == data
+        assert [len(b) for b in out] == [4] * 6 + [2]
+
+
+def test_rechunk_rejects_bad_size():
+    with pytest.raises(ValueError, match="size"):
+        list(rechunk([b"x"], 0))
@@ -0,0 +1,78 @@
+import pytest
+
+from spotfire_community.library._cache import FolderIdCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = FolderIdCache(ttl=10, clock=clock)
+    cache.put("/a/b/", "ab")
+    assert cache.get("a/b") == "ab"
+    assert cache.path_of("ab") == "/a/b"
+
+    clock.now = 10
+    assert cache.path_of("ab") is None
+    assert cache.get("/a/b") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FolderIdCache(ttl=None, max_size=2)
+    cache.put("/a", "a")
+    cache.put("/b", "b")
+    assert cache.get("/a") == "a"
+    cache.put("/c", "c")
+    assert [cache.get(p) for p in ("/a", "/b", "/c")] == ["a", None, "c"]
+
+
+def test_path_of_follows_moves_evictions_and_invalidation():
+    cache = FolderIdCache(ttl=None, max_size=2)
+    cache.put("/a", "a")
+    cache.put("/moved", "a")
+    assert cache.path_of("a") == "/moved"
+    assert cache.get("/a") is None
+
+    cache.put("/b", "b")
+    cache.put("/c", "c")
+    assert cache.path_of("a") is None
+    assert cache.path_of("b") == "/b"
+
+    cache.invalidate("/b")
+    assert cache.path_of("b") is None
+    assert cache.path_of("c") == "/c"
+
+
+def test_invalidate_drops_path_and_subtree():
+    cache = FolderIdCache()
+    for path in ("/", "/a", "/a/b", "/a/b/c", "/ab", "/x"):
+        cache.put(path, path)
+    cache.invalidate("/a/")
+    assert [cache.get(p) for p in ("/", "/a", "/a/b", "/a/b/c", "/ab", "/x")] == [
+        "/",
+        None,
+        None,
+        None,
+        "/ab",
+        "/x",
+    ]
+    cache.invalidate("/")
+    assert len(cache) == 0
+
+
+def test_zero_size_disables_cache_and_bad_arguments():
+    cache = FolderIdCache(max_size=0)
+    cache.put("/a", "a")
+    assert cache.get("/a") is None
+
+    with pytest.raises(ValueError, match="ttl"):
+        FolderIdCache(ttl=0)
+    with pytest.raises(ValueError, match="max_size"):
+        FolderIdCache(max_size=-1)
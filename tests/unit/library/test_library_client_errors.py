@@ -2,6 +2,7 @@ from typing import Any
 
 import pytest
 
+from spotfire_community.library._cache import FolderIdCache
 from spotfire_community.library.client import LibraryClient
 from spotfire_community.library.errors import ItemNotFoundError
 from spotfire_community.library.models import ItemType
@@ -64,6 +65,7 @@ class NoTimeoutClient(LibraryClient):
     def __init__(self, spotfire_url: str):
         self._url = f"{spotfire_url.rstrip('/')}/spotfire"
         self._requests_session = FakeSession()  # type: ignore[assignment]
+        self._folder_cache = FolderIdCache()
         # perform authenticate like original
         from spotfire_community._core.rest.auth import authenticate
         from spotfire_community._core.rest.models import Scope
@@ -121,6 +123,7 @@ def test_create_folder_error_branch():
         def __init__(self, spotfire_url: str):
             self._url = f"{spotfire_url.rstrip('/')}/spotfire"
             self._requests_session = ErrorOnItemsSession()  # type: ignore[assignment]
+            self._folder_cache = FolderIdCache()
             from spotfire_community._core.rest.auth import authenticate
             from spotfire_community._core.rest.models import Scope
 
@@ -143,7 +146,7 @@ def test_get_or_create_folder_final_none_branch():
             # skip base init; only override methods used
             pass
 
-        def _get_folder_id(self, path: str) -> str:  # type: ignore[override]
+        def _get_folder_id(self, path: str, *, refresh: bool = False) -> str:  # type: ignore[override]
             if path == "/":
                 return "root"
             raise ItemNotFoundError("nf")
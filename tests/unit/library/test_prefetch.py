@@ -0,0 +1,54 @@
+import itertools
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from spotfire_community.library._prefetch import ChunkPrefetcher
+
+
+def test_chunks_are_read_ahead_while_consumer_waits():
+    third_requested = threading.Event()
+
+    def source() -> Iterator[bytes]:
+        yield b"1"
+        yield b""
+        yield b"2"
+        third_requested.set()
+        yield b"3"
+
+    with ChunkPrefetcher(source(), depth=2) as chunks:
+        assert next(chunks) == b"1"
+        # The producer moves on to chunk 3 before chunk 2 is asked for.
+        assert third_requested.wait(timeout=5)
+        assert list(chunks) == [b"2", b"3"]
+        assert list(chunks) == []
+
+
+def test_source_errors_are_raised_after_earlier_chunks():
+    def source() -> Iterator[bytes]:
+        yield b"a"
+        raise RuntimeError("encoder failed")
+
+    with ChunkPrefetcher(source(), depth=4) as chunks:
+        assert next(chunks) == b"a"
+        with pytest.raises(RuntimeError, match="encoder failed"):
+            next(chunks)
+
+
+def test_leaving_early_stops_the_producer():
+    pulled = itertools.count()
+
+    def source() -> Iterator[bytes]:
+        for _ in pulled:
+            yield b"x"
+
+    with ChunkPrefetcher(source(), depth=3) as chunks:
+        assert next(chunks) == b"x"
+    assert not chunks._thread.is_alive()  # pyright: ignore[reportPrivateUsage]
+    assert next(pulled) <= 1 + 3 + 2
+
+
+def test_depth_must_be_positive():
+    with pytest.raises(ValueError, match="depth"):
+        ChunkPrefetcher(iter([b"x"]), depth=0)
@@ -0,0 +1,229 @@
+"""Unit tests for the pandas / Arrow → SBDF adapter."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfReader,
+    SbdfStreamingWriter,
+    ValueType,
+    from_arrow,
+    write_dataframe,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+_COLUMNS: dict[str, list[Any]] = {
+    "b": [True, None, False, True],
+    "i": [1, -2, None, 2**31 - 1],
+    "l": [2**40, None, -(2**40), 0],
+    "d": [1.5, -0.0, None, float("inf")],
+    "dt": [
+        datetime(2025, 1, 1, 12, 34, 56, 789_999),
+        None,
+        datetime(1960, 6, 1, 0, 0, 0, 1),
+        datetime(1, 1, 1),
+    ],
+    "day": [date(2025, 1, 1), date(1969, 12, 31), None, date(9999, 12, 31)],
+    "s": ["a", None, "", "ü" * 200],
+}
+_TYPES = [
+    ValueType.BOOL,
+    ValueType.INT,
+    ValueType.LONG,
+    ValueType.DOUBLE,
+    ValueType.DATETIME,
+    ValueType.DATE,
+    ValueType.STRING,
+]
+
+
+def _table() -> Any:
+    return pa.table(
+        {
+            "b": pa.array(_COLUMNS["b"], pa.bool_()),
+            "i": pa.array(_COLUMNS["i"], pa.int32()),
+            "l": pa.array(_COLUMNS["l"], pa.int64()),
+            "d": pa.array(_COLUMNS["d"], pa.float64()),
+            "dt": pa.array(_COLUMNS["dt"], pa.timestamp("us")),
+            "day": pa.array(_COLUMNS["day"], pa.date32()),
+            "s": pa.array(_COLUMNS["s"], pa.string()),
+        }
+    )
+
+
+def _expected(chunk_size: int) -> bytes:
+    writer = SbdfStreamingWriter(headers=list(_COLUMNS), column_types=_TYPES)
+    out = writer.start()
+    values = list(_COLUMNS.values())
+    for start in range(0, 4, chunk_size):
+        out += writer.write_columns([col[start : start + chunk_size] for col in values])
+    return out + writer.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10])
+def test_from_arrow_matches_write_columns(chunk_size: int) -> None:
+    assert b"".join(from_arrow(_table(), chunk_size)) == _expected(chunk_size)
+
+
+def test_from_arrow_reads_sliced_and_chunked_arrays() -> None:
+    table = pa.concat_tables([_table().slice(0, 1), _table().slice(1)])
+    assert b"".join(from_arrow(table.combine_chunks().slice(1))) == b"".join(
+        from_arrow(_table().slice(1))
+    )
+    # One slice per input chunk; both chunks decode to the original rows.
+    reader = SbdfReader(b"".join(from_arrow(table)))
+    assert [s.row_count for s in reader] == [1, 3]
+
+
+def test_from_arrow_maps_narrow_wide_and_dictionary_types() -> None:
+    table = pa.table(
+        {
+            "i8": pa.array([1, None], pa.int8()),
+            "u16": pa.array([65535, 0], pa.uint16()),
+            "u32": pa.array([2**32 - 1, 0], pa.uint32()),
+            "u64": pa.array([2**64 - 1, 7], pa.uint64()),
+            "f32": pa.array([0.5, None], pa.float32()),
+            "ts": pa.array([0, 1500], pa.timestamp("ns", tz="Europe/Oslo")),
+            "d64": pa.array([date(2024, 2, 29), None], pa.date64()),
+            "cat": pa.array(["x", None]).dictionary_encode(),
+            "big": pa.array(["x", "y"], pa.large_string()),
+            "none": pa.array([None, None], pa.null()),
+        }
+    )
+    reader = SbdfReader(b"".join(from_arrow(table)))
+    assert reader.metadata.column_types == [
+        ValueType.INT,
+        ValueType.INT,
+        ValueType.LONG,
+        ValueType.LONG,
+        ValueType.FLOAT,
+        ValueType.DATETIME,
+        ValueType.DATE,
+        ValueType.STRING,
+        ValueType.STRING,
+        ValueType.STRING,
+    ]
+    (table_slice,) = list(reader)
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    assert [c.to_list() for c in table_slice.columns] == [
+        [1, None],
+        [65535, 0],
+        [2**32 - 1, 0],
+        [None, 7],  # out of Long range, so marked invalid
+        [0.5, None],
+        [epoch, epoch],  # 1500 ns floors to the same millisecond
+        [date(2024, 2, 29), None],
+        ["x", None],
+        ["x", "y"],
+        [None, None],
+    ]
+
+
+def test_from_arrow_encodes_extended_types_like_write_columns() -> None:
+    columns: dict[str, tuple[Any, list[Any], ValueType]] = {
+        "f": (pa.float32(), [0.25, None, -3.5], ValueType.FLOAT),
+        "t": (
+            pa.time64("us"),
+            [time(23, 59, 59, 999_999), None, time(0)],
+            ValueType.TIME,
+        ),
+        "t32": (pa.time32("s"), [time(1, 2, 3), time(0), None], ValueType.TIME),
+        "span": (
+            pa.duration("us"),
+            [timedelta(microseconds=-1500), None, timedelta(days=-3, hours=5)],
+            ValueType.TIMESPAN,
+        ),
+        "dec": (
+            pa.decimal128(20, 3),
+            [Decimal("-12345678901234567.891"), None, Decimal("0.000")],
+            ValueType.DECIMAL,
+        ),
+        "wide": (
+            pa.decimal128(38, 0),
+            [Decimal(10**37 + 7), Decimal(-1), None],
+            ValueType.DECIMAL,
+        ),
+        "bin": (pa.binary(), [b"\x00\xff", None, b""], ValueType.BINARY),
+        "big": (pa.large_binary(), [b"x" * 300, b"y", None], ValueType.BINARY),
+    }
+    table = pa.table(
+        {name: pa.array(values, t) for name, (t, values, _) in columns.items()}
+    )
+    writer = SbdfStreamingWriter(
+        headers=list(columns), column_types=[v for _, _, v in columns.values()]
+    )
+    expected = writer.start()
+    expected += writer.write_columns([values for _, values, _ in columns.values()])
+    expected += writer.finish()
+    data = b"".join(from_arrow(table))
+    assert data == expected
+
+    (table_slice,) = list(SbdfReader(data))
+    assert table_slice.columns[3].to_list()[0] == timedelta(milliseconds=-1)
+    assert table_slice.columns[4].to_list()[0] == Decimal("-12345678901234567.891")
+    assert table_slice.columns[5].to_list()[0] == Decimal(
+        "1.000000000000000000000000000000000E+37"
+    )
+
+
+def test_from_arrow_streams_record_batch_reader() -> None:
+    batches = _table().to_batches(max_chunksize=2)
+    reader = pa.RecordBatchReader.from_batches(_table().schema, iter(batches))
+    assert b"".join(from_arrow(reader)) == _expected(2)
+
+
+def test_from_arrow_rejects_unsupported_input_when_called() -> None:
+    # Raised by the call itself: the returned iterator is never advanced.
+    nested = pa.table({"x": pa.array([[1]], pa.list_(pa.int8()))})
+    with pytest.raises(TypeError, match="no SBDF equivalent"):
+        from_arrow(nested)
+    with pytest.raises(TypeError, match="list"):
+        from_arrow([[1, 2]])
+    with pytest.raises(ValueError, match="chunk_size"):
+        from_arrow(_table(), 0)
+
+    sink = bytearray()
+    with pytest.raises(TypeError, match="no SBDF equivalent"):
+        write_dataframe(nested, sink)
+    assert sink == b""
+
+
+def test_write_dataframe_from_pandas() -> None:
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {"n": [1, 2, 3], "x": [0.5, None, 2.0], "s": ["a", None, "c"]},
+        index=[10, 20, 30],
+    )
+    sink = bytearray()
+    assert write_dataframe(df, sink) == len(sink)
+    reader = SbdfReader(bytes(sink))
+    assert reader.metadata.headers == ["n", "x", "s"]
+    assert reader.metadata.column_types == [
+        ValueType.LONG,
+        ValueType.DOUBLE,
+        ValueType.STRING,
+    ]
+    (table_slice,) = list(reader)
+    assert [c.to_list() for c in table_slice.columns] == [
+        [1, 2, 3],
+        [0.5, None, 2.0],
+        ["a", None, "c"],
+    ]
+
+
+def test_importing_sbdf_does_not_import_pyarrow() -> None:
+    code = (
+        "import sys, spotfire_community.sbdf; "
+        "assert 'pyarrow' not in sys.modules and 'pandas' not in sys.modules"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -0,0 +1,224 @@
+"""Unit tests for the DB-API cursor → SBDF adapter."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import SbdfReader, ValueType, from_cursor
+from spotfire_community.sbdf._dbapi import cursor_column_types, type_from_code
+
+
+@pytest.fixture
+def cursor() -> Iterator[sqlite3.Cursor]:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER, name TEXT, price REAL, empty TEXT)")
+    conn.executemany(
+        "INSERT INTO t VALUES (?, ?, ?, NULL)",
+        [(i, f"n{i}" if i % 3 else None, i / 4) for i in range(7)],
+    )
+    try:
+        yield conn.execute("SELECT * FROM t ORDER BY id")
+    finally:
+        conn.close()
+
+
+def _columns(data: bytes) -> list[list[Any]]:
+    reader = SbdfReader(data)
+    columns: list[list[Any]] = [[] for _ in reader.metadata.headers]
+    for table_slice in reader:
+        for out, column in zip(columns, table_slice.columns):
+            out.extend(column.to_list())
+    return columns
+
+
+def test_from_cursor_streams_sqlite_result_in_batches(cursor: sqlite3.Cursor) -> None:
+    chunks = list(from_cursor(cursor, batch_size=3))
+    assert len(chunks) == 2 + 3  # header, slices of 3 + 3 + 1 rows, end
+
+    data = b"".join(chunks)
+    reader = SbdfReader(data)
+    assert reader.metadata.headers == ["id", "name", "price", "empty"]
+    assert reader.metadata.column_types == [
+        ValueType.LONG,
+        ValueType.STRING,
+        ValueType.DOUBLE,
+        ValueType.STRING,
+    ]
+    assert [s.row_count for s in SbdfReader(data)] == [3, 3, 1]
+    assert _columns(data) == [
+        list(range(7)),
+        [None, "n1", "n2", None, "n4", "n5", None],
+        [i / 4 for i in range(7)],
+        [None] * 7,
+    ]
+
+
+class _ListCursor:
+    """A minimal DB-API cursor over fixed rows, as a typed driver returns them."""
+
+    def __init__(self, description: list[tuple[Any, ...]], rows: list[tuple[Any, ...]]):
+        self.description = description
+        self._rows = rows
+
+    def fetchmany(self, size: int = 1, /) -> list[tuple[Any, ...]]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+def test_from_cursor_maps_description_type_codes() -> None:
+    cursor = _ListCursor(
+        [
+            ("flag", "BOOLEAN"),
+            ("amount", "NUMERIC(10, 2)"),
+            ("day", date),
+            ("at", 1184),
+        ],
+        [
+            (True, Decimal("1.25"), date(2024, 1, 1), None),
+            (None, Decimal("-3"), None, datetime(2024, 5, 1, 12, 30)),
+        ],
+    )
+    data = b"".join(from_cursor(cursor))
+    assert SbdfReader(data).metadata.column_types == [
+        ValueType.BOOL,
+        ValueType.DECIMAL,
+        ValueType.DATE,
+        ValueType.DATETIME,
+    ]
+    assert _columns(data) == [
+        [True, None],
+        [Decimal("1.25"), Decimal("-3")],
+        [date(2024, 1, 1), None],
+        [None, datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)],
+    ]
+
+
+def test_from_cursor_honours_explicit_types(cursor: sqlite3.Cursor) -> None:
+    types = [ValueType.INT] + [ValueType.STRING] * 3
+    data = b"".join(from_cursor(cursor, column_types=types))
+    assert SbdfReader(data).metadata.column_types == types
+    assert _columns(data)[2][:2] == ["0.0", "0.25"]
+
+
+def test_from_cursor_empty_result_and_errors() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (a INTEGER)")
+    reader = SbdfReader(b"".join(from_cursor(conn.execute("SELECT a FROM t"))))
+    assert reader.metadata.column_types == [ValueType.STRING]
+    assert list(reader) == []
+
+    # Argument errors are raised by the call, before iteration starts.
+    with pytest.raises(ValueError, match="no result set"):
+        from_cursor(conn.cursor())
+    with pytest.raises(ValueError, match="batch_size"):
+        from_cursor(conn.execute("SELECT a FROM t"), 0)
+    with pytest.raises(ValueError, match="1 columns but 2 types"):
+        list(
+            from_cursor(
+                conn.execute("SELECT a FROM t"),
+                column_types=[ValueType.INT, ValueType.INT],
+            )
+        )
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        (int, ValueType.LONG),
+        (bool, ValueType.BOOL),
+        (Decimal, ValueType.DECIMAL),
+        (datetime, ValueType.DATETIME),
+        (bytes, ValueType.BINARY),
+        ("integer", ValueType.LONG),
+        ("SMALLINT", ValueType.INT),
+        ("varchar(32)", ValueType.STRING),
+        ("TIMESTAMP WITH TIME ZONE", ValueType.DATETIME),
+        ("double precision", ValueType.DOUBLE),
+        ("float4", ValueType.FLOAT),
+        ("NUMERIC(10, 2)", ValueType.DECIMAL),
+        ("TIME", ValueType.TIME),
+        ("INTERVAL DAY TO SECOND", ValueType.TIMESPAN),
+        ("BYTEA", ValueType.BINARY),
+        ("GEOMETRY", None),
+        (1184, None),  # PostgreSQL OID: unknown without the driver
+        (None, None),
+    ],
+)
+def test_type_from_code(code: Any, expected: ValueType | None) -> None:
+    assert type_from_code(code) is expected
+
+
+def test_values_decide_unknown_or_conflicting_codes() -> None:
+    description: Sequence[Sequence[Any]] = [
+        ("a", 1184),
+        ("b", "DATE"),
+        ("c", None),
+        ("d", "DATE"),
+    ]
+    rows = [(None, "2024-01-01", None, None), (True, "x", Decimal("1.5"), None)]
+    assert cursor_column_types(description, rows) == [
+        ValueType.BOOL,
+        ValueType.STRING,  # DATE column returned as text
+        ValueType.DECIMAL,
+        ValueType.DATE,
+    ]
+
+
+def test_from_cursor_widens_mixed_numeric_column() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (n NUMERIC)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2.5,), (3,)])
+    data = b"".join(from_cursor(conn.execute("SELECT n FROM t")))
+    assert SbdfReader(data).metadata.column_types == [ValueType.DOUBLE]
+    assert _columns(data) == [[1.0, 2.5, 3.0]]
+
+    # A value of another type in a later batch is written as null.
+    data = b"".join(from_cursor(conn.execute("SELECT n FROM t"), batch_size=1))
+    assert SbdfReader(data).metadata.column_types == [ValueType.LONG]
+    assert _columns(data) == [[1, None, 3]]
+    conn.close()
+
+
+def test_from_cursor_writes_aware_times_in_utc() -> None:
+    plus_two = timezone(timedelta(hours=2))
+    cursor = _ListCursor(
+        [("t", "TIMETZ")],
+        [(time(12, 30, tzinfo=plus_two),), (time(1, tzinfo=plus_two),), (None,)],
+    )
+    data = b"".join(from_cursor(cursor))
+    assert SbdfReader(data).metadata.column_types == [ValueType.TIME]
+    assert _columns(data) == [[time(10, 30), time(23), None]]
+
+
+def test_from_cursor_keeps_time_of_day_of_date_coded_datetimes() -> None:
+    # Oracle DATE columns are reported as DATE but returned as datetimes.
+    cursor = _ListCursor([("d", "DATE")], [(datetime(2024, 1, 2, 13, 45),)])
+    data = b"".join(from_cursor(cursor))
+    assert SbdfReader(data).metadata.column_types == [ValueType.DATETIME]
+    assert _columns(data) == [[datetime(2024, 1, 2, 13, 45, tzinfo=timezone.utc)]]
+
+
+@pytest.mark.parametrize(
+    ("code", "values", "expected"),
+    [
+        (None, [1, Decimal("1.5")], ValueType.DECIMAL),
+        (None, [1, 2.5, Decimal("1.5")], ValueType.DOUBLE),
+        (None, [date(2024, 1, 1), datetime(2024, 1, 1, 1)], ValueType.DATETIME),
+        (None, [True, 1], ValueType.STRING),
+        ("INTEGER", [True, False], ValueType.BOOL),
+        ("INTEGER", [1, 2.5], ValueType.DOUBLE),
+        ("DATE", [date(2024, 1, 1), datetime(2024, 1, 2, 13, 45)], ValueType.DATETIME),
+    ],
+)
+def test_mixed_values_are_joined(
+    code: Any, values: list[Any], expected: ValueType
+) -> None:
+    rows = [(v,) for v in values]
+    assert cursor_column_types([("c", code)], rows) == [expected]
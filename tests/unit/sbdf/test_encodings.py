@@ -0,0 +1,113 @@
+"""Unit tests for run-length and bit-array value encodings in the SBDF writer."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfReader,
+    SbdfStreamingWriter,
+    ValueEncoding,
+    ValueType,
+)
+from spotfire_community.sbdf import _writer
+from spotfire_community.sbdf._writer import (
+    ENC_BIT_ARRAY,
+    ENC_PLAIN,
+    ENC_RUN_LENGTH,
+    SID_COLUMN_SLICE,
+    VT_STRING,
+    column_slice,
+    section,
+)
+
+
+def _encoding_of(column_bytes: bytes) -> int:
+    # ColumnSlice = section marker (3 bytes) + encoding byte + value type byte.
+    assert column_bytes.startswith(section(SID_COLUMN_SLICE))
+    return column_bytes[3]
+
+
+def _roundtrip(
+    column_type: ValueType,
+    rows: list[list[str]],
+    encoding: ValueEncoding | None = None,
+) -> tuple[bytes, list[Any]]:
+    writer = SbdfStreamingWriter(
+        headers=["c"], column_types=[column_type], encodings=[encoding]
+    )
+    data = b"".join(writer.chunks([rows]))
+    values: list[Any] = []
+    for table_slice in SbdfReader(data):
+        values.extend(table_slice.columns[0].to_list())
+    return data, values
+
+
+def test_bool_column_defaults_to_bit_array() -> None:
+    flags = ["true", "false", "", "true"] * 5
+    assert _encoding_of(column_slice(flags, _writer.VT_BOOL)) == ENC_BIT_ARRAY
+
+    data, values = _roundtrip(ValueType.BOOL, [[f] for f in flags])
+    assert values == [True, False, None, True] * 5
+    plain, _ = _roundtrip(ValueType.BOOL, [[f] for f in flags], ValueEncoding.PLAIN)
+    assert len(data) < len(plain)
+
+
+def test_repeated_strings_use_run_length() -> None:
+    rows = [["active"]] * 300 + [["closed"]] * 300 + [[""]] * 10
+    data, values = _roundtrip(ValueType.STRING, rows)
+    assert values == ["active"] * 300 + ["closed"] * 300 + [None] * 10
+
+    plain, _ = _roundtrip(ValueType.STRING, rows, ValueEncoding.PLAIN)
+    assert len(data) * 10 < len(plain)
+
+
+def test_high_cardinality_column_stays_plain() -> None:
+    values = [str(i) for i in range(200)]
+    assert _encoding_of(column_slice(values, _writer.VT_LONG)) == ENC_PLAIN
+
+
+def test_forced_run_length_roundtrips_distinct_values() -> None:
+    rows = [[str(i)] for i in range(10)]
+    data, values = _roundtrip(ValueType.INT, rows, ValueEncoding.RUN_LENGTH)
+    assert values == list(range(10))
+    assert bytes([ENC_RUN_LENGTH, _writer.VT_INT]) in data
+
+
+def test_run_length_keeps_signed_zero_and_nan_distinct() -> None:
+    rows = [["0.0"]] * 40 + [["-0.0"]] * 40 + [["nan"]] * 40
+    _, values = _roundtrip(ValueType.DOUBLE, rows)
+    assert [math.copysign(1, v) for v in values[:80]] == [1.0] * 40 + [-1.0] * 40
+    assert all(math.isnan(v) for v in values[80:])
+
+
+def test_forced_bit_array_on_non_bool_column_raises() -> None:
+    with pytest.raises(ValueError, match="BOOL"):
+        SbdfStreamingWriter(
+            headers=["n"],
+            column_types=[ValueType.INT],
+            encodings=[ValueEncoding.BIT_ARRAY],
+        )
+    with pytest.raises(ValueError, match="Bool"):
+        column_slice(["1"], _writer.VT_INT, ENC_BIT_ARRAY)
+
+
+def test_encodings_length_must_match_headers() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        SbdfStreamingWriter(
+            headers=["a", "b"],
+            column_types=[ValueType.INT, ValueType.INT],
+            encodings=[None],
+        )
+
+
+def test_run_length_matches_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    values = ["7"] * 600 + ["8"] * 3 + ["7"] * 5
+    expected = column_slice(values, _writer.VT_LONG)
+    assert _encoding_of(expected) == ENC_RUN_LENGTH
+    monkeypatch.setattr(_writer, "_vectorized", None)
+    assert column_slice(values, _writer.VT_LONG) == expected
+    assert _encoding_of(column_slice(["x"] * 50, VT_STRING)) == ENC_RUN_LENGTH
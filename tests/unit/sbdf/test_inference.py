@@ -0,0 +1,81 @@
+"""Unit tests for incremental type inference."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfReader,
+    TypeInferrer,
+    ValueType,
+    create_sbdf_chunks,
+    infer_types,
+)
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (["true", "False", " TRUE "], ValueType.BOOL),
+        (["1", "2", "-3"], ValueType.INT),
+        (["1", str(2**40)], ValueType.LONG),
+        (["1", str(2**70)], ValueType.DOUBLE),
+        (["1", "2.5", "nan"], ValueType.DOUBLE),
+        (["2024-01-01", "1999-12-31"], ValueType.DATE),
+        (["2024-01-01", "2024-01-01T10:00:00"], ValueType.DATETIME),
+        (["2024-01-01", "x"], ValueType.STRING),
+        (["12:34:56", "00:00:00.5"], ValueType.TIME),
+        (["12:34:56", "1.02:00:00", "-00:00:01"], ValueType.TIMESPAN),
+        (["25:00:00", "1 day, 2:00:00"], ValueType.TIMESPAN),
+        (["1.5", "12:00:00"], ValueType.STRING),
+        (["true", "2"], ValueType.STRING),
+        (["true", "yes"], ValueType.STRING),
+        (["", ""], ValueType.STRING),
+    ],
+)
+def test_infer_types_matches_lattice(values: list[str], expected: ValueType) -> None:
+    assert infer_types(([v] for v in values), 1) == [expected]
+
+
+def test_inferrer_is_incremental_across_batches() -> None:
+    inferrer = TypeInferrer(3)
+    inferrer.observe_rows([["1", "", "a"], ["2"]])
+    assert inferrer.column_types == [ValueType.INT, ValueType.STRING, ValueType.STRING]
+    inferrer.observe(["2.5", "2024-01-01", "b"])
+    assert inferrer.column_types == [
+        ValueType.DOUBLE,
+        ValueType.DATE,
+        ValueType.STRING,
+    ]
+
+
+def test_inferrer_widen_follows_lattice() -> None:
+    inferrer = TypeInferrer(4)
+    inferrer.observe(["1", "2024-01-01", "true", "1"])
+    assert inferrer.widen(0, ValueType.LONG) == ValueType.LONG
+    assert inferrer.widen(0, ValueType.INT) == ValueType.LONG
+    assert inferrer.widen(1, ValueType.DATETIME) == ValueType.DATETIME
+    assert inferrer.widen(2, ValueType.INT) == ValueType.STRING
+    assert inferrer.widen(3, ValueType.DATE) == ValueType.STRING
+
+
+def test_full_scan_catches_late_widening_row() -> None:
+    body = "\n".join(["x"] + ["1"] * 50 + ["1.5"]) + "\n"
+
+    sampled = b"".join(create_sbdf_chunks(io.StringIO(body), sample_rows=10))
+    assert SbdfReader(sampled).metadata.column_types == [ValueType.INT]
+
+    src = io.BytesIO(body.encode())
+    full = b"".join(create_sbdf_chunks(src, chunk_size=7, sample_rows=None))
+    reader = SbdfReader(full)
+    assert reader.metadata.column_types == [ValueType.DOUBLE]
+    values = [v for s in reader for v in s.columns[0].to_list()]
+    assert values == [1.0] * 50 + [1.5]
+    assert not src.closed
+
+
+def test_full_scan_requires_seekable_input() -> None:
+    with pytest.raises(ValueError, match="seekable"):
+        create_sbdf_chunks([["x"], ["1"]], sample_rows=None)
@@ -0,0 +1,88 @@
+"""Unit tests for concatenating and appending SBDF files."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfFormatError,
+    SbdfReader,
+    SbdfStreamingWriter,
+    ValueType,
+    append_sbdf,
+    concat_sbdf,
+    create_sbdf,
+)
+
+_HEADERS = ["n", "s"]
+_TYPES = [ValueType.INT, ValueType.STRING]
+
+
+def _sbdf(*batches: list[list[str]]) -> bytes:
+    writer = SbdfStreamingWriter(headers=_HEADERS, column_types=_TYPES)
+    return b"".join(writer.chunks(list(batches)))
+
+
+def _rows(data: bytes) -> list[list[Any]]:
+    return [
+        list(row)
+        for table_slice in SbdfReader(data)
+        for row in zip(*(c.to_list() for c in table_slice.columns))
+    ]
+
+
+_A = _sbdf([["1", "a"], ["2", "b"]], [["3", "c"]])
+_B = _sbdf([["4", "d"]])
+_EMPTY = _sbdf()
+
+
+def test_concat_matches_writing_all_slices_at_once() -> None:
+    sink = bytearray()
+    n = concat_sbdf([_A, io.BytesIO(_EMPTY), memoryview(_B)], sink)
+    assert n == len(sink)
+    assert bytes(sink) == _sbdf([["1", "a"], ["2", "b"]], [["3", "c"]], [["4", "d"]])
+
+
+def test_concat_streams_file_objects_in_small_blocks() -> None:
+    class Trickle(io.BytesIO):
+        def read(self, size: int | None = -1, /) -> bytes:
+            return super().read(1 if size is None or size < 0 else min(size, 2))
+
+    out = io.BytesIO()
+    concat_sbdf([Trickle(_A), Trickle(_B)], out)
+    assert _rows(out.getvalue()) == [[1, "a"], [2, "b"], [3, "c"], [4, "d"]]
+
+
+def test_concat_rejects_mismatched_or_malformed_sources() -> None:
+    other = create_sbdf(io.StringIO("n,t\n1,x\n"))
+    with pytest.raises(ValueError, match="source 1"):
+        concat_sbdf([_A, other], bytearray())
+    with pytest.raises(SbdfFormatError, match="TableEnd"):
+        concat_sbdf([_A, _B[:-1]], bytearray())
+    with pytest.raises(ValueError, match="No SBDF sources"):
+        concat_sbdf([], bytearray())
+
+
+def test_append_rewrites_only_the_table_end(tmp_path: Path) -> None:
+    path = tmp_path / "daily.sbdf"
+    path.write_bytes(_A)
+    with open(path, "r+b") as f:
+        assert append_sbdf(f, [_B, io.BytesIO(_B)]) == 2 * (len(_B) - len(_EMPTY)) + 3
+    data = path.read_bytes()
+    assert data[: len(_A) - 3] == _A[:-3]
+    assert _rows(data) == [[1, "a"], [2, "b"], [3, "c"], [4, "d"], [4, "d"]]
+
+
+def test_append_restores_target_on_failure() -> None:
+    target = io.BytesIO(_A)
+    bad = create_sbdf(io.StringIO("x\n1\n"))
+    with pytest.raises(ValueError, match="source 1"):
+        append_sbdf(target, [_B, bad])
+    assert target.getvalue() == _A
+
+    with pytest.raises(SbdfFormatError, match="TableEnd"):
+        append_sbdf(io.BytesIO(_A[:-1]), [_B])
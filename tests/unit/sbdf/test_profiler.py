@@ -0,0 +1,78 @@
+"""Unit tests for the SbdfStreamingWriter encoding profiler."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfSliceProfile,
+    SbdfStreamingWriter,
+    ValueType,
+    _writer,
+)
+
+_HEADERS = ["id", "name", "day", "flag"]
+_TYPES = [ValueType.LONG, ValueType.STRING, ValueType.DATE, ValueType.BOOL]
+_BATCHES = [
+    [[str(i), f"n{i}", "2024-01-02", "true"] for i in range(start, start + size)]
+    for start, size in [(0, 50), (50, 0), (50, 7)]
+]
+# TableSlice marker + column count, around the ColumnSlices.
+_SLICE_OVERHEAD = 3 + 4
+
+
+def _profiled(
+    workers: int | None = None,
+) -> tuple[bytes, list[SbdfSliceProfile]]:
+    profiles: list[SbdfSliceProfile] = []
+    writer = SbdfStreamingWriter(_HEADERS, _TYPES, profiler=profiles.append)
+    data = b"".join(writer.chunks(_BATCHES, workers=workers))
+    return data, profiles
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_profiler_reports_every_slice_and_column(workers: int | None) -> None:
+    data, profiles = _profiled(workers)
+    plain = b"".join(SbdfStreamingWriter(_HEADERS, _TYPES).chunks(_BATCHES))
+    assert data == plain
+
+    assert [(p.number, p.rows) for p in profiles] == [(0, 50), (1, 7)]
+    header = len(SbdfStreamingWriter(_HEADERS, _TYPES).start())
+    assert sum(p.nbytes for p in profiles) == len(data) - header - 3
+    for profile in profiles:
+        assert [c.name for c in profile.columns] == _HEADERS
+        assert [c.value_type for c in profile.columns] == _TYPES
+        assert sum(c.nbytes for c in profile.columns) == (
+            profile.nbytes - _SLICE_OVERHEAD
+        )
+        assert profile.seconds == pytest.approx(sum(c.seconds for c in profile.columns))
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_profiler_attributes_time_to_phases(
+    monkeypatch: pytest.MonkeyPatch, numpy: bool
+) -> None:
+    if not numpy:
+        monkeypatch.setattr(_writer, "_vectorized", None)
+    _, profiles = _profiled()
+    ids, names, _, _ = profiles[0].columns
+    assert ids.parse > 0 and ids.strings == 0
+    assert names.strings > 0 and names.parse == names.pack == 0
+    assert all(c.encode > 0 for c in profiles[0].columns)
+
+
+def test_profiler_covers_write_columns() -> None:
+    profiles: list[SbdfSliceProfile] = []
+    writer = SbdfStreamingWriter(_HEADERS, _TYPES, profiler=profiles.append)
+    writer.start()
+    encoded = writer.write_columns(
+        [[1, None], ["a", "b"], [date(2024, 1, 1), None], [True, False]]
+    )
+    writer.write_columns([[], [], [], []])
+    (profile,) = profiles
+    assert (profile.rows, profile.nbytes) == (2, len(encoded))
+    ids, names, _, _ = profile.columns
+    assert ids.pack > 0 and ids.strings == 0
+    assert names.strings > 0 and names.pack == 0
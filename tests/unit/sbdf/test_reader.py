@@ -0,0 +1,183 @@
+"""Unit tests for SbdfReader (SBDF decoding)."""
+
+from __future__ import annotations
+
+import io
+from datetime import date, datetime, timezone
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfFormatError,
+    SbdfReader,
+    SbdfStreamingWriter,
+    ValueType,
+    create_sbdf,
+)
+
+
+def _read_columns(reader: SbdfReader) -> list[list[Any]]:
+    columns: list[list[Any]] = [[] for _ in reader.metadata.headers]
+    for table_slice in reader:
+        for out, column in zip(columns, table_slice.columns):
+            out.extend(column.to_list())
+    return columns
+
+
+def test_reader_roundtrips_every_value_type() -> None:
+    types = [
+        ValueType.BOOL,
+        ValueType.INT,
+        ValueType.LONG,
+        ValueType.DOUBLE,
+        ValueType.DATETIME,
+        ValueType.DATE,
+        ValueType.STRING,
+    ]
+    writer = SbdfStreamingWriter(headers=[t.name for t in types], column_types=types)
+    data = b"".join(
+        writer.chunks(
+            [
+                [
+                    [
+                        "true",
+                        "1",
+                        "10000000000",
+                        "1.5",
+                        "2025-01-01T12:34:56Z",
+                        "2025-01-01",
+                        "ä",
+                    ]
+                ],
+                [["", "x", "", "", "bad", "", ""]],
+            ]
+        )
+    )
+
+    reader = SbdfReader(data)
+    assert reader.metadata.headers == [t.name for t in types]
+    assert reader.metadata.column_types == types
+    assert _read_columns(reader) == [
+        [True, None],
+        [1, None],
+        [10_000_000_000, None],
+        [1.5, None],
+        [datetime(2025, 1, 1, 12, 34, 56, tzinfo=timezone.utc), None],
+        [date(2025, 1, 1), None],
+        ["ä", None],
+    ]
+
+
+def test_reader_exposes_is_invalid_flags_and_placeholders() -> None:
+    data = create_sbdf(io.StringIO("n\n1\n\n3\n"))
+    (table_slice,) = list(SbdfReader(data))
+    column = table_slice.columns[0]
+    assert column.values == [1, 0, 3]
+    assert column.invalid == [False, True, False]
+    assert table_slice.row_count == 3
+
+
+def test_reader_without_invalid_rows_has_no_flags() -> None:
+    (table_slice,) = list(SbdfReader(create_sbdf(io.StringIO("n\n1\n2\n"))))
+    assert table_slice.columns[0].invalid is None
+
+
+def test_reader_streams_from_file_object_slice_by_slice() -> None:
+    csv_data = "n,s\n" + "".join(f"{i},v{i}\n" for i in range(10))
+    data = create_sbdf(io.StringIO(csv_data), chunk_size=4)
+
+    slices = list(SbdfReader(io.BytesIO(data)))
+    assert [s.row_count for s in slices] == [4, 4, 2]
+    assert _read_columns(SbdfReader(memoryview(data))) == [
+        list(range(10)),
+        [f"v{i}" for i in range(10)],
+    ]
+
+
+def test_reader_rejects_truncated_data() -> None:
+    data = create_sbdf(io.StringIO("n\n1\n2\n"))
+    with pytest.raises(SbdfFormatError, match="end of SBDF"):
+        list(SbdfReader(io.BytesIO(data[:-5])))
+
+
+def test_reader_rejects_non_sbdf_input() -> None:
+    with pytest.raises(SbdfFormatError, match="section marker"):
+        SbdfReader(b"PK\x03\x04 not sbdf").metadata
+
+
+def test_reader_slices_can_only_be_iterated_once() -> None:
+    reader = SbdfReader(create_sbdf(io.StringIO("n\n1\n")))
+    list(reader)
+    with pytest.raises(RuntimeError, match="once"):
+        list(reader)
+
+
+def _wide_sbdf() -> bytes:
+    types = [ValueType.INT, ValueType.STRING, ValueType.BOOL, ValueType.DOUBLE]
+    writer = SbdfStreamingWriter(headers=["n", "s", "b", "d"], column_types=types)
+    rows = [[str(i), f"s{i % 3}", "true", "" if i % 4 else "0.5"] for i in range(10)]
+    return b"".join(writer.chunks([rows[:4], rows[4:8], rows[8:]]))
+
+
+@pytest.mark.parametrize("wrap", [bytes, io.BytesIO])
+def test_reader_projects_columns_in_selection_order(wrap: Any) -> None:
+    reader = SbdfReader(wrap(_wide_sbdf()), columns=["d", 0])
+    assert reader.metadata.headers == ["d", "n"]
+    assert reader.metadata.column_types == [ValueType.DOUBLE, ValueType.INT]
+    assert _read_columns(reader) == [
+        [0.5, None, None, None] * 2 + [0.5, None],
+        list(range(10)),
+    ]
+
+
+def test_reader_skips_unselected_columns_without_decoding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from spotfire_community.sbdf import _reader
+
+    def fail(*args: Any) -> Any:
+        raise AssertionError("unselected column was decoded")
+
+    monkeypatch.setattr(_reader, "_decode_packed", fail)
+    assert _read_columns(SbdfReader(_wide_sbdf(), columns=["n"])) == [list(range(10))]
+
+
+def test_reader_skips_through_non_seekable_stream() -> None:
+    class Pipe(io.BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    reader = SbdfReader(Pipe(_wide_sbdf()), columns=["b"])
+    assert _read_columns(reader) == [[True] * 10]
+
+
+@pytest.mark.parametrize(
+    ("max_rows", "counts"), [(0, []), (3, [3]), (4, [4]), (6, [4, 2]), (99, [4, 4, 2])]
+)
+def test_reader_stops_after_max_rows(max_rows: int, counts: list[int]) -> None:
+    data = _wide_sbdf()
+    slices = list(SbdfReader(data, columns=["s", "d"], max_rows=max_rows))
+    assert [s.row_count for s in slices] == counts
+    for s in slices:
+        assert all(len(c.values) == s.row_count for c in s.columns)
+        assert all(
+            c.invalid is None or len(c.invalid) == s.row_count for c in s.columns
+        )
+
+
+def test_reader_stops_reading_at_row_limit() -> None:
+    # Data past the limit is never read, so truncated input still succeeds.
+    data = _wide_sbdf()
+    assert _read_columns(SbdfReader(data[: len(data) // 2], max_rows=2))[0] == [0, 1]
+
+
+def test_reader_rejects_bad_projection() -> None:
+    with pytest.raises(ValueError, match="no column named 'x'"):
+        SbdfReader(_wide_sbdf(), columns=["x"]).metadata
+    with pytest.raises(ValueError, match="out of range"):
+        list(SbdfReader(_wide_sbdf(), columns=[4]))
+    with pytest.raises(ValueError, match="at least one"):
+        SbdfReader(_wide_sbdf(), columns=[])
+    with pytest.raises(ValueError, match="max_rows"):
+        SbdfReader(_wide_sbdf(), max_rows=-1)
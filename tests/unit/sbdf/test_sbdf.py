@@ -6,7 +6,7 @@ import io
 
 import pytest
 
-from spotfire_community.sbdf import create_sbdf
+from spotfire_community.sbdf import SbdfReader, ValueType, create_sbdf
 
 # First two bytes of every valid SBDF file (magic number).
 _SBDF_MAGIC = b"\xdf\x5b"
@@ -33,6 +33,17 @@ def test_create_sbdf_returns_bytes_from_csv_reader() -> None:
     assert result[:2] == _SBDF_MAGIC
 
 
+def test_create_sbdf_stringifies_non_str_cells_like_csv() -> None:
+    rows: list[list[object]] = [["a", "b"], [1, None], [2, 3.5]]
+    result = create_sbdf(rows)  # type: ignore[arg-type]
+    assert result == create_sbdf(io.StringIO("a,b\n1,\n2,3.5\n"))
+
+    reader = SbdfReader(result)
+    assert reader.metadata.column_types == [ValueType.INT, ValueType.DOUBLE]
+    (table_slice,) = reader
+    assert [c.to_list() for c in table_slice.columns] == [[1, 2], [None, 3.5]]
+
+
 # ---------------------------------------------------------------------------
 # Type inference produces non-empty output for various column types
 # ---------------------------------------------------------------------------
@@ -94,3 +105,64 @@ def test_create_sbdf_many_columns() -> None:
 def test_create_sbdf_invalid_type_raises() -> None:
     with pytest.raises(TypeError):
         create_sbdf("not a valid input")  # type: ignore[arg-type]
+
+
+# ---------------------------------------------------------------------------
+# Streaming conversion
+# ---------------------------------------------------------------------------
+
+
+def test_create_sbdf_chunks_matches_create_sbdf() -> None:
+    from spotfire_community.sbdf import create_sbdf_chunks
+
+    csv_data = "n,s\n" + "".join(f"{i},v{i}\n" for i in range(25))
+    chunks = list(create_sbdf_chunks(io.StringIO(csv_data), chunk_size=10))
+    # header+metadata, three slices, end marker.
+    assert len(chunks) == 5
+    assert b"".join(chunks) == create_sbdf(io.StringIO(csv_data), chunk_size=10)
+
+
+def test_create_sbdf_chunks_reads_input_lazily() -> None:
+    from spotfire_community.sbdf import create_sbdf_chunks
+
+    consumed = 0
+
+    def rows():
+        nonlocal consumed
+        yield ["n"]
+        for i in range(1_000_000):
+            consumed += 1
+            yield [str(i)]
+
+    chunks = create_sbdf_chunks(rows(), chunk_size=100, sample_rows=50)
+    next(chunks)  # header + metadata
+    next(chunks)  # first slice
+    assert consumed <= 150
+
+
+def test_create_sbdf_chunks_leaves_binary_input_open() -> None:
+    from spotfire_community.sbdf import create_sbdf_chunks
+
+    raw = io.BytesIO("n,label\r\n1,ä\r\n".encode())
+    text_result = create_sbdf(io.StringIO("n,label\r\n1,ä\r\n"))
+    assert b"".join(create_sbdf_chunks(raw)) == text_result
+    assert not raw.closed
+
+
+def test_write_sbdf_streams_to_sink() -> None:
+    from spotfire_community.sbdf import write_sbdf
+
+    sink = io.BytesIO()
+    written = write_sbdf(io.StringIO(_SIMPLE_CSV), sink, chunk_size=2)
+    assert sink.getvalue() == create_sbdf(io.StringIO(_SIMPLE_CSV), chunk_size=2)
+    assert written == len(sink.getvalue())
+
+
+def test_create_sbdf_rejects_non_positive_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        create_sbdf(io.StringIO(_SIMPLE_CSV), chunk_size=0)
+
+
+def test_create_sbdf_without_header_raises() -> None:
+    with pytest.raises(ValueError, match="header"):
+        create_sbdf(io.StringIO(""))
@@ -0,0 +1,131 @@
+"""Unit tests for the SBDF slice offset index and random row access."""
+
+from __future__ import annotations
+
+import io
+import mmap
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfFormatError,
+    SbdfReader,
+    SbdfSliceIndex,
+    SbdfStreamingWriter,
+    ValueType,
+    concat_sbdf,
+)
+
+_TYPES = [ValueType.LONG, ValueType.STRING]
+
+
+def _indexed(workers: int | None = None) -> tuple[bytes, SbdfSliceIndex]:
+    writer = SbdfStreamingWriter(["n", "s"], _TYPES, record_index=True)
+    batches = [
+        [[str(i), f"v{i}"] for i in range(start, start + size)]
+        for start, size in [(0, 5), (5, 1), (6, 0), (6, 10), (16, 4)]
+    ]
+    data = b"".join(writer.chunks(batches, workers=workers))
+    return data, writer.slice_index
+
+
+def _values(slices: Any) -> list[int]:
+    return [v for s in slices for v in s.columns[0].to_list()]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_writer_records_slice_offsets_and_rows(workers: int | None) -> None:
+    data, index = _indexed(workers)
+    assert index.first_rows == [0, 5, 6, 16]
+    assert index.row_count == 20
+    assert index.table_end == len(data) - 3
+    assert all(data[o : o + 3] == b"\xdf\x5b\x03" for o in index.offsets)
+    assert SbdfReader(data).build_index() == index
+
+
+def test_write_columns_records_index() -> None:
+    writer = SbdfStreamingWriter(["n"], [ValueType.INT], record_index=True)
+    data = writer.start() + writer.write_columns([[1, 2]])
+    data += writer.write_columns([[]]) + writer.write_columns([[3]])
+    data += writer.finish()
+    assert writer.slice_index == SbdfReader(data).build_index()
+    assert writer.slice_index.first_rows == [0, 2]
+
+
+def test_index_round_trips_through_sidecar_bytes() -> None:
+    _, index = _indexed()
+    blob = index.to_bytes()
+    assert len(blob) == 8 + 24 + 16 * len(index.offsets)
+    assert SbdfSliceIndex.from_bytes(blob) == index
+    assert [index.locate(r) for r in (0, 4, 5, 6, 15, 16, 19)] == [0, 0, 1, 2, 2, 3, 3]
+    with pytest.raises(IndexError):
+        index.locate(20)
+    with pytest.raises(SbdfFormatError, match="truncated"):
+        SbdfSliceIndex.from_bytes(blob[:-1])
+    with pytest.raises(SbdfFormatError, match="Not an SBDF slice index"):
+        SbdfSliceIndex.from_bytes(b"PK\x03\x04")
+
+
+@pytest.mark.parametrize(
+    ("start", "stop"), [(0, 20), (3, 7), (5, 6), (6, 16), (17, None), (19, 99), (8, 8)]
+)
+def test_read_rows_returns_exact_range(start: int, stop: int | None) -> None:
+    data, index = _indexed()
+    reader = SbdfReader(io.BytesIO(data), columns=["n"])
+    expected = list(range(20))[start:stop]
+    assert _values(reader.read_rows(index, start, stop)) == expected
+    # Paging repeatedly and then scanning still works on the same reader.
+    assert _values(reader.read_rows(index, 2, 4)) == [2, 3]
+    assert _values(reader) == list(range(20))
+
+
+def test_read_rows_from_sbdf_embedded_after_other_data() -> None:
+    data, index = _indexed()
+    prefix = b"other data before the SBDF stream"
+    f = io.BytesIO(prefix + data)
+    f.seek(len(prefix))
+    reader = SbdfReader(f, columns=["n"])
+    assert reader.build_index() == index
+    assert _values(reader.read_rows(index, 3, 7)) == [3, 4, 5, 6]
+    assert _values(reader) == list(range(20))
+
+
+def test_read_rows_from_mmap(tmp_path: Path) -> None:
+    data, index = _indexed()
+    path = tmp_path / "t.sbdf"
+    path.write_bytes(data)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            reader = SbdfReader(mapped)
+            (table_slice,) = list(reader.read_rows(index, 10, 12))
+            assert table_slice.columns[1].to_list() == ["v10", "v11"]
+            del reader, table_slice  # release the buffer before closing
+
+
+def test_build_index_for_concatenated_file() -> None:
+    data, _ = _indexed()
+    out = bytearray()
+    concat_sbdf([data, data], out)
+    index = SbdfReader(bytes(out)).build_index()
+    assert index.row_count == 40
+    reader = SbdfReader(bytes(out))
+    assert _values(reader.read_rows(index, 18, 23)) == [18, 19, 0, 1, 2]
+
+
+def test_random_access_errors() -> None:
+    data, index = _indexed()
+
+    class Pipe(io.BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    with pytest.raises(ValueError, match="seekable"):
+        list(SbdfReader(Pipe(data)).read_rows(index, 0, 1))
+    with pytest.raises(ValueError, match="row range"):
+        list(SbdfReader(data).read_rows(index, 5, 2))
+    with pytest.raises(RuntimeError, match="record_index"):
+        SbdfStreamingWriter(["n"], [ValueType.INT]).slice_index
+    with pytest.raises(RuntimeError, match="finish"):
+        SbdfStreamingWriter(["n"], [ValueType.INT], record_index=True).slice_index
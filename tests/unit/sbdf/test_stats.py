@@ -0,0 +1,144 @@
+"""Unit tests for per-column statistics collected by the SBDF writer."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from spotfire_community.sbdf import (
+    SbdfColumnStats,
+    SbdfStreamingWriter,
+    ValueType,
+    _stats,
+)
+
+_TYPES = [
+    ValueType.BOOL,
+    ValueType.INT,
+    ValueType.DOUBLE,
+    ValueType.DATETIME,
+    ValueType.TIME,
+    ValueType.DECIMAL,
+    ValueType.STRING,
+    ValueType.BINARY,
+]
+_ROWS = [
+    ["true", "3", "nan", "2024-05-01T10:00:00", "12:00:00", "1.50", "b", "AP8="],
+    ["false", "x", "-1.5", "", "00:00:01", "-2", "", ""],
+    ["true", "-7", "2.25", "2023-01-01T00:00:00Z", "", "1.5", "ä", "AA=="],
+    ["", "3", "", "bad", "23:59:59", "", "a", "!"],
+]
+
+
+def _collect(
+    rows: Sequence[Sequence[str]], types: Sequence[ValueType] = _TYPES
+) -> list[SbdfColumnStats]:
+    writer = SbdfStreamingWriter(
+        [f"c{i}" for i in range(len(types))], types, collect_stats=True
+    )
+    for _ in writer.chunks([rows[:2], rows[2:]]):
+        pass
+    return writer.column_stats
+
+
+def test_stats_summarise_each_column() -> None:
+    assert _collect(_ROWS) == [
+        SbdfColumnStats(4, 1, False, True, 2),
+        SbdfColumnStats(4, 1, -7, 3, 2),
+        SbdfColumnStats(4, 1, -1.5, 2.25, 3),  # NaN counts as distinct only
+        SbdfColumnStats(
+            4,
+            2,
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 5, 1, 10, tzinfo=timezone.utc),
+            2,
+        ),
+        SbdfColumnStats(4, 1, time(0, 0, 1), time(23, 59, 59), 3),
+        # 1.50 and 1.5 are equal numbers but distinct encodings.
+        SbdfColumnStats(4, 1, Decimal(-2), Decimal("1.50"), 3),
+        SbdfColumnStats(4, 1, "a", "ä", 3),
+        SbdfColumnStats(4, 2, b"\x00", b"\x00\xff", 2),
+    ]
+
+
+def test_stats_of_empty_and_all_null_columns() -> None:
+    types = [ValueType.LONG, ValueType.STRING]
+    assert _collect([], types) == [SbdfColumnStats(0, 0, None, None, 0)] * 2
+    assert _collect([["", ""]] * 3, types) == [SbdfColumnStats(3, 3, None, None, 0)] * 2
+
+
+def test_write_columns_stats_match_text_rows() -> None:
+    types = [ValueType.LONG, ValueType.DATE, ValueType.TIMESPAN, ValueType.STRING]
+    writer = SbdfStreamingWriter(["n", "d", "t", "s"], types, collect_stats=True)
+    writer.start()
+    writer.write_columns(
+        [
+            [5, None, -(2**40)],
+            [date(2024, 2, 29), date(1999, 1, 1), None],
+            [timedelta(hours=-1), None, timedelta(days=2)],
+            ["x", None, "y"],
+        ]
+    )
+    writer.finish()
+    rows = [
+        ["5", "2024-02-29", "-01:00:00", "x"],
+        ["", "1999-01-01", "", ""],
+        [str(-(2**40)), "", "2.00:00:00", "y"],
+    ]
+    assert writer.column_stats == _collect(rows, types)
+    assert writer.column_stats[2].min == timedelta(hours=-1)
+
+
+def test_distinct_estimate_is_close_for_many_values() -> None:
+    n = 50_000
+    rows = [[str(i * 7919), f"k{i % 1234}"] for i in range(n)]
+    ints, strings = _collect(rows, [ValueType.LONG, ValueType.STRING])
+    assert abs(ints.distinct - n) / n < 0.05
+    assert abs(strings.distinct - 1234) / 1234 < 0.05
+    assert strings.min == "k0"
+    assert strings.max == "k999"
+
+
+def test_stats_match_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [[str(i % 97), str(i / 7), f"s{i % 13}"] for i in range(3000)] + _ROWS[:1]
+    types = [ValueType.INT, ValueType.FLOAT, ValueType.STRING]
+    expected = _collect(rows, types)
+    monkeypatch.setattr(_stats, "_vectorized", None)
+    assert _collect(rows, types) == expected
+
+
+def test_parallel_and_async_encoding_merge_stats() -> None:
+    batches = [_ROWS[:2], _ROWS[2:]]
+    writer = SbdfStreamingWriter(
+        [f"c{i}" for i in range(len(_TYPES))], _TYPES, collect_stats=True
+    )
+    for _ in writer.chunks(batches, workers=2):
+        pass
+    assert writer.column_stats == _collect(_ROWS)
+
+    async def source() -> AsyncIterator[Sequence[Sequence[str]]]:
+        for batch in batches:
+            yield batch
+
+    async def run() -> list[SbdfColumnStats]:
+        writer = SbdfStreamingWriter(
+            [f"c{i}" for i in range(len(_TYPES))], _TYPES, collect_stats=True
+        )
+        async for _ in writer.achunks(source()):
+            pass
+        return writer.column_stats
+
+    assert asyncio.run(run()) == _collect(_ROWS)
+
+
+def test_column_stats_errors() -> None:
+    with pytest.raises(RuntimeError, match="collect_stats"):
+        SbdfStreamingWriter(["n"], [ValueType.INT]).column_stats
+    writer = SbdfStreamingWriter(["n"], [ValueType.INT], collect_stats=True)
+    writer.start()
+    with pytest.raises(RuntimeError, match="finish"):
+        writer.column_stats
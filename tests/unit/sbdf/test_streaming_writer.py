@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import pytest
 
@@ -26,8 +30,13 @@ def test_value_type_members_distinct() -> None:
         ValueType.DATETIME,
         ValueType.DATE,
         ValueType.STRING,
+        ValueType.FLOAT,
+        ValueType.TIME,
+        ValueType.TIMESPAN,
+        ValueType.DECIMAL,
+        ValueType.BINARY,
     }
-    assert len(codes) == 7
+    assert len(codes) == 12
 
 
 def test_infer_types_matches_csv_path() -> None:
@@ -170,6 +179,50 @@ def test_parse_datetime_handles_utc_suffix_and_offsets() -> None:
     assert plus_two_ms == z_ms - 2 * 60 * 60 * 1000
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-02-29",
+        "2023-02-29",
+        "2024-01-01T23:59:59",
+        "2024-01-01 23:59:59.999",
+        "2024-01-01T23:59:59.999999Z",
+        "2024-01-01T24:00:00",
+        "2024-01-01T10:00:00+02:00",
+        "2024-01-01Z",
+        "2024-1-01",
+    ],
+)
+def test_fast_datetime_parse_matches_fromisoformat(value: str) -> None:
+    from datetime import datetime, timezone
+
+    from spotfire_community.sbdf._writer import _parse_datetime_ms
+
+    normalized = value[:-1] + "+00:00" if value.endswith("Z") else value
+    try:
+        dt = datetime.fromisoformat(normalized)
+    except ValueError:
+        expected = None
+    else:
+        dt = dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+        delta = dt - datetime(1, 1, 1, tzinfo=timezone.utc)
+        expected = (
+            delta.days * 86_400_000 + delta.seconds * 1000 + delta.microseconds // 1000
+        )
+    assert _parse_datetime_ms(value) == expected
+
+
+def test_date_parse_results_are_cached() -> None:
+    from spotfire_community.sbdf._writer import _parse_date_ms
+
+    _parse_date_ms.cache_clear()
+    for _ in range(3):
+        _parse_date_ms("2025-03-04")
+    info = _parse_date_ms.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    assert info.maxsize is not None
+
+
 def test_infer_types_falls_back_to_string_when_date_parse_fails() -> None:
     # Some values parse as dates, one does not — whole column becomes string.
     sample = [["2025-01-01"], ["not-a-date"], ["2025-06-15"]]
@@ -222,3 +275,241 @@ def test_writer_pads_short_rows_in_slice() -> None:
     # Short rows should be padded with empty strings — no exception.
     slice_bytes = writer.write_slice([["x"], ["y", "z"]])
     assert len(slice_bytes) > 0
+
+
+def test_writer_parallel_chunks_match_sequential_order() -> None:
+    types = [ValueType.LONG, ValueType.STRING, ValueType.DOUBLE]
+    batches = [
+        [[str(b * 10 + i), f"name{b}-{i}", f"{i}.5"] for i in range(10)]
+        for b in range(7)
+    ]
+    batches.insert(3, [])  # empty batches are still skipped
+
+    sequential = list(
+        SbdfStreamingWriter(headers=["a", "b", "c"], column_types=types).chunks(
+            iter(batches)
+        )
+    )
+    parallel = list(
+        SbdfStreamingWriter(headers=["a", "b", "c"], column_types=types).chunks(
+            iter(batches), workers=2, max_in_flight=3
+        )
+    )
+    assert parallel == sequential
+    assert len(parallel) == 2 + 7
+
+
+def test_writer_parallel_chunks_reject_bad_worker_counts() -> None:
+    writer = SbdfStreamingWriter(headers=["n"], column_types=[ValueType.INT])
+    with pytest.raises(ValueError, match="workers"):
+        list(writer.chunks(iter([[["1"]]]), workers=0))
+    with pytest.raises(ValueError, match="max_in_flight"):
+        list(writer.chunks(iter([[["1"]]]), workers=2, max_in_flight=0))
+
+
+def _writer() -> SbdfStreamingWriter:
+    return SbdfStreamingWriter(
+        headers=["n", "s"], column_types=[ValueType.INT, ValueType.STRING]
+    )
+
+
+_BATCHES = [[["1", "a"], ["2", "b"]], [], [["3", "c"]]]
+
+
+def test_write_slice_into_appends_to_reusable_buffer() -> None:
+    writer = _writer()
+    writer.start()
+    buffer = bytearray(b"prefix")
+    n = writer.write_slice_into(buffer, _BATCHES[0])
+    assert bytes(buffer) == b"prefix" + writer.write_slice(_BATCHES[0])
+    assert n == len(buffer) - len(b"prefix")
+    assert writer.write_slice_into(buffer, []) == 0
+
+    buffer.clear()
+    writer.write_columns_into(buffer, [[3], ["c"]])
+    assert bytes(buffer) == writer.write_columns([[3], ["c"]])
+
+
+def test_views_match_chunks_and_are_read_only() -> None:
+    views = list(_writer().views(iter(_BATCHES)))
+    assert [bytes(v) for v in views] == list(_writer().chunks(iter(_BATCHES)))
+    assert all(v.readonly for v in views)
+
+
+def test_write_to_bytearray_memoryview_file_and_socket() -> None:
+    import socket
+
+    expected = b"".join(_writer().chunks(iter(_BATCHES)))
+
+    grown = bytearray()
+    assert _writer().write_to(grown, iter(_BATCHES)) == len(expected)
+    assert grown == expected
+
+    prealloc = bytearray(len(expected) + 10)
+    n = _writer().write_to(memoryview(prealloc), iter(_BATCHES))
+    assert prealloc[:n] == expected
+
+    sink = io.BytesIO()
+    _writer().write_to(sink, iter(_BATCHES))
+    assert sink.getvalue() == expected
+
+    left, right = socket.socketpair()
+    with left, right:
+        _writer().write_to(left, iter(_BATCHES))
+        left.shutdown(socket.SHUT_WR)
+        received = bytearray()
+        while data := right.recv(4096):
+            received += data
+    assert received == expected
+
+
+def test_write_to_raises_when_memoryview_sink_is_too_small() -> None:
+    with pytest.raises(ValueError, match="does not fit"):
+        _writer().write_to(memoryview(bytearray(8)), iter(_BATCHES))
+
+
+def test_write_sbdf_fills_preallocated_buffer() -> None:
+    from spotfire_community.sbdf import write_sbdf
+
+    expected = create_sbdf(io.StringIO("n\n1\n2\n"))
+    buffer = bytearray(1024)
+    n = write_sbdf(io.StringIO("n\n1\n2\n"), memoryview(buffer))
+    assert buffer[:n] == expected
+
+
+def test_slice_sizer_tracks_bytes_per_row() -> None:
+    from spotfire_community.sbdf._writer import SliceSizer
+
+    sizer = SliceSizer(1_000, initial_rows=10, max_rows=500)
+    assert sizer.next_rows() == 10
+    sizer.observe(10, 100)
+    assert sizer.next_rows() == 100
+    sizer.observe(100, 3_000)  # rows got wider: 0.5 * 30 + 0.5 * 10
+    assert sizer.bytes_per_row == 20
+    assert sizer.next_rows() == 50
+    for _ in range(4):
+        sizer.observe(50, 0)
+    assert sizer.next_rows() == 500  # capped at max_rows
+    with pytest.raises(ValueError, match="slice_bytes"):
+        SliceSizer(0)
+
+
+@pytest.mark.parametrize(
+    ("types", "make_row"),
+    [
+        ([ValueType.INT], lambda i: [str(i)]),
+        ([ValueType.STRING], lambda i: [f"{i:08d}" * 25]),
+    ],
+)
+def test_chunks_with_slice_bytes_land_near_budget(
+    types: list[ValueType], make_row: Callable[[int], list[str]]
+) -> None:
+    from spotfire_community.sbdf import SbdfReader
+
+    rows = [make_row(i) for i in range(20_000)]
+    batches = [rows[i : i + 1_000] for i in range(0, len(rows), 1_000)]
+    writer = SbdfStreamingWriter(headers=["c"], column_types=types)
+    chunks = list(writer.chunks(iter(batches), slice_bytes=16_384))
+
+    # Past the first slice (sized from the first batch), slices hit the budget.
+    middle = chunks[2:-2]
+    assert middle and all(12_000 < len(c) <= 20_000 for c in middle)
+    reader = SbdfReader(b"".join(chunks))
+    assert [v for s in reader for v in s.columns[0].to_list()] == [
+        int(r[0]) if types[0] == ValueType.INT else r[0] for r in rows
+    ]
+
+
+def test_slice_bytes_regroups_across_batches_in_order() -> None:
+    from spotfire_community.sbdf import SbdfReader, write_sbdf
+
+    expected = [[str(i), f"s{i}"] for i in range(1_000)]
+    batches = [expected[i : i + 7] for i in range(0, 1_000, 7)]
+    batches.insert(2, [])
+
+    sink = bytearray()
+    _writer().write_to(sink, iter(batches), slice_bytes=512)
+    parallel = b"".join(_writer().chunks(iter(batches), workers=2, slice_bytes=512))
+    for data in (bytes(sink), parallel):
+        slices = list(SbdfReader(data))
+        assert len(slices) > 1 and slices[0].row_count == 7
+        assert [
+            [str(n), s]
+            for t in slices
+            for n, s in zip(t.columns[0].to_list(), t.columns[1].to_list())
+        ] == expected
+
+    csv_text = "n,s\n" + "".join(f"{n},{s}\n" for n, s in expected)
+    out = bytearray()
+    write_sbdf(io.StringIO(csv_text), out, 7, slice_bytes=512)
+    assert SbdfReader(bytes(out)).metadata.headers == ["n", "s"]
+    assert sum(t.row_count for t in SbdfReader(bytes(out))) == 1_000
+    with pytest.raises(ValueError, match="slice_bytes"):
+        write_sbdf(io.StringIO(csv_text), bytearray(), slice_bytes=0)
+    with pytest.raises(ValueError, match="slice_bytes"):
+        list(_writer().chunks(iter(batches), slice_bytes=0))
+
+
+async def _aiter_batches(
+    batches: list[list[list[str]]], log: list[str] | None = None
+) -> AsyncIterator[list[list[str]]]:
+    for i, batch in enumerate(batches):
+        await asyncio.sleep(0)
+        if log is not None:
+            log.append(f"fetch{i}")
+        yield batch
+
+
+def test_achunks_matches_chunks() -> None:
+    async def collect() -> list[bytes]:
+        return [c async for c in _writer().achunks(_aiter_batches(_BATCHES))]
+
+    assert asyncio.run(collect()) == list(_writer().chunks(iter(_BATCHES)))
+
+
+def test_achunks_fetches_next_batch_while_encoding() -> None:
+    log: list[str] = []
+
+    class LoggingExecutor(ThreadPoolExecutor):
+        def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+            log.append("encode")
+            return super().submit(fn, *args, **kwargs)
+
+    batches = [[[str(i), "x"]] for i in range(3)]
+
+    async def run() -> None:
+        with LoggingExecutor(1) as executor:
+            writer = _writer()
+            async for _ in writer.achunks(
+                _aiter_batches(batches, log), executor=executor
+            ):
+                log.append("chunk")
+
+    asyncio.run(run())
+    # Batch 1 is fetched and queued before batch 0's slice is handed out.
+    assert log[: log.index("chunk", 1) + 1] == [
+        "chunk",
+        "fetch0",
+        "encode",
+        "fetch1",
+        "encode",
+        "chunk",
+    ]
+    assert log.count("chunk") == 2 + 3
+
+
+def test_achunks_process_pool_and_errors() -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    batches = [[[str(i), f"s{i}"] for i in range(b, b + 3)] for b in range(0, 12, 3)]
+
+    async def collect(**kwargs: Any) -> bytes:
+        chunks = _writer().achunks(_aiter_batches(batches), **kwargs)
+        return b"".join([c async for c in chunks])
+
+    with ProcessPoolExecutor(2) as pool:
+        assert asyncio.run(collect(executor=pool, max_in_flight=3)) == b"".join(
+            _writer().chunks(batches)
+        )
+    with pytest.raises(ValueError, match="max_in_flight"):
+        asyncio.run(collect(max_in_flight=0))
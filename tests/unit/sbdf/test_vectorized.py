@@ -0,0 +1,72 @@
+"""Unit tests for the optional NumPy-backed SBDF column encoder."""
+
+from __future__ import annotations
+
+import pytest
+
+from spotfire_community.sbdf import _writer
+from spotfire_community.sbdf._writer import (
+    VT_BOOL,
+    VT_DATE,
+    VT_DATETIME,
+    VT_DOUBLE,
+    VT_FLOAT,
+    VT_INT,
+    VT_LONG,
+    VT_STRING,
+    VT_TIME,
+    VT_TIMESPAN,
+    column_slice,
+)
+
+pytest.importorskip("numpy")
+
+
+def _pure_python_slice(
+    monkeypatch: pytest.MonkeyPatch, values: list[str], vtype: int
+) -> bytes:
+    with monkeypatch.context() as m:
+        m.setattr(_writer, "_vectorized", None)
+        return column_slice(values, vtype)
+
+
+@pytest.mark.parametrize(
+    ("vtype", "values"),
+    [
+        (VT_INT, ["1", "-2", "2147483647", "-2147483648"]),
+        (VT_INT, ["1", "", "x", "2147483648", " 7 ", "1_000"]),
+        (VT_LONG, ["9223372036854775807", "-9223372036854775808", "0"]),
+        (VT_LONG, ["1", "9223372036854775808", "nope", ""]),
+        (VT_DOUBLE, ["1.5", "-0.0", "1e308", "inf", "nan"]),
+        (VT_DOUBLE, ["1.5", "", "abc", "2"]),
+        (VT_DATE, ["2025-01-01", "0001-01-01", "9999-12-31"]),
+        (VT_DATE, ["2025-01-01", "", "not-a-date"]),
+        (VT_DATETIME, ["2025-01-01T12:34:56Z", "2025-01-01 00:00:00.123+02:00"]),
+        (VT_DATETIME, ["2025-01-01T12:34:56", "", "bad"]),
+        (VT_BOOL, ["true", "False", "", "maybe"]),
+        (VT_STRING, ["a", "", "ü", ""]),
+        (VT_FLOAT, ["1.5", "0.1", "", "3.5e38", "1e39", "x"]),
+        (VT_TIME, ["00:00:00", "23:59:59.9999", "", "24:00:00", "10:00+01:00"]),
+        (VT_TIMESPAN, ["-1.02:03:04.5", "-1 day, 23:00:00", "", "1:60:00"]),
+    ],
+)
+def test_vectorized_matches_pure_python(
+    monkeypatch: pytest.MonkeyPatch, vtype: int, values: list[str]
+) -> None:
+    assert column_slice(values, vtype) == _pure_python_slice(monkeypatch, values, vtype)
+
+
+def test_vectorized_bit_array_spans_multiple_bytes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # 19 rows with every third one invalid exercises a partial trailing byte.
+    values = ["" if i % 3 == 0 else str(i) for i in range(19)]
+    assert column_slice(values, VT_LONG) == _pure_python_slice(
+        monkeypatch, values, VT_LONG
+    )
+
+
+def test_writer_falls_back_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_writer, "_vectorized", None)
+    out = column_slice(["1", "x"], VT_INT)
+    assert b"IsInvalid" in out
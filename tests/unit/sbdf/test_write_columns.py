@@ -0,0 +1,239 @@
+"""Unit tests for SbdfStreamingWriter.write_columns (typed columnar input)."""
+
+from __future__ import annotations
+
+import array
+import base64
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from spotfire_community.sbdf import SbdfReader, SbdfStreamingWriter, ValueType
+from spotfire_community.sbdf import _writer
+
+_ALL_TYPES = [
+    ValueType.BOOL,
+    ValueType.INT,
+    ValueType.LONG,
+    ValueType.DOUBLE,
+    ValueType.DATETIME,
+    ValueType.DATE,
+    ValueType.STRING,
+]
+
+
+def _started_writer() -> SbdfStreamingWriter:
+    writer = SbdfStreamingWriter(
+        headers=[t.name.lower() for t in _ALL_TYPES], column_types=_ALL_TYPES
+    )
+    writer.start()
+    return writer
+
+
+def test_write_columns_matches_stringified_rows() -> None:
+    rows = [
+        ["true", "1", "10000000000", "1.5", "2025-01-01T12:34:56", "2025-01-01", "a"],
+        ["false", "-2", "-3", "-0.25", "2025-06-15T00:00:00", "2025-06-15", "b"],
+    ]
+    columns = [
+        [True, False],
+        [1, -2],
+        [10_000_000_000, -3],
+        [1.5, -0.25],
+        [datetime(2025, 1, 1, 12, 34, 56), datetime(2025, 6, 15)],
+        [date(2025, 1, 1), date(2025, 6, 15)],
+        ["a", "b"],
+    ]
+    assert _started_writer().write_columns(columns) == (
+        _started_writer().write_slice(rows)
+    )
+
+
+def test_write_columns_none_matches_empty_string_nulls() -> None:
+    rows = [["", "", "", "", "", "", ""], ["true", "7", "8", "9.5", "", "", "x"]]
+    columns: list[list[object]] = [
+        [None, True],
+        [None, 7],
+        [None, 8],
+        [None, 9.5],
+        [None, None],
+        [None, None],
+        [None, "x"],
+    ]
+    assert _started_writer().write_columns(columns) == (
+        _started_writer().write_slice(rows)
+    )
+
+
+def test_write_columns_accepts_arrays_and_buffers() -> None:
+    writer = SbdfStreamingWriter(
+        headers=["i", "l", "d"],
+        column_types=[ValueType.INT, ValueType.LONG, ValueType.DOUBLE],
+    )
+    writer.start()
+    from_arrays = writer.write_columns(
+        [
+            array.array("i", [1, 2, 3]),
+            memoryview(array.array("q", [4, 5, 6])),
+            array.array("d", [0.5, 1.5, 2.5]),
+        ]
+    )
+    from_lists = writer.write_columns([[1, 2, 3], [4, 5, 6], [0.5, 1.5, 2.5]])
+    assert from_arrays == from_lists
+
+
+def test_write_columns_aware_datetime_is_converted_to_utc() -> None:
+    writer = SbdfStreamingWriter(headers=["t"], column_types=[ValueType.DATETIME])
+    writer.start()
+    plus_two = timezone(timedelta(hours=2))
+    aware = writer.write_columns([[datetime(2025, 1, 1, 14, tzinfo=plus_two)]])
+    naive = writer.write_columns([[datetime(2025, 1, 1, 12)]])
+    assert aware == naive
+
+
+def test_write_columns_marks_unconvertible_values_invalid() -> None:
+    writer = SbdfStreamingWriter(headers=["n"], column_types=[ValueType.INT])
+    writer.start()
+    assert b"IsInvalid" in writer.write_columns([[1, 2**40, "x"]])
+    assert b"IsInvalid" not in writer.write_columns([[1, 2, 3]])
+
+
+def test_write_columns_pure_python_fallback_matches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    columns: list[list[object]] = [
+        [True, None],
+        [1, 2**40],
+        [None, 3],
+        [1.5, None],
+        [datetime(2025, 1, 1), "bad"],
+        [date(2025, 1, 1), None],
+        ["a", None],
+    ]
+    expected = _started_writer().write_columns(columns)
+    monkeypatch.setattr(_writer, "_vectorized", None)
+    assert _started_writer().write_columns(columns) == expected
+
+
+_EXTENDED_TYPES = [
+    ValueType.FLOAT,
+    ValueType.TIME,
+    ValueType.TIMESPAN,
+    ValueType.DECIMAL,
+    ValueType.BINARY,
+]
+_EXTENDED_COLUMNS: list[list[Any]] = [
+    [0.1, None, -2.5],
+    [time(23, 59, 59, 999_999), time(0), None],
+    [timedelta(days=-1, hours=1), None, timedelta(microseconds=1500)],
+    [Decimal("-123.4500"), Decimal("1E+100"), None],
+    [b"\x00\xff", None, b""],
+]
+
+
+def _extended_slice(columns: list[list[Any]]) -> bytes:
+    writer = SbdfStreamingWriter(
+        headers=[t.name.lower() for t in _EXTENDED_TYPES],
+        column_types=_EXTENDED_TYPES,
+    )
+    return writer.start() + writer.write_columns(columns) + writer.finish()
+
+
+def test_write_columns_extended_types_round_trip() -> None:
+    (table_slice,) = list(SbdfReader(_extended_slice(_EXTENDED_COLUMNS)))
+    assert [c.to_list() for c in table_slice.columns] == [
+        [pytest.approx(0.1, rel=1e-7), None, -2.5],
+        [time(23, 59, 59, 999_000), time(0), None],
+        [timedelta(hours=-23), None, timedelta(milliseconds=1)],
+        [Decimal("-123.4500"), Decimal("1E+100"), None],
+        [b"\x00\xff", None, b""],
+    ]
+
+
+def test_write_columns_extended_types_match_stringified_rows() -> None:
+    rows = [
+        ["0.1", "23:59:59.999999", "-23:00:00", "-123.4500", "AP8="],
+        ["", "00:00:00", "", "1E+100", ""],
+        ["-2.5", "", "00:00:00.0015", "", base64.b64encode(b"").decode()],
+    ]
+    writer = SbdfStreamingWriter(
+        headers=[t.name.lower() for t in _EXTENDED_TYPES],
+        column_types=_EXTENDED_TYPES,
+    )
+    from_rows = writer.start() + writer.write_slice(rows) + writer.finish()
+    columns = [list(c) for c in _EXTENDED_COLUMNS]
+    columns[4][2] = None  # an empty text cell is a null, not b""
+    assert _extended_slice(columns) == from_rows
+
+
+def test_write_columns_extended_types_mark_bad_values_invalid(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    columns: list[list[Any]] = [
+        [1e39, "x", 1.0],
+        [time(1, tzinfo=timezone.utc), "01:00", time(1)],
+        [1, None, timedelta(0)],
+        [Decimal("NaN"), True, 2],
+        ["AP8=", 1, b"ok"],
+    ]
+    data = _extended_slice(columns)
+    (table_slice,) = list(SbdfReader(data))
+    assert [c.to_list()[-1] for c in table_slice.columns] == [
+        1.0,
+        time(1),
+        timedelta(0),
+        Decimal(2),
+        b"ok",
+    ]
+    assert all(c.to_list()[:2] == [None, None] for c in table_slice.columns)
+    monkeypatch.setattr(_writer, "_vectorized", None)
+    assert _extended_slice(columns) == data
+
+
+def test_write_columns_empty_columns_are_skipped() -> None:
+    writer = SbdfStreamingWriter(headers=["n"], column_types=[ValueType.INT])
+    writer.start()
+    assert writer.write_columns([[]]) == b""
+
+
+def test_write_columns_validates_shape_and_call_order() -> None:
+    writer = SbdfStreamingWriter(
+        headers=["a", "b"], column_types=[ValueType.INT, ValueType.INT]
+    )
+    with pytest.raises(RuntimeError, match="before start"):
+        writer.write_columns([[1], [2]])
+    writer.start()
+    with pytest.raises(ValueError, match="expected 2 columns"):
+        writer.write_columns([[1]])
+    with pytest.raises(ValueError, match="same length"):
+        writer.write_columns([[1, 2], [3]])
+    writer.finish()
+    with pytest.raises(RuntimeError, match="after finish"):
+        writer.write_columns([[1], [2]])
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_write_columns_rejects_values_of_the_wrong_type(
+    monkeypatch: pytest.MonkeyPatch, numpy: bool
+) -> None:
+    if not numpy:
+        monkeypatch.setattr(_writer, "_vectorized", None)
+    types = [ValueType.INT, ValueType.LONG, ValueType.BOOL]
+    writer = SbdfStreamingWriter(headers=["i", "l", "b"], column_types=types)
+    data = writer.start()
+    data += writer.write_columns(
+        [
+            [1, 2.7, True, "12", 3.0],
+            [1, 2.7, False, "12", -4.0],
+            [True, "false", "0", 1, False],
+        ]
+    )
+    data += writer.finish()
+    (table_slice,) = SbdfReader(data)
+    assert [c.to_list() for c in table_slice.columns] == [
+        [1, None, None, None, 3],
+        [1, None, None, None, -4],
+        [True, None, None, None, False],
+    ]
@@ -0,0 +1,94 @@
+"""Smoke tests for the SBDF benchmark suite."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from pathlib import Path
+
+import pytest
+
+from sbdf_benchmarks import BENCHMARKS, DATASETS, generate, run_suite
+from sbdf_benchmarks.__main__ import main
+from sbdf_benchmarks.datasets import COLUMN_TYPES, INFERRED_TYPES, to_csv
+from sbdf_benchmarks.runner import BENCHMARK_TYPES
+from spotfire_community.sbdf import (
+    SbdfReader,
+    SbdfStreamingWriter,
+    ValueType,
+    create_sbdf_chunks,
+    infer_types,
+)
+
+
+def test_generated_tables_are_deterministic_and_typed() -> None:
+    for spec in DATASETS:
+        table = generate(spec, 200, seed=1)
+        assert table == generate(spec, 200, seed=1)
+        assert table != generate(spec, 200, seed=2)
+        assert table.types == COLUMN_TYPES
+        text = generate(spec, 200, seed=1, types=INFERRED_TYPES)
+        assert infer_types(text.rows, len(INFERRED_TYPES)) == INFERRED_TYPES
+        # A column does not depend on which other columns are generated.
+        assert text.columns == [
+            table.columns[COLUMN_TYPES.index(t)] for t in INFERRED_TYPES
+        ]
+
+
+def test_every_value_type_is_encoded() -> None:
+    assert set(COLUMN_TYPES) == set(ValueType)
+    assert set(BENCHMARK_TYPES) == set(BENCHMARKS)
+    table = generate(DATASETS[0], 100)
+    writer = SbdfStreamingWriter(table.headers, table.types)
+    from_columns = writer.start() + writer.write_columns(table.columns)
+    from_columns += writer.finish()
+    writer = SbdfStreamingWriter(table.headers, table.types)
+    from_rows = b"".join(writer.chunks([table.rows]))
+    assert SbdfReader(from_rows).metadata.column_types == COLUMN_TYPES
+    assert _values(from_rows) == _values(from_columns)
+
+
+def _values(data: bytes) -> list[list[Any]]:
+    return [list(column.to_list()) for column in next(iter(SbdfReader(data))).columns]
+
+
+def test_null_ratio_is_applied() -> None:
+    spec = next(s for s in DATASETS if s.null_ratio == 0.5)
+    table = generate(spec, 2_000)
+    nulls = sum(v is None for col in table.columns for v in col)
+    assert 0.4 < nulls / (2_000 * len(COLUMN_TYPES)) < 0.6
+
+
+def test_generated_csv_round_trips_through_sbdf() -> None:
+    table = generate(DATASETS[0], 50, types=INFERRED_TYPES)
+    data = b"".join(create_sbdf_chunks(iter([table.headers, *table.rows])))
+    reader = SbdfReader(data)
+    assert reader.metadata.column_types == INFERRED_TYPES
+    assert sum(s.row_count for s in reader) == 50
+    assert to_csv(table).count(b"\n") == 51
+
+
+def test_run_suite_reports_every_case() -> None:
+    report = run_suite(50, 1, datasets=["runs"], isolate=False)
+    json.dumps(report)
+    assert {r["benchmark"] for r in report["results"]} == set(BENCHMARKS)
+    for result in report["results"]:
+        assert result["rows"] == 50
+        assert result["rows_per_sec"] > 0
+        assert result["input_bytes"] > 0
+
+
+def test_run_suite_rejects_unknown_names() -> None:
+    with pytest.raises(ValueError, match="nope"):
+        run_suite(10, 1, benchmarks=["nope"], isolate=False)
+
+
+def test_cli_writes_json(tmp_path: Path) -> None:
+    out = tmp_path / "bench.json"
+    args = ["--rows", "20", "--repeat", "1", "--benchmark", "csv_to_sbdf"]
+    assert main([*args, "--dataset", "mixed-dense", "-o", str(out)]) == 0
+    report = json.loads(out.read_text())
+    (result,) = report["results"]
+    assert result["benchmark"] == "csv_to_sbdf"
+    assert result["output_bytes"] > 0
+    assert result["peak_rss_bytes"] is None or result["peak_rss_bytes"] > 0